@@ -1,16 +1,14 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from transformacao_2d import Transform2D
 
-S = np.array([
-    [2, 0, 0],
-    [0, 0.5, 0],
-    [0, 0, 1]
-])
-ponto = np.array([2, 2, 1])
-novo_ponto = S @ ponto # Multiplicação matricial para escalar o ponto
+S = Transform2D().scale(2, 0.5) # Matriz 3x3 [[2, 0, 0], [0, 0.5, 0], [0, 0, 1]]
+ponto = np.array([[2, 2]])
+novo_ponto = S.apply(ponto) # Escala o ponto (multiplicação pela matriz, sem coordenada homogênea)
+print("Matriz de escala:\n", S.matrix)
 
-plt.scatter(ponto[0], ponto[1], color='blue', label='Original')
-plt.scatter(novo_ponto[0], novo_ponto[1], color='green', label='Escalado')
+plt.scatter(ponto[:, 0], ponto[:, 1], color='blue', label='Original')
+plt.scatter(novo_ponto[:, 0], novo_ponto[:, 1], color='green', label='Escalado')
 plt.legend()
 plt.title("Escala 2D (sx=2, sy=0.5)")
 plt.grid(True)
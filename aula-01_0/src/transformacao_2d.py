@@ -0,0 +1,108 @@
+import numpy as np
+
+
+class Transform2D:
+    """
+    Transformação 2D em coordenadas homogêneas (matriz 3x3).
+
+    Translação, rotação, escala e cisalhamento são compostos em uma única
+    matriz, na ordem em que são chamados:
+
+        Transform2D().scale(2, 2).rotate(np.pi / 4).translate(1, 0)
+
+    escala, depois rotaciona, depois translada. A matriz final é aplicada
+    a nuvens de pontos (N, 2) de uma vez, sem acrescentar a coordenada 1
+    a cada ponto.
+    """
+
+    def __init__(self, matrix=None, dtype=np.float64):
+        """
+        Inicializa a transformação.
+
+        Args:
+            matrix: Matriz 3x3 opcional. Se None, começa pela identidade.
+            dtype: Tipo dos resultados de apply(). np.float32 usa metade
+                da memória em nuvens com milhões de pontos.
+        """
+        if matrix is None:
+            self.matrix = np.eye(3)
+        else:
+            self.matrix = np.array(matrix, dtype=np.float64)
+        self.dtype = np.dtype(dtype)
+
+    def _compor(self, m):
+        """Aplica a matriz m depois da transformação atual."""
+        self.matrix = m @ self.matrix
+        return self
+
+    def translate(self, tx, ty):
+        """Translação por (tx, ty)."""
+        return self._compor(np.array([
+            [1, 0, tx],
+            [0, 1, ty],
+            [0, 0, 1]
+        ], dtype=np.float64))
+
+    def rotate(self, theta_rad):
+        """Rotação anti-horária em torno da origem."""
+        c, s = np.cos(theta_rad), np.sin(theta_rad)
+        return self._compor(np.array([
+            [c, -s, 0],
+            [s,  c, 0],
+            [0,  0, 1]
+        ], dtype=np.float64))
+
+    def scale(self, sx, sy=None):
+        """Escala em relação à origem (sy = sx se omitido)."""
+        if sy is None:
+            sy = sx
+        return self._compor(np.array([
+            [sx, 0, 0],
+            [0, sy, 0],
+            [0,  0, 1]
+        ], dtype=np.float64))
+
+    def shear(self, shx, shy=0.0):
+        """Cisalhamento: x' = x + shx*y e y' = y + shy*x."""
+        return self._compor(np.array([
+            [1, shx, 0],
+            [shy, 1, 0],
+            [0,   0, 1]
+        ], dtype=np.float64))
+
+    def apply(self, points, out=None):
+        """
+        Aplica a transformação a uma nuvem de pontos.
+
+        Em vez de transformar [x, y, 1] com a matriz 3x3, usa a parte
+        2x2 e soma a translação, o que dá o mesmo resultado.
+
+        Args:
+            points: Array (N, 2) (ou um único ponto (2,))
+            out: Array opcional (N, 2) para o resultado
+
+        Returns:
+            Pontos transformados, no dtype da transformação
+        """
+        points = np.asarray(points)
+        if out is None:
+            out = np.empty(points.shape, dtype=self.dtype)
+        linear = self.matrix[:2, :2].astype(out.dtype, copy=False)
+        np.matmul(points, linear.T, out=out, casting="same_kind")
+        out += self.matrix[:2, 2].astype(out.dtype, copy=False)
+        return out
+
+
+if __name__ == "__main__":
+    import time
+
+    n = 1_000_000
+    nuvem = np.random.default_rng(0).random((n, 2), dtype=np.float32)
+    transformacao = Transform2D(dtype=np.float32).scale(2, 0.5).rotate(np.radians(45)).translate(2, 1)
+
+    inicio = time.perf_counter()
+    resultado = transformacao.apply(nuvem)
+    duracao = time.perf_counter() - inicio
+
+    print("Matriz composta:\n", transformacao.matrix)
+    print(f"{n} pontos transformados em {duracao * 1000:.1f} ms ({resultado.nbytes / 1e6:.0f} MB, {resultado.dtype})")
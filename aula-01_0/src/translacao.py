@@ -1,16 +1,13 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from transformacao_2d import Transform2D
 
-ponto = np.array([2, 3, 1])
-T = np.array([
-    [1, 0, 2],
-    [0, 1, 1],
-    [0, 0, 1]
-])
-novo_ponto = T @ ponto
+ponto = np.array([[2, 3]])
+T = Transform2D().translate(2, 1) # Matriz 3x3 [[1, 0, 2], [0, 1, 1], [0, 0, 1]]
+novo_ponto = T.apply(ponto) # Equivale a T @ [x, y, 1], sem montar o vetor homogêneo
 
-plt.scatter(ponto[0], ponto[1], color='blue', label='Original')
-plt.scatter(novo_ponto[0], novo_ponto[1], color='red', label='Transladado')
+plt.scatter(ponto[:, 0], ponto[:, 1], color='blue', label='Original')
+plt.scatter(novo_ponto[:, 0], novo_ponto[:, 1], color='red', label='Transladado')
 plt.legend()
 plt.title("Translação 2D")
 plt.grid(True)
@@ -9,10 +9,21 @@ Este programa demonstra:
 4. Loop de renderização básico
 """
 
-import glfw
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "comum"))
+# Sem janela (--offscreen) o contexto é EGL, que precisa ser escolhido antes de importar
+# o OpenGL, e o GLFW não é usado (nem precisa estar instalado)
+if "--offscreen" in sys.argv:
+    import offscreen
+else:
+    import glfw
+
 from OpenGL.GL import *
 import numpy as np
-import sys
+from gerenciador_shaders import ErroShader, GerenciadorShaders
 
 class HelloOpenGL:
     def __init__(self, width=800, height=600, title="Minha Primeira Janela OpenGL"):
@@ -40,6 +51,7 @@ class HelloOpenGL:
         self.vao = None  # Vertex Array Object
         self.vbo = None  # Vertex Buffer Object
         self.shader_program = None
+        self.shaders = GerenciadorShaders()  # Cache dos programas (memória e disco)
 
     def init_glfw(self):
         """Inicializa GLFW e cria a janela"""
@@ -114,44 +126,13 @@ class HelloOpenGL:
         }
         """
 
-        # Compilar vertex shader
-        vertex_shader = glCreateShader(GL_VERTEX_SHADER)
-        glShaderSource(vertex_shader, vertex_shader_source)
-        glCompileShader(vertex_shader)
-
-        # Verificar erros de compilação
-        if not glGetShaderiv(vertex_shader, GL_COMPILE_STATUS):
-            error = glGetShaderInfoLog(vertex_shader).decode()
-            print(f"Erro na compilação do Vertex Shader: {error}")
-            sys.exit(1)
-
-        # Compilar fragment shader
-        fragment_shader = glCreateShader(GL_FRAGMENT_SHADER)
-        glShaderSource(fragment_shader, fragment_shader_source)
-        glCompileShader(fragment_shader)
-
-        # Verificar erros de compilação
-        if not glGetShaderiv(fragment_shader, GL_COMPILE_STATUS):
-            error = glGetShaderInfoLog(fragment_shader).decode()
-            print(f"Erro na compilação do Fragment Shader: {error}")
+        # Compilar e linkar (ou reaproveitar o binário salvo em uma execução anterior)
+        try:
+            self.shader_program = self.shaders.programa(vertex_shader_source, fragment_shader_source).id
+        except ErroShader as erro:
+            print(erro)
             sys.exit(1)
 
-        # Criar programa shader e linkar
-        self.shader_program = glCreateProgram()
-        glAttachShader(self.shader_program, vertex_shader)
-        glAttachShader(self.shader_program, fragment_shader)
-        glLinkProgram(self.shader_program)
-
-        # Verificar erros de linkagem
-        if not glGetProgramiv(self.shader_program, GL_LINK_STATUS):
-            error = glGetProgramInfoLog(self.shader_program).decode()
-            print(f"Erro na linkagem do programa: {error}")
-            sys.exit(1)
-
-        # Limpar shaders (já foram linkados ao programa)
-        glDeleteShader(vertex_shader)
-        glDeleteShader(fragment_shader)
-
         print("Shaders compilados e linkados com sucesso!")
 
     def setup_vertex_data(self):
@@ -228,27 +209,44 @@ class HelloOpenGL:
 
         self.cleanup()
 
+    def run_offscreen(self, quadros=300):
+        """Desenha `quadros` quadros sem janela e mostra os tempos (CI, benchmarks)"""
+        with offscreen.RenderizadorOffscreen(self.width, self.height) as tela:
+            self.create_shaders()
+            self.setup_vertex_data()
+            resumo = tela.executar(lambda quadro: self.render(), quadros)
+            print(offscreen.formatar_estatisticas(resumo))
+            self.cleanup()
+
     def cleanup(self):
         """Limpa recursos antes de sair"""
         if self.vao:
             glDeleteVertexArrays(1, [self.vao])
         if self.vbo:
             glDeleteBuffers(1, [self.vbo])
-        if self.shader_program:
-            glDeleteProgram(self.shader_program)
+        self.shaders.liberar()  # Apaga o programa e os shaders
 
-        glfw.terminate()
+        if self.window is not None:  # Só o modo com janela inicializa o GLFW
+            glfw.terminate()
         print("Aplicação finalizada!")
 
 def main():
     """Função principal"""
+    parser = argparse.ArgumentParser(description="Aula 1 - Primeiro Programa OpenGL")
+    parser.add_argument("--offscreen", type=int, nargs="?", const=300, metavar="QUADROS",
+                        help="Desenha QUADROS quadros sem janela e mostra os tempos")
+    args = parser.parse_args()
+
     try:
         app = HelloOpenGL(
             width=800,
             height=600,
             title="Aula 1 - Primeiro Programa OpenGL"
         )
-        app.run()
+        if args.offscreen:
+            app.run_offscreen(args.offscreen)
+        else:
+            app.run()
     except Exception as e:
         print(f"Erro durante execução: {e}")
         sys.exit(1)
@@ -0,0 +1,114 @@
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+from vetor3d import Vector3D, Vector3DArray
+
+
+def cronometrar(funcao, repeticoes=3):
+    """Retorna o melhor tempo (em segundos) de algumas execuções."""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def comparar_vetores(n=500_000):
+    """Compara o caminho objeto-a-objeto (Vector3D) com o Vector3DArray."""
+    print(f"=== Vector3D x Vector3DArray ({n} vetores) ===\n")
+
+    rng = np.random.default_rng(0)
+    dados_a = rng.standard_normal((n, 3))
+    dados_b = rng.standard_normal((n, 3))
+
+    lista_a = [Vector3D(*v) for v in dados_a]
+    lista_b = [Vector3D(*v) for v in dados_b]
+    array_a = Vector3DArray(dados_a)
+    array_b = Vector3DArray(dados_b)
+
+    casos = {
+        "soma": (lambda: [a + b for a, b in zip(lista_a, lista_b)],
+                 lambda: array_a + array_b),
+        "escala": (lambda: [a * 2.5 for a in lista_a],
+                   lambda: array_a * 2.5),
+        "dot": (lambda: [a.dot(b) for a, b in zip(lista_a, lista_b)],
+                lambda: array_a.dot(array_b)),
+        "cross": (lambda: [a.cross(b) for a, b in zip(lista_a, lista_b)],
+                  lambda: array_a.cross(array_b)),
+        "normalize": (lambda: [a.normalize() for a in lista_a],
+                      lambda: array_a.normalize()),
+        "angle_with": (lambda: [a.angle_with(b) for a, b in zip(lista_a, lista_b)],
+                       lambda: array_a.angle_with(array_b)),
+    }
+
+    print(f"{'operação':<12}{'Vector3D (s)':>14}{'Array (s)':>12}{'ganho':>10}")
+    for nome, (por_objeto, vetorizado) in casos.items():
+        t_objeto = cronometrar(por_objeto, repeticoes=1)
+        t_array = cronometrar(vetorizado)
+        print(f"{nome:<12}{t_objeto:>14.4f}{t_array:>12.4f}{t_objeto / t_array:>9.0f}x")
+
+
+class Vector3DComDict:
+    """Vector3D como era antes: atributos em __dict__ e sem operadores in-place."""
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+    def __add__(self, other):
+        return Vector3DComDict(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __mul__(self, scalar):
+        return Vector3DComDict(self.x * scalar, self.y * scalar, self.z * scalar)
+
+
+def memoria_por_instancia(classe, n=100_000):
+    """Mede (com tracemalloc) quantos bytes cada instância ocupa em média."""
+    tracemalloc.start()
+    antes = tracemalloc.take_snapshot()
+    instancias = [classe(i, i, i) for i in range(n)]
+    depois = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(s.size_diff for s in depois.compare_to(antes, "filename"))
+    # Descontar a lista e os floats, que existem nos dois casos
+    total -= sys.getsizeof(instancias) + 3 * n * sys.getsizeof(1.0)
+    return total / n
+
+
+def comparar_slots(n=200_000):
+    """Compara memória e operações por segundo antes e depois de __slots__/in-place."""
+    print(f"\n=== __dict__ x __slots__ + in-place ({n} vetores) ===\n")
+
+    print(f"Memória por instância (antes):  {memoria_por_instancia(Vector3DComDict):.0f} bytes")
+    print(f"Memória por instância (depois): {memoria_por_instancia(Vector3D):.0f} bytes")
+    print()
+
+    antigos = [Vector3DComDict(i, i, i) for i in range(n)]
+    novos = [Vector3D(i, i, i) for i in range(n)]
+
+    def soma_antiga():
+        centroide = Vector3DComDict()
+        for v in antigos:
+            centroide = centroide + v
+        return centroide * (1.0 / n)
+
+    def soma_in_place():
+        centroide = Vector3D()
+        for v in novos:
+            centroide += v
+        centroide *= 1.0 / n
+        return centroide
+
+    t_antes = cronometrar(soma_antiga)
+    t_depois = cronometrar(soma_in_place)
+    print(f"Soma de centroide (antes):  {n / t_antes:>12,.0f} ops/s")
+    print(f"Soma de centroide (depois): {n / t_depois:>12,.0f} ops/s")
+
+
+if __name__ == "__main__":
+    comparar_vetores()
+    comparar_slots()
@@ -0,0 +1,185 @@
+import ctypes
+
+import numpy as np
+from OpenGL.GL import *
+from OpenGL.GL import shaders
+
+# Vários cubos iguais desenhados com uma única chamada (desenho instanciado).
+#
+# A malha do cubo vai para a GPU uma vez (VBO + IBO). A posição de cada cópia
+# fica em outro VBO, lido uma vez por instância (glVertexAttribDivisor), e
+# todas as cópias saem de um glDrawElementsInstanced. O shader reproduz a
+# iluminação do pipeline fixo (GL_LIGHT0 e GL_COLOR_MATERIAL), então luz e
+# material continuam configurados com glLight/glMaterial.
+
+_VERTEX_SHADER = """
+#version 120
+attribute vec3 deslocamento; // Posição da instância
+varying vec4 cor;
+
+void main() {
+    vec4 posicao = gl_Vertex + vec4(deslocamento, 0.0);
+    vec3 posicao_olho = vec3(gl_ModelViewMatrix * posicao);
+    vec3 normal = normalize(gl_NormalMatrix * gl_Normal);
+
+    vec4 luz = gl_LightSource[0].position;
+    vec3 direcao = normalize(luz.w == 0.0 ? luz.xyz : luz.xyz - posicao_olho);
+    float difusa = max(dot(normal, direcao), 0.0);
+    float especular = 0.0;
+    if (difusa > 0.0) {
+        vec3 meio = normalize(direcao - normalize(posicao_olho));
+        especular = pow(max(dot(normal, meio), 0.0), gl_FrontMaterial.shininess);
+    }
+
+    // Com GL_COLOR_MATERIAL em GL_AMBIENT_AND_DIFFUSE a cor do vértice faz o papel do material
+    cor = gl_Color * (gl_LightModel.ambient + gl_LightSource[0].ambient)
+        + gl_Color * gl_LightSource[0].diffuse * difusa
+        + gl_FrontMaterial.specular * gl_LightSource[0].specular * especular;
+    cor.a = gl_Color.a;
+    gl_Position = gl_ModelViewProjectionMatrix * posicao;
+}
+"""
+
+_FRAGMENT_SHADER = """
+#version 120
+varying vec4 cor;
+
+void main() {
+    gl_FragColor = cor;
+}
+"""
+
+# Localização fixa do atributo por instância (longe da 0, que é a do gl_Vertex)
+_LOCAL_DESLOCAMENTO = 7
+
+# Faces do cubo: normal, cor e os 4 cantos (sinais de x, y, z)
+_FACES = [
+    ((0, 0, -1), (1.0, 0.0, 0.0), [(-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1)]),  # Traseira
+    ((0, 0, 1), (0.0, 1.0, 0.0), [(-1, -1, 1), (-1, 1, 1), (1, 1, 1), (1, -1, 1)]),      # Frontal
+    ((0, -1, 0), (0.0, 0.0, 1.0), [(-1, -1, -1), (-1, -1, 1), (1, -1, 1), (1, -1, -1)]),  # Inferior
+    ((0, 1, 0), (1.0, 1.0, 0.0), [(1, 1, -1), (1, 1, 1), (-1, 1, 1), (-1, 1, -1)]),      # Superior
+    ((-1, 0, 0), (1.0, 0.0, 1.0), [(-1, -1, -1), (-1, 1, -1), (-1, 1, 1), (-1, -1, 1)]),  # Esquerda
+    ((1, 0, 0), (0.0, 1.0, 1.0), [(1, -1, -1), (1, -1, 1), (1, 1, 1), (1, 1, -1)]),      # Direita
+]
+
+
+def malha_cubo(size):
+    """
+    Vértices e índices de um cubo com normal e cor por face.
+
+    Returns:
+        (vertices, indices): array (24, 9) float32 com posição, normal e cor
+        intercaladas e array uint32 com 36 índices (2 triângulos por face)
+    """
+    vertices = []
+    for normal, cor, cantos in _FACES:
+        for canto in cantos:
+            vertices.append([c * size for c in canto] + list(normal) + list(cor))
+    quads = np.arange(24, dtype=np.uint32).reshape(6, 4)
+    indices = quads[:, [0, 1, 2, 2, 3, 0]].ravel()
+    return np.array(vertices, dtype=np.float32), indices
+
+
+def grade_de_posicoes(quantidade, espacamento=1.0):
+    """Posições (quantidade, 3) em uma grade cúbica centrada na origem, para testes de carga."""
+    lado = int(np.ceil(quantidade ** (1.0 / 3.0)))
+    eixo = (np.arange(lado) - (lado - 1) / 2.0) * espacamento
+    x, y, z = np.meshgrid(eixo, eixo, eixo, indexing="ij")
+    return np.column_stack([x.ravel(), y.ravel(), z.ravel()])[:quantidade].astype(np.float32)
+
+
+def _compilar_programa():
+    programa = glCreateProgram()
+    for fonte, tipo in ((_VERTEX_SHADER, GL_VERTEX_SHADER), (_FRAGMENT_SHADER, GL_FRAGMENT_SHADER)):
+        shader = shaders.compileShader(fonte, tipo)
+        glAttachShader(programa, shader)
+        glDeleteShader(shader)
+    glBindAttribLocation(programa, _LOCAL_DESLOCAMENTO, "deslocamento")
+    glLinkProgram(programa)
+    if not glGetProgramiv(programa, GL_LINK_STATUS):
+        raise RuntimeError(f"Erro no link do programa: {glGetProgramInfoLog(programa).decode()}")
+    return programa
+
+
+class CubosInstanciados:
+    """
+    Cópias de um cubo colorido em várias posições, desenhadas de uma vez.
+
+    Sem suporte a desenho instanciado (OpenGL < 3.3), cai para uma chamada
+    glDrawElements por cubo, ainda usando a malha já enviada à GPU.
+
+    Exemplo:
+        cubos = CubosInstanciados(0.3, [[0, 0, 0], [2, 0, 0]])
+        cubos.desenhar()
+    """
+
+    def __init__(self, size, posicoes):
+        vertices, indices = malha_cubo(size)
+        self.total_indices = indices.size
+
+        self.vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+
+        self.ibo = glGenBuffers(1)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+        self.vbo_instancias = glGenBuffers(1)
+        self.instanciado = bool(glDrawElementsInstanced) and bool(glVertexAttribDivisor)
+        self.programa = _compilar_programa() if self.instanciado else None
+        self.definir_posicoes(posicoes)
+
+    def definir_posicoes(self, posicoes):
+        """Substitui as posições das instâncias (uma cópia para a GPU)."""
+        self.posicoes = np.ascontiguousarray(posicoes, dtype=np.float32).reshape(-1, 3)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo_instancias)
+        glBufferData(GL_ARRAY_BUFFER, self.posicoes.nbytes, self.posicoes, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def desenhar(self):
+        # Material definido uma vez para todos os cubos
+        glEnable(GL_COLOR_MATERIAL)
+        glColorMaterial(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE)
+        glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, (0.3, 0.3, 0.3, 1.0))
+        glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, 30.0)
+
+        stride = 9 * 4  # x, y, z, nx, ny, nz, r, g, b em float32
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, stride, ctypes.c_void_p(0))
+        glNormalPointer(GL_FLOAT, stride, ctypes.c_void_p(12))
+        glColorPointer(3, GL_FLOAT, stride, ctypes.c_void_p(24))
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+
+        if self.instanciado:
+            self._desenhar_instanciado()
+        else:
+            for x, y, z in self.posicoes.tolist():
+                glPushMatrix()
+                glTranslatef(x, y, z)
+                glDrawElements(GL_TRIANGLES, self.total_indices, GL_UNSIGNED_INT, None)
+                glPopMatrix()
+
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glDisable(GL_COLOR_MATERIAL)
+
+    def _desenhar_instanciado(self):
+        glUseProgram(self.programa)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo_instancias)
+        glEnableVertexAttribArray(_LOCAL_DESLOCAMENTO)
+        glVertexAttribPointer(_LOCAL_DESLOCAMENTO, 3, GL_FLOAT, GL_FALSE, 0, ctypes.c_void_p(0))
+        glVertexAttribDivisor(_LOCAL_DESLOCAMENTO, 1)  # Um deslocamento por instância
+
+        glDrawElementsInstanced(GL_TRIANGLES, self.total_indices, GL_UNSIGNED_INT, None, len(self.posicoes))
+
+        glVertexAttribDivisor(_LOCAL_DESLOCAMENTO, 0)
+        glDisableVertexAttribArray(_LOCAL_DESLOCAMENTO)
+        glUseProgram(0)
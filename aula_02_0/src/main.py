@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import numpy as np
 
 # Define quatro pontos de um quadrado
@@ -8,21 +10,58 @@ pontos = np.array([
     [0, 1]
 ])
 
-def rotacionar(pontos, angulo_graus):
+@lru_cache(maxsize=1024)
+def matriz_rotacao(angulo_graus):
+    """
+    Matriz de rotação 2x2 (já transposta, pronta para `pontos @ matriz`).
+
+    Fica em cache: ângulos repetidos (ex.: graus inteiros numa animação)
+    não recalculam seno e cosseno.
+    """
     angulo_rad = np.deg2rad(angulo_graus)
-    matriz_rot = np.array([
-        [np.cos(angulo_rad), -np.sin(angulo_rad)],
-        [np.sin(angulo_rad),  np.cos(angulo_rad)]
+    c, s = np.cos(angulo_rad), np.sin(angulo_rad)
+    matriz_rot_t = np.array([
+        [c, s],
+        [-s, c]
     ])
-    return pontos @ matriz_rot.T
+    matriz_rot_t.flags.writeable = False  # Compartilhada entre as chamadas
+    return matriz_rot_t
+
+def rotacionar(pontos, angulo_graus):
+    return pontos @ matriz_rotacao(angulo_graus)
 
 def transladar(pontos, deslocamento):
     return pontos + deslocamento
 
+def rotate_translate(points, angle, offset, out=None):
+    """
+    Rotaciona (ângulo em graus) e translada pontos 2D sem arrays intermediários.
+
+    Args:
+        points: Array (N, 2)
+        angle: Ângulo em graus
+        offset: Deslocamento (dx, dy)
+        out: Array (N, 2) opcional, reaproveitado entre chamadas
+
+    Returns:
+        O array `out` com os pontos transformados
+    """
+    points = np.asarray(points)
+    if out is None:
+        out = np.empty(points.shape, dtype=np.result_type(points.dtype, np.float64))
+    np.matmul(points, matriz_rotacao(angle), out=out)
+    out += offset
+    return out
+
 # Teste: rotaciona 90 graus e translada em (2, 3)
 pontos_rot = rotacionar(pontos, 90)
 pontos_final = transladar(pontos_rot, np.array([2, 3]))
 
 print("Pontos originais:\n", pontos)
 print("Após rotação de 90°:\n", pontos_rot)
-print("Após translação (2,3):\n", pontos_final)
\ No newline at end of file
+print("Após translação (2,3):\n", pontos_final)
+
+# Mesmo resultado em uma única chamada, escrevendo em um buffer já alocado
+buffer = np.empty(pontos.shape)
+rotate_translate(pontos, 90, (2, 3), out=buffer)
+print("rotate_translate(90°, (2,3)):\n", buffer)
@@ -1,18 +1,41 @@
+import argparse
+import os
 import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "comum"))
+# Sem janela (--offscreen) o contexto é EGL, que precisa ser escolhido antes de importar o OpenGL
+if "--offscreen" in sys.argv:
+    import offscreen
+
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
 
+from cubos_instanciados import CubosInstanciados, grade_de_posicoes
+from pilha_matrizes import MatrixStack, perspectiva
+
 
 class CoordinateSystem:
     """
     Classe para demonstrar diferentes sistemas de coordenadas em OpenGL.
     """
 
-    def __init__(self):
+    # Cubos em diferentes posições (sistema mundial)
+    POSICOES_PADRAO = [
+        [0.0, 0.0, 0.0],    # Origem
+        [2.0, 0.0, 0.0],    # Eixo X
+        [0.0, 2.0, 0.0],    # Eixo Y
+        [0.0, 0.0, 2.0],    # Eixo Z
+        [1.5, 1.5, 1.5]     # Diagonal
+    ]
+
+    def __init__(self, positions=None):
         self.rotation_x = 0.0
         self.rotation_y = 0.0
         self.zoom = -5.0
+        self.pilha = MatrixStack() # Pilha de matrizes calculada na CPU
+        self.positions = self.POSICOES_PADRAO if positions is None else positions
+        self.cubos = None # Criado depois do contexto OpenGL (em run)
 
     @staticmethod
     def setup_opengl():
@@ -63,57 +86,6 @@ class CoordinateSystem:
         glEnd() # Finalizar desenho de linhas
         glEnable(GL_LIGHTING) # Reativar iluminação
 
-    @staticmethod
-    def draw_cube(size=0.5):
-        """
-        Desenha um cubo colorido.
-
-        Args:
-            size: Tamanho do cubo
-        """
-        glEnable(GL_COLOR_MATERIAL) # Ativar material de cor
-        glColorMaterial(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE) # Definir material de cor
-
-        # Definir material
-        specular = [0.3, 0.3, 0.3, 1.0] # Cor especular
-        glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, specular) # Definir cor especular
-        glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, 30.0) # Brilho do material
-
-        # Definir vértices e faces do cubo
-        vertices = [
-            [-size, -size, -size], [size, -size, -size],
-            [size, size, -size], [-size, size, -size],
-            [-size, -size, size], [size, -size, size],
-            [size, size, size], [-size, size, size]
-        ]
-
-        faces = [
-            [0, 1, 2, 3],  # Face traseira
-            [4, 7, 6, 5],  # Face frontal
-            [0, 4, 5, 1],  # Face inferior
-            [2, 6, 7, 3],  # Face superior
-            [0, 3, 7, 4],  # Face esquerda
-            [1, 5, 6, 2]   # Face direita
-        ]
-
-        cores = [
-            [1.0, 0.0, 0.0],  # Vermelho
-            [0.0, 1.0, 0.0],  # Verde
-            [0.0, 0.0, 1.0],  # Azul
-            [1.0, 1.0, 0.0],  # Amarelo
-            [1.0, 0.0, 1.0],  # Magenta
-            [0.0, 1.0, 1.0]   # Ciano
-        ]
-
-        glBegin(GL_QUADS) # Iniciar desenho de quadrados
-        for i, face in enumerate(faces):
-            glColor3fv(cores[i]) # Definir cor da face
-            for vertex_idx in face:
-                glVertex3fv(vertices[vertex_idx]) # Definir vértice da face
-        glEnd() # Finalizar desenho de quadrados
-
-        glDisable(GL_COLOR_MATERIAL) # Desativar material de cor
-
     @staticmethod
     def draw_grid(size=5, divisions=10):
         """
@@ -146,40 +118,32 @@ class CoordinateSystem:
 
     def display(self):
         """Função de renderização."""
+        self.draw_scene()
+        glutSwapBuffers() # Trocar buffers para exibir a cena
+
+    def draw_scene(self):
+        """Desenha a cena no framebuffer atual (janela ou offscreen)."""
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT) # Limpar buffers
 
-        # Configurar matriz de projeção
+        # Configurar matriz de projeção (a mesma de gluPerspective, calculada uma vez e memorizada)
         glMatrixMode(GL_PROJECTION) # Mudar para matriz de projeção
-        glLoadIdentity() # Carregar matriz identidade
-        gluPerspective(45.0, 1.0, 0.1, 100.0) # Perspectiva de 45 graus gluPerspective
+        glLoadTransposeMatrixf(perspectiva(45.0, 1.0, 0.1, 100.0))
 
-        # Configurar matriz de visualização
+        # Configurar matriz de visualização na pilha da CPU
         glMatrixMode(GL_MODELVIEW) # Mudar para matriz de visualização
-        glLoadIdentity() # Carregar matriz identidade
-        glTranslatef(0.0, 0.0, self.zoom) # Aplicar zoom
-        glRotatef(self.rotation_x, 1.0, 0.0, 0.0) # Rotacionar em torno do eixo X
-        glRotatef(self.rotation_y, 0.0, 1.0, 0.0) # Rotacionar em torno do eixo Y
+        pilha = self.pilha
+        pilha.load_identity() # Carregar matriz identidade
+        pilha.translate(0.0, 0.0, self.zoom) # Aplicar zoom
+        pilha.rotate(self.rotation_x, 1.0, 0.0, 0.0) # Rotacionar em torno do eixo X
+        pilha.rotate(self.rotation_y, 0.0, 1.0, 0.0) # Rotacionar em torno do eixo Y
+        pilha.load_gl() # Uma única chamada ao OpenGL com a matriz composta
 
         # Desenhar elementos da cena
         self.draw_grid()
         self.draw_axis()
 
-        # Desenhar cubos em diferentes posições (sistema mundial)
-        positions = [
-            [0.0, 0.0, 0.0],    # Origem
-            [2.0, 0.0, 0.0],    # Eixo X
-            [0.0, 2.0, 0.0],    # Eixo Y
-            [0.0, 0.0, 2.0],    # Eixo Z
-            [1.5, 1.5, 1.5]     # Diagonal
-        ]
-
-        for pos in positions:
-            glPushMatrix() # Salvar matriz atual
-            glTranslatef(pos[0], pos[1], pos[2]) # Transladar para a posição
-            self.draw_cube(0.3) # Desenhar cubo
-            glPopMatrix() # Restaurar matriz anterior
-
-        glutSwapBuffers() # Trocar buffers para exibir a cena
+        # Desenhar todos os cubos de uma vez (malha na GPU, uma chamada instanciada)
+        self.cubos.desenhar()
 
     def keyboard(self, key, x, y):
         """Manipulação de teclado."""
@@ -223,6 +187,7 @@ class CoordinateSystem:
         glutCreateWindow(b"Sistemas de Coordenadas - CG") # Cria a janela
 
         self.setup_opengl() # Configurações iniciais do OpenGL
+        self.cubos = CubosInstanciados(0.3, self.positions) # Malha e posições enviadas uma vez
 
         glutDisplayFunc(self.display) # Função de renderização
         glutKeyboardFunc(self.keyboard) # Manipulação de teclado
@@ -234,9 +199,53 @@ class CoordinateSystem:
         print("- Page Up/Down: Zoom")
         print("- 'r': Reset camera")
         print("- ESC: Sair")
+        modo = "1 chamada instanciada" if self.cubos.instanciado else "1 chamada por cubo"
+        print(f"{len(self.positions)} cubos ({modo})")
 
         glutMainLoop() # Inicia o loop principal do GLUT
 
+    def run_offscreen(self, quadros, referencia=None):
+        """
+        Desenha a cena sem janela, girando a câmera, e mostra os tempos dos quadros.
+
+        Args:
+            quadros: Quantidade de quadros medidos
+            referencia: Arquivo .npy com a imagem esperada na câmera inicial
+                (gravado se não existir)
+
+        Returns:
+            True se não há referência ou se o quadro confere com ela
+        """
+        with offscreen.RenderizadorOffscreen(800, 600) as tela:
+            self.setup_opengl()
+            self.cubos = CubosInstanciados(0.3, self.positions)
+
+            def desenhar(quadro):
+                self.rotation_y = float(quadro % 360)
+                self.draw_scene()
+
+            resumo = tela.executar(desenhar, quadros)
+            print(f"{len(self.positions)} cubos: {offscreen.formatar_estatisticas(resumo)}")
+            if referencia is None:
+                return True
+
+            self.rotation_x = self.rotation_y = 0.0
+            self.draw_scene()
+            igual, fracao = offscreen.comparar_com_referencia(tela.ler_quadro(), referencia)
+            print(f"Referência {referencia}: {'ok' if igual else 'DIFERENTE'} ({fracao:.2%} dos pixels)")
+            return igual
+
 if __name__ == "__main__":
-    sistema = CoordinateSystem() # Cria instância do sistema de coordenadas
+    parser = argparse.ArgumentParser(description="Sistemas de coordenadas")
+    parser.add_argument("--cubos", type=int, help="Desenha N cubos em grade (teste de carga)")
+    parser.add_argument("--offscreen", type=int, nargs="?", const=300, metavar="QUADROS",
+                        help="Desenha QUADROS quadros sem janela e mostra os tempos")
+    parser.add_argument("--referencia", help="Com --offscreen: imagem .npy esperada (teste de regressão)")
+    args, resto = parser.parse_known_args()
+    sys.argv = [sys.argv[0]] + resto # O restante vai para o glutInit
+
+    positions = grade_de_posicoes(args.cubos, espacamento=0.8) if args.cubos else None
+    sistema = CoordinateSystem(positions) # Cria instância do sistema de coordenadas
+    if args.offscreen:
+        sys.exit(0 if sistema.run_offscreen(args.offscreen, args.referencia) else 1)
     sistema.run() # Executa a aplicação OpenGL
\ No newline at end of file
@@ -1,6 +1,81 @@
-import matplotlib.pyplot as plt
+from functools import lru_cache, wraps
+
 import numpy as np
 
+# Quantas matrizes de cada fábrica (translation, rotation_z, ...) ficam memorizadas
+TAMANHO_MEMO = 4096
+
+# Fatores guardados numa composição antes de multiplicá-los (veja __mul__)
+MAX_CADEIA = 8
+
+
+def _linha_afim(matriz):
+    """Indica se a última linha é [0, 0, 0, 1]."""
+    return matriz[3].tolist() == [0.0, 0.0, 0.0, 1.0]
+
+
+def _memorizar(fabrica):
+    """
+    Memoriza uma fábrica de matrizes pelos seus parâmetros.
+
+    Só a matriz (somente leitura) fica no cache: cada chamada devolve uma
+    TransformationMatrix nova que a compartilha, e `matrix` entrega uma
+    cópia própria na primeira leitura (veja TransformationMatrix.matrix).
+
+    Parâmetros que não podem ser chave do cache (arrays NumPy) vão direto
+    para a fábrica, sem memorização.
+    """
+    @lru_cache(maxsize=TAMANHO_MEMO)
+    def matriz_memorizada(*args, **kwargs):
+        matriz = fabrica(*args, **kwargs)._matriz
+        matriz.flags.writeable = False
+        # Como a matriz não muda mais, o teste de "afim" pode ficar guardado
+        return matriz, _linha_afim(matriz)
+
+    @wraps(fabrica)
+    def fabrica_memorizada(*args, **kwargs):
+        try:
+            matriz, afim = matriz_memorizada(*args, **kwargs)
+        except TypeError:
+            # Parâmetro não hasheável (array NumPy, inclusive de dimensão 0)
+            return fabrica(*args, **kwargs)
+        transformacao = TransformationMatrix.__new__(TransformationMatrix)
+        transformacao._matriz = matriz
+        transformacao._cadeia = None
+        transformacao._afim = afim
+        return transformacao
+
+    fabrica_memorizada.cache_info = matriz_memorizada.cache_info
+    fabrica_memorizada.cache_clear = matriz_memorizada.cache_clear
+    return fabrica_memorizada
+
+
+def matriz_rotacao(angle_rad, x, y, z):
+    """
+    Matriz 4x4 float32 de rotação em torno de um eixo qualquer, sem memorização.
+
+    Para ângulos que mudam a cada quadro (não adianta guardar no cache).
+
+    Args:
+        angle_rad: Ângulo em radianos
+        x, y, z: Direção do eixo (não precisa ser unitária)
+    """
+    eixo = np.array([x, y, z], dtype=np.float64)
+    eixo /= np.linalg.norm(eixo)
+    cos_a = np.cos(angle_rad)
+    sin_a = np.sin(angle_rad)
+
+    # Fórmula de Rodrigues: R = cos*I + sin*[eixo]x + (1 - cos)*eixo*eixo^T
+    antissimetrica = np.array([
+        [0, -eixo[2], eixo[1]],
+        [eixo[2], 0, -eixo[0]],
+        [-eixo[1], eixo[0], 0]
+    ])
+    matrix = np.eye(4, dtype=np.float32)
+    matrix[:3, :3] = cos_a * np.eye(3) + sin_a * antissimetrica + (1 - cos_a) * np.outer(eixo, eixo)
+    return matrix
+
+
 class TransformationMatrix:
     """
     Classe para criar e manipular matrizes de transformação 4x4.
@@ -14,9 +89,61 @@ class TransformationMatrix:
             matrix: Matriz 4x4 opcional. Se None, cria matriz identidade.
         """
         if matrix is None:
-            self.matrix = np.eye(4, dtype=np.float32)
+            self._matriz = np.eye(4, dtype=np.float32)
         else:
-            self.matrix = np.array(matrix, dtype=np.float32)
+            self._matriz = np.array(matrix, dtype=np.float32)
+        # Fatores ainda não multiplicados (composição preguiçosa)
+        self._cadeia = None
+        # Resultado guardado de is_affine() (só para matrizes somente leitura)
+        self._afim = None
+
+    @property
+    def matrix(self):
+        """Matriz 4x4. Numa composição, é calculada no primeiro acesso e guardada."""
+        if self._matriz is None:
+            self._matriz = self._compor(self._cadeia)
+            self._cadeia = None
+        elif not self._matriz.flags.writeable:
+            # Matriz compartilhada com o cache das fábricas: quem a recebe
+            # pode alterá-la no lugar, então ganha uma cópia própria
+            self._matriz = self._matriz.copy()
+            self._afim = None
+        return self._matriz
+
+    @matrix.setter
+    def matrix(self, valor):
+        self._matriz = np.array(valor, dtype=np.float32)
+        self._cadeia = None
+        self._afim = None
+
+    def _fatores(self):
+        """
+        Matrizes já calculadas que formam esta transformação.
+
+        As que ainda podem ser alteradas são copiadas: mudar um fator depois
+        de `A * B` não muda o produto (as somente leitura são compartilhadas).
+        """
+        if self._matriz is None:
+            return self._cadeia
+        if self._matriz.flags.writeable:
+            return [self._matriz.copy()]
+        return [self._matriz]
+
+    @staticmethod
+    def _compor(fatores):
+        """
+        Multiplica a cadeia de matrizes da esquerda para a direita.
+
+        Com matrizes 4x4, um np.dot por fator é o caminho mais rápido no
+        NumPy. Medido em T * R * S: multiplicar só a parte 3x4 dos fatores
+        afins levava ~42 µs por cadeia, contra ~3.5 µs com np.dot (e ~4.6 µs
+        no produto imediato antigo), porque separar os blocos custa mais que
+        a conta que economiza.
+        """
+        matriz = np.dot(fatores[0], fatores[1])
+        for fator in fatores[2:]:
+            matriz = np.dot(matriz, fator)
+        return matriz
 
     @staticmethod
     def identity():
@@ -24,6 +151,7 @@ class TransformationMatrix:
         return TransformationMatrix()
 
     @staticmethod
+    @_memorizar
     def translation(x, y, z):
         """
         Cria matriz de translação.
@@ -38,6 +166,7 @@ class TransformationMatrix:
         return TransformationMatrix(matrix)
 
     @staticmethod
+    @_memorizar
     def scale(sx, sy, sz):
         """
         Cria matriz de escala.
@@ -52,6 +181,7 @@ class TransformationMatrix:
         return TransformationMatrix(matrix)
 
     @staticmethod
+    @_memorizar
     def rotation_x(angle_rad):
         """
         Cria matriz de rotação em torno do eixo X.
@@ -70,6 +200,7 @@ class TransformationMatrix:
         return TransformationMatrix(matrix)
 
     @staticmethod
+    @_memorizar
     def rotation_y(angle_rad):
         """
         Cria matriz de rotação em torno do eixo Y.
@@ -88,6 +219,7 @@ class TransformationMatrix:
         return TransformationMatrix(matrix)
 
     @staticmethod
+    @_memorizar
     def rotation_z(angle_rad):
         """
         Cria matriz de rotação em torno do eixo Z.
@@ -105,11 +237,188 @@ class TransformationMatrix:
         matrix[1, 1] = cos_a
         return TransformationMatrix(matrix)
 
+    @staticmethod
+    @_memorizar
+    def rotation(angle_rad, x, y, z):
+        """
+        Cria matriz de rotação em torno de um eixo qualquer (como glRotatef).
+
+        Args:
+            angle_rad: Ângulo em radianos
+            x, y, z: Direção do eixo (não precisa ser unitária)
+        """
+        return TransformationMatrix(matriz_rotacao(angle_rad, x, y, z))
+
+    @staticmethod
+    @_memorizar
+    def look_at(eye_x, eye_y, eye_z, center_x, center_y, center_z, up_x, up_y, up_z):
+        """
+        Cria a matriz de visualização da câmera (mesmos parâmetros de gluLookAt).
+
+        Args:
+            eye_*: Posição da câmera
+            center_*: Ponto para onde a câmera olha
+            up_*: Vetor "para cima" da câmera
+        """
+        olho = np.array([eye_x, eye_y, eye_z], dtype=np.float64)
+        frente = np.array([center_x, center_y, center_z], dtype=np.float64) - olho
+        frente /= np.linalg.norm(frente)
+        lado = np.cross(frente, [up_x, up_y, up_z])
+        lado /= np.linalg.norm(lado)
+        cima = np.cross(lado, frente)
+
+        matrix = np.eye(4, dtype=np.float32)
+        matrix[0, :3] = lado
+        matrix[1, :3] = cima
+        matrix[2, :3] = -frente
+        matrix[:3, 3] = -matrix[:3, :3] @ olho
+        return TransformationMatrix(matrix)
+
+    @staticmethod
+    @_memorizar
+    def perspective(fovy_deg, aspect, near, far):
+        """
+        Cria matriz de projeção perspectiva (mesmos parâmetros de gluPerspective).
+
+        Args:
+            fovy_deg: Campo de visão vertical em graus
+            aspect: Razão largura/altura
+            near, far: Distâncias dos planos de recorte
+        """
+        f = 1.0 / np.tan(np.radians(fovy_deg) / 2.0)
+        matrix = np.zeros((4, 4), dtype=np.float32)
+        matrix[0, 0] = f / aspect
+        matrix[1, 1] = f
+        matrix[2, 2] = (far + near) / (near - far)
+        matrix[2, 3] = 2.0 * far * near / (near - far)
+        matrix[3, 2] = -1.0
+        return TransformationMatrix(matrix)
+
+    @staticmethod
+    @_memorizar
+    def ortho(left, right, bottom, top, near, far):
+        """Cria matriz de projeção ortográfica (mesmos parâmetros de glOrtho)."""
+        matrix = np.eye(4, dtype=np.float32)
+        matrix[0, 0] = 2.0 / (right - left)
+        matrix[1, 1] = 2.0 / (top - bottom)
+        matrix[2, 2] = -2.0 / (far - near)
+        matrix[0, 3] = -(right + left) / (right - left)
+        matrix[1, 3] = -(top + bottom) / (top - bottom)
+        matrix[2, 3] = -(far + near) / (far - near)
+        return TransformationMatrix(matrix)
+
+    # --- Fábricas vetorizadas: pilhas (N, 4, 4) de transformações ---
+
+    @staticmethod
+    def _identity_stack(n):
+        """Pilha (N, 4, 4) float32 de matrizes identidade."""
+        pilha = np.zeros((n, 4, 4), dtype=np.float32)
+        pilha[:, [0, 1, 2, 3], [0, 1, 2, 3]] = 1.0
+        return pilha
+
+    @staticmethod
+    def translations(offsets):
+        """
+        Cria N matrizes de translação de uma vez.
+
+        Args:
+            offsets: Array (N, 3) com os deslocamentos em X, Y e Z
+
+        Returns:
+            Array contíguo (N, 4, 4) float32
+        """
+        offsets = np.asarray(offsets, dtype=np.float32).reshape(-1, 3)
+        pilha = TransformationMatrix._identity_stack(len(offsets))
+        pilha[:, :3, 3] = offsets
+        return pilha
+
+    @staticmethod
+    def scales(factors):
+        """
+        Cria N matrizes de escala de uma vez.
+
+        Args:
+            factors: Array (N,) para escala uniforme ou (N, 3) para sx, sy, sz
+
+        Returns:
+            Array contíguo (N, 4, 4) float32
+        """
+        factors = np.asarray(factors, dtype=np.float32)
+        if factors.ndim == 1:
+            factors = np.repeat(factors[:, None], 3, axis=1)
+        pilha = TransformationMatrix._identity_stack(len(factors))
+        pilha[:, [0, 1, 2], [0, 1, 2]] = factors
+        return pilha
+
+    @staticmethod
+    def _rotation_stack(angles_rad, i, j):
+        """Pilha de rotações no plano dos eixos i e j (o terceiro eixo fica fixo)."""
+        angles_rad = np.asarray(angles_rad, dtype=np.float32).ravel()
+        cos_a = np.cos(angles_rad)
+        sin_a = np.sin(angles_rad)
+
+        pilha = TransformationMatrix._identity_stack(len(angles_rad))
+        pilha[:, i, i] = cos_a
+        pilha[:, i, j] = -sin_a
+        pilha[:, j, i] = sin_a
+        pilha[:, j, j] = cos_a
+        return pilha
+
+    @staticmethod
+    def rotations_x(angles_rad):
+        """Cria N matrizes de rotação em torno do eixo X, array (N, 4, 4)."""
+        return TransformationMatrix._rotation_stack(angles_rad, 1, 2)
+
+    @staticmethod
+    def rotations_y(angles_rad):
+        """Cria N matrizes de rotação em torno do eixo Y, array (N, 4, 4)."""
+        return TransformationMatrix._rotation_stack(angles_rad, 2, 0)
+
+    @staticmethod
+    def rotations_z(angles_rad):
+        """Cria N matrizes de rotação em torno do eixo Z, array (N, 4, 4)."""
+        return TransformationMatrix._rotation_stack(angles_rad, 0, 1)
+
+    @staticmethod
+    def compose(*stacks):
+        """
+        Compõe pilhas de transformações, da esquerda para a direita (como T * R * S).
+
+        Cada argumento pode ser uma pilha (N, 4, 4), uma matriz 4x4 ou uma
+        TransformationMatrix; np.matmul faz o broadcast entre eles.
+
+        Returns:
+            Array contíguo (N, 4, 4) float32
+        """
+        if not stacks:
+            raise ValueError("compose precisa de pelo menos uma transformação")
+        matrizes = [s.matrix if isinstance(s, TransformationMatrix) else np.asarray(s, dtype=np.float32)
+                    for s in stacks]
+        resultado = matrizes[0]
+        for m in matrizes[1:]:
+            resultado = np.matmul(resultado, m)
+        return np.ascontiguousarray(resultado, dtype=np.float32)
+
     def __mul__(self, other):
-        """Multiplicação de matrizes."""
+        """
+        Multiplicação de matrizes.
+
+        O produto não é calculado aqui: o resultado guarda a cadeia de
+        fatores e só a reduz a uma matriz quando `matrix` é usada. Acima de
+        MAX_CADEIA fatores a cadeia é reduzida na hora, para não crescer sem
+        limite quando `matrix` nunca é lida (como em `acc = acc * R` num laço).
+        """
         if isinstance(other, TransformationMatrix):
-            result_matrix = np.dot(self.matrix, other.matrix)
-            return TransformationMatrix(result_matrix)
+            result = TransformationMatrix.__new__(TransformationMatrix)
+            cadeia = self._fatores() + other._fatores()
+            if len(cadeia) > MAX_CADEIA:
+                result._matriz = self._compor(cadeia)
+                result._cadeia = None
+            else:
+                result._matriz = None
+                result._cadeia = cadeia
+            result._afim = None
+            return result
         else:
             raise TypeError("Operação suportada apenas entre TransformationMatrix")
 
@@ -132,6 +441,47 @@ class TransformationMatrix:
         # Retornar coordenadas cartesianas
         return transformed[:3] / transformed[3]
 
+    def is_affine(self):
+        """Indica se a última linha é [0, 0, 0, 1] (sem componente projetiva)."""
+        if self._afim is not None:
+            return self._afim
+        if self._matriz is None:
+            return all(_linha_afim(m) for m in self._cadeia)
+        return _linha_afim(self._matriz)
+
+    def transform_points(self, points, out=None):
+        """
+        Aplica a transformação a vários pontos 3D de uma vez.
+
+        Em vez de montar coordenadas homogêneas, usa a parte 3x3 da matriz
+        e soma a translação. A divisão por w só é feita quando a matriz
+        tem componente projetiva (perspectiva).
+
+        Args:
+            points: Array (N, 3) de pontos
+            out: Array (N, 3) opcional onde o resultado é escrito
+
+        Returns:
+            Array (N, 3) com os pontos transformados (o próprio `out`, se fornecido)
+        """
+        points = np.asarray(points)
+        if points.ndim != 2 or points.shape[1] != 3:
+            raise ValueError("points deve ter formato (N, 3)")
+        if out is None:
+            out = np.empty(points.shape, dtype=np.result_type(points.dtype, self.matrix.dtype))
+
+        afim = self.is_affine()
+        if not afim:
+            # w precisa ser calculado antes de escrever em `out` (que pode ser o próprio points)
+            w = points @ self.matrix[3, :3]
+            w += self.matrix[3, 3]
+
+        np.matmul(points, self.matrix[:3, :3].T, out=out)
+        out += self.matrix[:3, 3]
+        if not afim:
+            out /= w[:, None]
+        return out
+
     def __str__(self):
         """Representação em string da matriz."""
         return str(self.matrix)
@@ -139,6 +489,9 @@ class TransformationMatrix:
 # Função para visualizar transformações
 def visualizar_transformacoes():
     """Demonstra transformações aplicadas a um cubo."""
+    # Importado aqui para que a classe possa ser usada sem o matplotlib (ex.: nos programas OpenGL)
+    import matplotlib.pyplot as plt
+
     print("=== Demonstração de Transformações Matriciais ===\n")
 
     # Definir vértices de um cubo unitário
@@ -171,9 +524,7 @@ def visualizar_transformacoes():
         ax = fig.add_subplot(2, 3, i+1, projection='3d')
 
         # Aplicar transformação aos vértices
-        vertices_transformados = np.array([
-            transformacao.transform_point(v) for v in vertices_cubo
-        ])
+        vertices_transformados = transformacao.transform_points(vertices_cubo)
 
         # Plotar os vértices
         ax.scatter(vertices_transformados[:, 0],
@@ -7,8 +7,13 @@ class Vector3D:
     Classe para representar e manipular vetores 3D em computação gráfica.
     Suporta operações básicas como soma, subtração, multiplicação por escalar,
     cálculo de magnitude, normalização, produto escalar e produto vetorial.
+
+    Usa __slots__ (sem __dict__ por instância) e oferece operadores in-place
+    (+=, -=, *=, normalize_) que alteram o próprio vetor sem criar outro.
     """
 
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x=0.0, y=0.0, z=0.0):
         """
         Inicializa um vetor 3D.
@@ -32,6 +37,27 @@ class Vector3D:
         """Multiplicação por escalar."""
         return Vector3D(self.x * scalar, self.y * scalar, self.z * scalar)
 
+    def __iadd__(self, other):
+        """Soma in-place (v += w), sem criar um novo vetor."""
+        self.x += other.x
+        self.y += other.y
+        self.z += other.z
+        return self
+
+    def __isub__(self, other):
+        """Subtração in-place (v -= w)."""
+        self.x -= other.x
+        self.y -= other.y
+        self.z -= other.z
+        return self
+
+    def __imul__(self, scalar):
+        """Multiplicação por escalar in-place (v *= k)."""
+        self.x *= scalar
+        self.y *= scalar
+        self.z *= scalar
+        return self
+
     def __str__(self):
         """Representação em string."""
         return f"Vector3D({self.x:.2f}, {self.y:.2f}, {self.z:.2f})"
@@ -47,6 +73,15 @@ class Vector3D:
             return Vector3D(0, 0, 0)
         return Vector3D(self.x/mag, self.y/mag, self.z/mag)
 
+    def normalize_(self):
+        """Normaliza o próprio vetor (in-place). Vetor nulo continua nulo."""
+        mag = self.magnitude()
+        if mag != 0:
+            self.x /= mag
+            self.y /= mag
+            self.z /= mag
+        return self
+
     def dot(self, other):
         """Produto escalar (dot product)."""
         return self.x * other.x + self.y * other.y + self.z * other.z
@@ -74,6 +109,195 @@ class Vector3D:
         """Converte para array NumPy."""
         return np.array([self.x, self.y, self.z])
 
+
+class Vector3DView(Vector3D):
+    """
+    Vector3D que é uma "janela" para uma linha de um Vector3DArray.
+    Ler ou escrever x, y e z lê ou escreve diretamente no buffer do array,
+    sem cópia. As operações (soma, produto vetorial, ...) retornam Vector3D comuns;
+    os operadores in-place escrevem no buffer.
+    """
+
+    __slots__ = ("_dados", "_indice")
+
+    def __init__(self, dados, indice):
+        """
+        Args:
+            dados: Buffer NumPy (N, 3) do Vector3DArray
+            indice: Linha do buffer representada por esta view
+        """
+        self._dados = dados
+        self._indice = indice
+
+    @property
+    def x(self):
+        return float(self._dados[self._indice, 0])
+
+    @x.setter
+    def x(self, valor):
+        self._dados[self._indice, 0] = valor
+
+    @property
+    def y(self):
+        return float(self._dados[self._indice, 1])
+
+    @y.setter
+    def y(self, valor):
+        self._dados[self._indice, 1] = valor
+
+    @property
+    def z(self):
+        return float(self._dados[self._indice, 2])
+
+    @z.setter
+    def z(self, valor):
+        self._dados[self._indice, 2] = valor
+
+    def to_numpy(self):
+        """Retorna a linha do buffer (view, sem cópia)."""
+        return self._dados[self._indice]
+
+
+class Vector3DArray:
+    """
+    Conjunto de N vetores 3D guardados em um único array NumPy (N, 3)
+    ("structure of arrays"). Cada operação é feita de uma vez sobre todos
+    os vetores, sem criar um objeto Python por vetor.
+    """
+
+    def __init__(self, dados, dtype=np.float64):
+        """
+        Inicializa o array de vetores.
+
+        Args:
+            dados: Qualquer coisa convertível para um array (N, 3)
+            dtype: np.float32 ou np.float64
+        """
+        self.dados = np.ascontiguousarray(dados, dtype=dtype).reshape(-1, 3)
+
+    @staticmethod
+    def zeros(n, dtype=np.float64):
+        """Cria N vetores nulos."""
+        return Vector3DArray(np.zeros((n, 3), dtype=dtype), dtype=dtype)
+
+    @staticmethod
+    def from_vectors(vetores, dtype=np.float64):
+        """Cria o array a partir de uma sequência de Vector3D."""
+        return Vector3DArray([(v.x, v.y, v.z) for v in vetores], dtype=dtype)
+
+    @property
+    def dtype(self):
+        return self.dados.dtype
+
+    def __len__(self):
+        return self.dados.shape[0]
+
+    def __getitem__(self, indice):
+        """Um índice inteiro retorna uma view Vector3D; fatias retornam Vector3DArray."""
+        if isinstance(indice, (int, np.integer)):
+            if indice < 0:
+                indice += len(self)
+            if not 0 <= indice < len(self):
+                raise IndexError("Índice fora do intervalo")
+            return Vector3DView(self.dados, indice)
+        return self._novo(self.dados[indice])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield Vector3DView(self.dados, i)
+
+    def _novo(self, dados):
+        """Embrulha um array (N, 3) já pronto, sem cópia."""
+        resultado = Vector3DArray.__new__(Vector3DArray)
+        resultado.dados = dados
+        return resultado
+
+    def _operando(self, other):
+        """Converte o outro operando para algo que faça broadcast com (N, 3)."""
+        if isinstance(other, Vector3DArray):
+            return other.dados
+        if isinstance(other, Vector3D):
+            return np.array([other.x, other.y, other.z], dtype=self.dtype)
+        return np.asarray(other, dtype=self.dtype)
+
+    def _escalar(self, scalar):
+        """Escalares passam direto; arrays (N,) viram (N, 1) para escalar cada vetor."""
+        scalar = np.asarray(scalar, dtype=self.dtype)
+        return scalar[:, None] if scalar.ndim == 1 else scalar
+
+    def __add__(self, other):
+        """Soma de vetores (elemento a elemento ou com um único Vector3D)."""
+        return self._novo(np.add(self.dados, self._operando(other)))
+
+    def __sub__(self, other):
+        """Subtração de vetores."""
+        return self._novo(np.subtract(self.dados, self._operando(other)))
+
+    def __mul__(self, scalar):
+        """Multiplicação por escalar ou por um array (N,) de escalares."""
+        return self._novo(np.multiply(self.dados, self._escalar(scalar)))
+
+    __rmul__ = __mul__
+
+    def __iadd__(self, other):
+        np.add(self.dados, self._operando(other), out=self.dados)
+        return self
+
+    def __isub__(self, other):
+        np.subtract(self.dados, self._operando(other), out=self.dados)
+        return self
+
+    def __imul__(self, scalar):
+        np.multiply(self.dados, self._escalar(scalar), out=self.dados)
+        return self
+
+    def __str__(self):
+        return f"Vector3DArray(n={len(self)}, dtype={self.dtype})"
+
+    def magnitude(self):
+        """Magnitude de cada vetor, array (N,)."""
+        return np.sqrt(np.einsum("ij,ij->i", self.dados, self.dados))
+
+    def normalize(self):
+        """Retorna os vetores normalizados. Vetores nulos continuam nulos."""
+        mag = self.magnitude()[:, None]
+        resultado = np.zeros_like(self.dados)
+        np.divide(self.dados, mag, out=resultado, where=mag != 0)
+        return self._novo(resultado)
+
+    def dot(self, other):
+        """Produto escalar de cada par de vetores, array (N,)."""
+        outro = self._operando(other)
+        if outro.ndim == 1:
+            return self.dados @ outro
+        return np.einsum("ij,ij->i", self.dados, outro)
+
+    def cross(self, other):
+        """Produto vetorial de cada par de vetores."""
+        a = self.dados
+        b = np.broadcast_to(self._operando(other), a.shape)
+        resultado = np.empty_like(a)
+        resultado[:, 0] = a[:, 1] * b[:, 2] - a[:, 2] * b[:, 1]
+        resultado[:, 1] = a[:, 2] * b[:, 0] - a[:, 0] * b[:, 2]
+        resultado[:, 2] = a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+        return self._novo(resultado)
+
+    def angle_with(self, other):
+        """Ângulo (em radianos) entre cada par de vetores; 0 se algum for nulo."""
+        outro = self._operando(other)
+        mag_outro = np.sqrt(np.sum(outro * outro, axis=-1))
+        mags = self.magnitude() * mag_outro
+        cos_angle = np.zeros_like(mags)
+        np.divide(self.dot(other), mags, out=cos_angle, where=mags != 0)
+        # Garantir que o valor esteja no domínio de arccos
+        angulos = np.arccos(np.clip(cos_angle, -1.0, 1.0))
+        angulos[mags == 0] = 0.0
+        return angulos
+
+    def to_numpy(self):
+        """Retorna o buffer (N, 3) interno (sem cópia)."""
+        return self.dados
+
 # Exemplo de uso da classe Vector3D
 def demonstrar_operacoes_vetoriais():
     """Demonstra as operações básicas com vetores."""
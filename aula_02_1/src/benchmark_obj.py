@@ -0,0 +1,98 @@
+"""
+Compara o leitor de OBJ em blocos (leitor_obj.ler_obj) com a leitura linha a
+linha em listas Python que o cubo.py usava antes.
+
+Gera um OBJ sintético (uma grade de quads com vt/vn, alguns índices
+negativos e dois materiais) com alguns milhões de linhas e mede tempo e pico
+de memória de cada leitor.
+
+Uso:
+    python benchmark_obj.py              # grade 1000 x 1000 (~3 milhões de linhas)
+    python benchmark_obj.py --lado 300
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from leitor_obj import ler_obj
+
+
+def gerar_obj(caminho, lado):
+    """Escreve uma grade lado x lado de vértices com quads v/vt/vn."""
+    u, v = np.meshgrid(np.linspace(0, 1, lado), np.linspace(0, 1, lado))
+    u, v = u.ravel(), v.ravel()
+    posicoes = np.column_stack([u * 10, np.sin(u * 6) * np.cos(v * 6), v * 10])
+
+    ids = np.arange(lado * lado).reshape(lado, lado) + 1
+    quads = np.stack([ids[:-1, :-1], ids[:-1, 1:], ids[1:, 1:], ids[1:, :-1]], axis=-1).reshape(-1, 4)
+    metade = len(quads) // 2
+
+    with open(caminho, "w") as f:
+        f.write("mtllib sintetico.mtl\n")
+        np.savetxt(f, posicoes, fmt="v %.6f %.6f %.6f")
+        np.savetxt(f, np.column_stack([u, v]), fmt="vt %.6f %.6f")
+        f.write("vn 0 1 0\n")
+        for nome, bloco in (("verde", quads[:metade]), ("laranja", quads[metade:])):
+            f.write(f"usemtl {nome}\n")
+            cantos = np.stack([bloco, bloco, np.ones_like(bloco)], axis=-1).reshape(len(bloco), -1)
+            np.savetxt(f, cantos, fmt="f " + " ".join(["%d/%d/%d"] * 4))
+        # Índices relativos: o último quad repetido com -1 = último vértice
+        f.write("f -1/-1/-1 -2/-2/-1 -3/-3/-1\n")
+
+
+def ler_obj_listas(caminho):
+    """Leitura linha a linha em listas Python (como o cubo.py fazia)."""
+    vertices = []
+    faces = []
+    with open(caminho, "r") as arquivo:
+        for linha in arquivo:
+            if linha.startswith("v "):
+                partes = linha.split()
+                vertices.append([float(partes[1]), float(partes[2]), float(partes[3])])
+            elif linha.startswith("f "):
+                faces.append([int(p.split("/")[0]) - 1 for p in linha.split()[1:]])
+    return vertices, faces
+
+
+def medir(funcao, caminho):
+    """Tempo de uma leitura e pico de memória (medido em outra leitura, pois o tracemalloc a deixa mais lenta)."""
+    inicio = time.perf_counter()
+    resultado = funcao(caminho)
+    segundos = time.perf_counter() - inicio
+
+    tracemalloc.start()
+    funcao(caminho)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, segundos, pico
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do leitor de OBJ")
+    parser.add_argument("--lado", type=int, default=1000, help="Vértices por lado da grade")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "sintetico.obj")
+        gerar_obj(caminho, args.lado)
+        with open(caminho) as f:
+            linhas = sum(1 for _ in f)
+        print(f"{caminho}: {linhas} linhas, {os.path.getsize(caminho) / 2**20:.1f} MiB\n")
+
+        (vertices, faces), t_listas, m_listas = medir(ler_obj_listas, caminho)
+        malha, t_numpy, m_numpy = medir(ler_obj, caminho)
+
+    assert len(vertices) == len(malha.posicoes) and len(faces) == len(malha.tamanhos)
+    print(f"{'leitor':<22}{'tempo (s)':>12}{'pico (MiB)':>14}")
+    print(f"{'listas Python':<22}{t_listas:>12.2f}{m_listas / 2**20:>14.1f}")
+    print(f"{'ler_obj (blocos)':<22}{t_numpy:>12.2f}{m_numpy / 2**20:>14.1f}")
+    print(f"\n{malha}")
+    print(f"Speedup: {t_listas / t_numpy:.1f}x, memória: {m_listas / m_numpy:.1f}x menor")
+
+
+if __name__ == "__main__":
+    main()
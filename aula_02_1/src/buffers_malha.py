@@ -0,0 +1,128 @@
+import numpy as np
+
+from triangulacao import arestas_das_faces, triangular_faces
+
+# Arrays prontos para a GPU, calculados uma vez a partir de uma MalhaOBJ.
+#
+# No OBJ cada canto de face escolhe uma posição e uma normal separadamente;
+# no OpenGL cada vértice do buffer tem as duas juntas. Por isso os vértices
+# de desenho são os pares (posição, normal) distintos usados pelas faces.
+# Os triângulos são agrupados por material, cada grupo em um intervalo
+# contínuo do buffer de índices, para desenhar um material por chamada.
+
+
+def normais_das_faces(posicoes, indices, tamanhos):
+    """
+    Normal (unitária) de cada face pelo método de Newell.
+
+    Args:
+        posicoes: Array (N, 3)
+        indices: Índices das faces em sequência
+        tamanhos: Número de vértices de cada face
+
+    Returns:
+        Array (F, 3) float32
+    """
+    tamanhos = np.asarray(tamanhos, dtype=np.int64)
+    if len(tamanhos) == 0:
+        return np.empty((0, 3), dtype=np.float32)
+    inicios = np.concatenate(([0], np.cumsum(tamanhos)[:-1]))
+    # Próximo canto de cada canto, voltando ao primeiro no fim da face
+    proximos = np.arange(1, len(indices) + 1)
+    proximos[inicios + tamanhos - 1] = inicios
+
+    pontos = np.asarray(posicoes, dtype=np.float64)[indices]
+    normais = np.add.reduceat(np.cross(pontos, pontos[proximos]), inicios)
+    comprimentos = np.linalg.norm(normais, axis=1, keepdims=True)
+    return (normais / np.where(comprimentos > 0, comprimentos, 1)).astype(np.float32)
+
+
+def vertices_de_desenho(malha):
+    """
+    Monta os vértices (posição + normal) usados pelas faces da malha.
+
+    Cantos sem `vn` usam a normal da face (sombreamento plano).
+
+    Returns:
+        (vertices, indices): array (R, 6) float32 intercalado (x, y, z, nx, ny, nz)
+        e o índice do vértice de desenho de cada canto (uint32)
+    """
+    tamanhos = np.asarray(malha.tamanhos, dtype=np.int64)
+    indices_v = np.asarray(malha.indices_v, dtype=np.int64)
+    indices_vn = np.asarray(malha.indices_vn, dtype=np.int64)
+
+    # Cantos sem vn recebem uma normal "virtual" por face, depois das normais do arquivo
+    sem_normal = indices_vn < 0
+    normais = np.asarray(malha.normais, dtype=np.float32)
+    if sem_normal.any():
+        face_do_canto = np.repeat(np.arange(len(tamanhos)), tamanhos)
+        indices_vn = np.where(sem_normal, len(normais) + face_do_canto, indices_vn)
+        normais = np.concatenate([normais, normais_das_faces(malha.posicoes, indices_v, tamanhos)])
+
+    # Pares (posição, normal) distintos, comparados como uma chave de 64 bits
+    chaves = (indices_v << 32) | indices_vn
+    unicas, indices = np.unique(chaves, return_inverse=True)
+
+    vertices = np.empty((len(unicas), 6), dtype=np.float32)
+    vertices[:, :3] = np.asarray(malha.posicoes)[unicas >> 32]
+    vertices[:, 3:] = normais[unicas & 0xFFFFFFFF]
+    return vertices, indices.astype(np.uint32)
+
+
+def triangular_por_material(vertices, indices, tamanhos, materiais_faces):
+    """
+    Triangula as faces agrupando os triângulos por material.
+
+    Returns:
+        (triangulos, grupos): array uint32 plano e array (G, 3) int64 com
+        (material, primeiro índice, quantidade de índices) de cada grupo
+    """
+    tamanhos = np.asarray(tamanhos, dtype=np.int64)
+    materiais_faces = np.asarray(materiais_faces)
+
+    # Ordenação estável dos cantos pelo material da face: os cantos de cada
+    # face continuam juntos e na mesma ordem
+    material_do_canto = np.repeat(materiais_faces, tamanhos)
+    indices = np.asarray(indices)[np.argsort(material_do_canto, kind="stable")]
+    ordem_faces = np.argsort(materiais_faces, kind="stable")
+    materiais_ordenados = materiais_faces[ordem_faces]
+    tamanhos = tamanhos[ordem_faces]
+
+    materiais, primeira_face, total_faces = np.unique(materiais_ordenados, return_index=True,
+                                                      return_counts=True)
+    inicios = np.concatenate(([0], np.cumsum(tamanhos)))
+
+    partes = []
+    grupos = []
+    inicio_grupo = 0
+    for material, primeira, total in zip(materiais.tolist(), primeira_face.tolist(), total_faces.tolist()):
+        cantos = slice(inicios[primeira], inicios[primeira + total])
+        triangulos = triangular_faces(vertices, indices[cantos], tamanhos[primeira:primeira + total])
+        if triangulos.size == 0:
+            continue
+        partes.append(triangulos)
+        grupos.append((material, inicio_grupo, triangulos.size))
+        inicio_grupo += triangulos.size
+
+    triangulos = np.concatenate(partes) if partes else np.empty(0, dtype=np.uint32)
+    return triangulos, np.array(grupos, dtype=np.int64).reshape(-1, 3)
+
+
+def preparar_buffers(malha):
+    """
+    Calcula os arrays que o visualizador envia para a GPU.
+
+    Returns:
+        dict com:
+            vertices: (R, 6) float32, posição e normal intercaladas
+            triangulos: índices em `vertices`, agrupados por material (uint32)
+            grupos: (G, 3) com (material, primeiro índice, quantidade) em `triangulos`
+            arestas: (E, 2) índices em `malha.posicoes` para o wireframe (uint32)
+    """
+    vertices, indices = vertices_de_desenho(malha)
+    triangulos, grupos = triangular_por_material(vertices[:, :3], indices, malha.tamanhos,
+                                                 malha.materiais_faces)
+    # O wireframe usa só as posições, para que arestas de vértices com normais
+    # diferentes (quinas) não sejam desenhadas duas vezes
+    arestas = arestas_das_faces(malha.indices_v, malha.tamanhos)
+    return {"vertices": vertices, "triangulos": triangulos, "grupos": grupos, "arestas": arestas}
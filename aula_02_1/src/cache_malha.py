@@ -0,0 +1,172 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from leitor_obj import MalhaOBJ, ler_obj
+from buffers_malha import preparar_buffers
+
+# Cache binário de OBJs ao lado do arquivo original.
+#
+# Depois da primeira leitura, os arrays da malha (e os buffers de desenho de
+# buffers_malha, que também custam caro em modelos grandes) são gravados como
+# .npy em uma pasta "<arquivo>.obj.cache", junto com um cabecalho.json que
+# identifica o OBJ de origem (caminho, tamanho, mtime e hash do conteúdo).
+# Nas próximas execuções os arrays são abertos com memory-map em vez de o
+# texto ser lido e triangulado de novo.
+#
+# O cache é descartado automaticamente quando o OBJ (ou uma dependência, como
+# o .mtl) muda: tamanho e mtime iguais valem como acerto sem ler o arquivo;
+# se só o mtime mudou (ex.: arquivo copiado), o hash do conteúdo decide.
+# VERSAO_CACHE deve mudar quando o conteúdo gravado mudar.
+
+VERSAO_CACHE = 2
+_CABECALHO = "cabecalho.json"
+_ARRAYS_MALHA = ("posicoes", "texcoords", "normais", "indices_v", "indices_vt",
+                 "indices_vn", "tamanhos", "materiais_faces")
+_ARRAYS_BUFFERS = ("vertices", "triangulos", "grupos", "arestas")
+
+
+def pasta_cache(caminho):
+    """Pasta do cache de um OBJ."""
+    return caminho + ".cache"
+
+
+def hash_arquivo(caminho, tamanho_bloco=2**20):
+    """Hash (BLAKE2b) do conteúdo de um arquivo."""
+    h = hashlib.blake2b(digest_size=20)
+    with open(caminho, "rb") as arquivo:
+        while bloco := arquivo.read(tamanho_bloco):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def _assinatura(caminho, com_hash=True):
+    """Identificação de um arquivo de origem, pelo caminho absoluto (ou None se ele não existe)."""
+    if not os.path.exists(caminho):
+        return None
+    info = os.stat(caminho)
+    assinatura = {"caminho": os.path.abspath(caminho), "tamanho": info.st_size,
+                  "mtime_ns": info.st_mtime_ns}
+    if com_hash:
+        assinatura["hash"] = hash_arquivo(caminho)
+    return assinatura
+
+
+def _mesma_origem(gravada, caminho):
+    """
+    Confere se um arquivo ainda é o que gerou o cache.
+
+    Returns:
+        (valida, assinatura): `assinatura` é a versão atualizada quando só o
+        mtime mudou e o conteúdo é o mesmo
+    """
+    atual = _assinatura(caminho, com_hash=False)
+    if gravada is None or atual is None:
+        return gravada is None and atual is None, gravada
+    if atual["caminho"] != gravada["caminho"] or atual["tamanho"] != gravada["tamanho"]:
+        return False, gravada
+    if atual["mtime_ns"] == gravada["mtime_ns"]:
+        return True, gravada
+    # Mesmo tamanho, mtime diferente: compara o conteúdo
+    if hash_arquivo(caminho) != gravada["hash"]:
+        return False, gravada
+    return True, dict(gravada, mtime_ns=atual["mtime_ns"])
+
+
+def _ler_cache(caminho, dependencias):
+    """Abre o cache com memory-map; retorna None se ele não existe ou está desatualizado."""
+    pasta = pasta_cache(caminho)
+    try:
+        with open(os.path.join(pasta, _CABECALHO)) as arquivo:
+            cabecalho = json.load(arquivo)
+    except (OSError, ValueError):
+        return None
+
+    if cabecalho.get("versao") != VERSAO_CACHE:
+        return None
+    fontes = cabecalho["fontes"]
+    if sorted(fontes) != sorted([caminho, *dependencias]):
+        return None
+
+    atualizado = False
+    for fonte in fontes:
+        valida, assinatura = _mesma_origem(fontes[fonte], fonte)
+        if not valida:
+            return None
+        atualizado |= assinatura is not fontes[fonte]
+        fontes[fonte] = assinatura
+
+    try:
+        arrays = {nome: np.load(os.path.join(pasta, nome + ".npy"), mmap_mode="r")
+                  for nome in (*_ARRAYS_MALHA, *_ARRAYS_BUFFERS)}
+    except (OSError, ValueError):
+        return None
+
+    if atualizado:
+        _gravar_cabecalho(pasta, cabecalho)
+
+    malha = MalhaOBJ()
+    for nome in _ARRAYS_MALHA:
+        setattr(malha, nome, arrays[nome])
+    malha.nomes_materiais = cabecalho["nomes_materiais"]
+    malha.mtllib = cabecalho["mtllib"]
+    return malha, {nome: arrays[nome] for nome in _ARRAYS_BUFFERS}
+
+
+def _gravar_cabecalho(pasta, cabecalho):
+    temporario = os.path.join(pasta, _CABECALHO + ".tmp")
+    with open(temporario, "w") as arquivo:
+        json.dump(cabecalho, arquivo, indent=2)
+    os.replace(temporario, os.path.join(pasta, _CABECALHO))
+
+
+def _gravar_cache(caminho, dependencias, malha, buffers):
+    pasta = pasta_cache(caminho)
+    os.makedirs(pasta, exist_ok=True)
+    # Sem cabeçalho o cache é inválido: se a gravação parar no meio, não é usado
+    if os.path.exists(os.path.join(pasta, _CABECALHO)):
+        os.remove(os.path.join(pasta, _CABECALHO))
+
+    for nome in _ARRAYS_MALHA:
+        np.save(os.path.join(pasta, nome + ".npy"), getattr(malha, nome))
+    for nome in _ARRAYS_BUFFERS:
+        np.save(os.path.join(pasta, nome + ".npy"), buffers[nome])
+
+    _gravar_cabecalho(pasta, {
+        "versao": VERSAO_CACHE,
+        "fontes": {fonte: _assinatura(fonte) for fonte in (caminho, *dependencias)},
+        "nomes_materiais": malha.nomes_materiais,
+        "mtllib": malha.mtllib,
+    })
+
+
+def carregar_malha(caminho, dependencias=()):
+    """
+    Lê um OBJ e prepara seus buffers usando (e mantendo) o cache binário ao lado dele.
+
+    Args:
+        caminho: Arquivo OBJ
+        dependencias: Outros arquivos cuja mudança invalida o cache (ex.: o .mtl)
+
+    Returns:
+        (malha, buffers): MalhaOBJ e o dict de buffers_malha.preparar_buffers.
+        Num acerto, os arrays são memory-maps somente leitura.
+    """
+    # Caminhos absolutos: o cabeçalho é o mesmo qualquer que seja a pasta de onde a aula roda
+    caminho = os.path.abspath(caminho)
+    dependencias = [os.path.abspath(dependencia) for dependencia in dependencias]
+    dependencias = [dependencia for dependencia in dependencias if dependencia != caminho]
+
+    em_cache = _ler_cache(caminho, dependencias)
+    if em_cache is not None:
+        return em_cache
+
+    malha = ler_obj(caminho)
+    buffers = preparar_buffers(malha)
+    try:
+        _gravar_cache(caminho, dependencias, malha, buffers)
+    except OSError as erro:
+        print(f"Aviso: não foi possível gravar o cache de {caminho}: {erro}")
+    return malha, buffers
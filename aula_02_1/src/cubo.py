@@ -1,7 +1,19 @@
+import argparse
+import ctypes
+import os
+import sys
+
+import numpy as np
 import pygame
 from OpenGL.GL import *
 from OpenGL.GLU import *
-import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "comum"))
+from cache_malha import carregar_malha
+from instrumentacao import MedidorQuadros
+
+# Material usado por faces sem `usemtl` ou com material que não está no MTL
+MATERIAL_PADRAO = {'Ka': [0.2, 0.2, 0.2], 'Kd': [0.8, 0.8, 0.8], 'Ks': [0.0, 0.0, 0.0], 'Ns': 0.0}
 
 # Carregar arquivo MTL
 def load_mtl(filename):
@@ -11,90 +23,132 @@ def load_mtl(filename):
     try:
         with open(filename, 'r') as file: # Abrir arquivo MTL e ler linha por linha
             for line in file:
-                if line.startswith('newmtl '):
-                    current_material = line.split()[1] # Nome do material
-                    materials[current_material] = {'color': [0.8, 0.8, 0.8]} # Cor padrão cinza
-                elif line.startswith('Kd ') and current_material:
-                    # Cor difusa
-                    parts = line.split()
-                    materials[current_material]['color'] = [float(parts[1]), float(parts[2]), float(parts[3])] # Definir cor do material
-    except:
+                parts = line.split()
+                if not parts:
+                    continue
+                if parts[0] == 'newmtl':
+                    current_material = parts[1] # Nome do material
+                    materials[current_material] = dict(MATERIAL_PADRAO) # Começa com o material padrão
+                elif parts[0] in ('Ka', 'Kd', 'Ks') and current_material:
+                    # Cores ambiente, difusa e especular
+                    materials[current_material][parts[0]] = [float(parts[1]), float(parts[2]), float(parts[3])]
+                elif parts[0] == 'Ns' and current_material:
+                    # Expoente especular (0 a 1000 no MTL)
+                    materials[current_material]['Ns'] = float(parts[1])
+    except OSError:
         print("Arquivo MTL não encontrado ou erro ao carregar")
 
     return materials
 
 # Carregar arquivo OBJ
 def load_obj(filename):
-    vertices = []
-    faces = []
-    materials = {}
-
     # Tentar carregar MTL
     mtl_file = filename.replace('.obj', '.mtl')
     materials = load_mtl(mtl_file) # Carregar materiais do arquivo MTL
 
-    with open(filename, 'r') as file:
-        for line in file:
-            if line.startswith('v '):
-                # Vértices
-                parts = line.split()
-                vertices.append([float(parts[1]), float(parts[2]), float(parts[3])])
-            elif line.startswith('f '):
-                # Faces - suporta triângulos e quads
-                parts = line.split()[1:] # Ignorar o primeiro elemento 'f' no início
-                face = [] # Lista para armazenar índices dos vértices da face
-                for p in parts:
-                    vertex_idx = int(p.split('/')[0]) - 1  # -1 porque OBJ usa base 1
-                    face.append(vertex_idx) # Adicionar índice do vértice à face
-                faces.append(face)
-
-    print(f"Vértices: {vertices}")
-    print(f"Faces: {faces}")
-    return vertices, faces, materials
-
-# Desenhar objeto
-def draw_object(vertices, faces, materials):
-    # Cor padrão
-    glColor3f(0.1, 0.5, 0.0)  # Cor da superfície
-
-    for face in faces:
-        if len(face) == 3:  # Triângulo
-            glBegin(GL_TRIANGLES)
-        elif len(face) == 4:  # Quadrado
-            glBegin(GL_QUADS)
-        else:  # Polígono
-            glBegin(GL_POLYGON)
-
-        # Verificar se a face tem material associado
-        for vertex_idx in face:
-            if vertex_idx < len(vertices):
-                glVertex3fv(vertices[vertex_idx])
-
-        glEnd() # Finalizar desenho da face
-
-    # Desenhar wireframe por cima
-    glPolygonMode(GL_FRONT_AND_BACK, GL_LINE)
-    glColor3f(1, 0.5, 0)  # Cor para wireframe (RGB)
-
-    # Desenhar faces novamente como wireframe
-    for face in faces:
-        if len(face) == 3:
-            glBegin(GL_TRIANGLES)
-        elif len(face) == 4:
-            glBegin(GL_QUADS)
-        else:
-            glBegin(GL_POLYGON)
-
-        # Desenhar vértices da face
-        for vertex_idx in face:
-            if vertex_idx < len(vertices):
-                glVertex3fv(vertices[vertex_idx])
-
-        glEnd()
-
-    glPolygonMode(GL_FRONT_AND_BACK, GL_FILL) # Voltar ao modo de preenchimento
+    # Leitura em blocos com NumPy (v, vt, vn, faces v/vt/vn, índices negativos, usemtl)
+    # e preparação dos buffers (triângulos agrupados por material); o resultado fica
+    # em cache binário ao lado do OBJ (filename + ".cache") e só é refeito quando o
+    # OBJ ou o MTL mudam
+    malha, buffers = carregar_malha(filename, dependencias=[mtl_file])
+    print(malha)
+    return malha, buffers, materials
+
+class ModeloGPU:
+    """
+    Modelo carregado na GPU uma única vez.
+
+    A superfície usa um VBO com posição e normal por vértice e um buffer de
+    triângulos agrupados por material: cada material é desenhado com uma
+    única chamada glDrawElements sobre o seu intervalo de índices, depois
+    de enviar Ka/Kd/Ks/Ns uma vez. O wireframe usa um VBO só de posições e
+    um buffer de arestas (mais uma chamada).
+    """
+
+    def __init__(self, malha, buffers, materials):
+        vertices = np.ascontiguousarray(buffers["vertices"], dtype=np.float32)
+        posicoes = np.ascontiguousarray(malha.posicoes, dtype=np.float32)
+        self.total_indices_arestas = buffers["arestas"].size
+
+        self.vbo = self._criar_buffer(GL_ARRAY_BUFFER, vertices) # Posição + normal
+        self.vbo_posicoes = self._criar_buffer(GL_ARRAY_BUFFER, posicoes) # Wireframe
+        self.ibo_triangulos = self._criar_buffer(GL_ELEMENT_ARRAY_BUFFER, buffers["triangulos"])
+        self.ibo_arestas = self._criar_buffer(GL_ELEMENT_ARRAY_BUFFER, buffers["arestas"])
+
+        # Estado de cada grupo convertido uma vez: (propriedades, deslocamento em bytes, quantidade)
+        self.grupos = []
+        for material, inicio, quantidade in buffers["grupos"].tolist():
+            nome = malha.nomes_materiais[material] if material >= 0 else None
+            self.grupos.append((self._propriedades(materials.get(nome, MATERIAL_PADRAO)),
+                                ctypes.c_void_p(inicio * 4), quantidade))
+
+    @staticmethod
+    def _criar_buffer(alvo, dados):
+        buffer = glGenBuffers(1)
+        glBindBuffer(alvo, buffer)
+        glBufferData(alvo, dados.nbytes, np.ascontiguousarray(dados), GL_STATIC_DRAW)
+        glBindBuffer(alvo, 0)
+        return buffer
+
+    @staticmethod
+    def _propriedades(material):
+        """Converte um material do MTL para os parâmetros de glMaterial."""
+        def cor(rgb):
+            return np.array([*rgb, 1.0], dtype=np.float32)
+        # Ns vai de 0 a 1000 no MTL; GL_SHININESS vai de 0 a 128
+        brilho = min(material['Ns'] * 128.0 / 1000.0, 128.0)
+        return cor(material['Ka']), cor(material['Kd']), cor(material['Ks']), brilho
+
+    def desenhar(self, medidor):
+        stride = 6 * 4  # x, y, z, nx, ny, nz em float32
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glVertexPointer(3, GL_FLOAT, stride, ctypes.c_void_p(0))
+        glNormalPointer(GL_FLOAT, stride, ctypes.c_void_p(12))
+
+        # Iluminação só na superfície: glPopAttrib devolve o estado de antes
+        glPushAttrib(GL_ENABLE_BIT | GL_LIGHTING_BIT)
+        glEnable(GL_LIGHTING)
+        glEnable(GL_LIGHT0)
+        # Luz direcional saindo da câmera (posição dada com a modelview identidade)
+        glPushMatrix()
+        glLoadIdentity()
+        glLightfv(GL_LIGHT0, GL_POSITION, (0.0, 0.0, 1.0, 0.0))
+        glPopMatrix()
+        glLightfv(GL_LIGHT0, GL_SPECULAR, (1.0, 1.0, 1.0, 1.0))
+
+        # Superfície: afastada um pouco na profundidade para o wireframe não "brigar" com ela
+        glEnable(GL_POLYGON_OFFSET_FILL)
+        glPolygonOffset(1.0, 1.0)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo_triangulos)
+        for (ambiente, difusa, especular, brilho), deslocamento, quantidade in self.grupos:
+            glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, ambiente)
+            glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, difusa)
+            glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, especular)
+            glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, brilho)
+            glDrawElements(GL_TRIANGLES, quantidade, GL_UNSIGNED_INT, deslocamento)
+            medidor.contar_desenho(quantidade)
+        glPopAttrib()
+        glDisableClientState(GL_NORMAL_ARRAY)
+
+        # Wireframe por cima
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo_posicoes)
+        glVertexPointer(3, GL_FLOAT, 0, ctypes.c_void_p(0))
+        glColor3f(1, 0.5, 0)  # Cor para wireframe (RGB)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo_arestas)
+        glDrawElements(GL_LINES, self.total_indices_arestas, GL_UNSIGNED_INT, None)
+        medidor.contar_desenho(self.total_indices_arestas)
+
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
 def main():
+    parser = argparse.ArgumentParser(description="Visualizador de OBJs")
+    parser.add_argument("--csv", help="Grava os tempos de cada quadro neste arquivo CSV")
+    args = parser.parse_args()
+
     # Inicializar pygame
     pygame.init()
     screen = pygame.display.set_mode((800, 600), pygame.DOUBLEBUF | pygame.OPENGL)
@@ -112,15 +166,15 @@ def main():
 
     # Carregar modelo
     try:
-        # Carregar cubo.obj para visualização usando 3 variáveis,
-        # uma para vértices, outra para faces e a terceira para materiais
-        vertices, faces, materials = load_obj("cubo-01.obj")
-        print(f"Carregado: {len(vertices)} vértices, {len(faces)} faces")
+        # Carregar cubo.obj para visualização: a malha (vértices e faces),
+        # os buffers de desenho (triângulos por material e arestas) e os materiais
+        malha, buffers, materials = load_obj("cubo-01.obj")
+        print(f"Carregado: {len(malha.posicoes)} vértices, {len(malha.tamanhos)} faces")
 
-        if not vertices:
+        if len(malha.posicoes) == 0:
             print("ERRO: Nenhum vértice encontrado!")
             sys.exit()
-        if not faces:
+        if len(malha.tamanhos) == 0:
             print("ERRO: Nenhuma face encontrada!")
             sys.exit()
 
@@ -128,14 +182,13 @@ def main():
         print(f"Erro ao carregar cubo-01.obj: {e}")
         sys.exit()
 
+    # Enviar o modelo para a GPU (uma vez só)
+    modelo = ModeloGPU(malha, buffers, materials)
+
     # Calcular centro do objeto para melhor visualização
-    if vertices:
-        min_x = min(v[0] for v in vertices)
-        max_x = max(v[0] for v in vertices)
-        min_y = min(v[1] for v in vertices)
-        max_y = max(v[1] for v in vertices)
-        min_z = min(v[2] for v in vertices)
-        max_z = max(v[2] for v in vertices)
+    if len(malha.posicoes):
+        minimo = malha.posicoes.min(axis=0)
+        maximo = malha.posicoes.max(axis=0)
 
         # Calcular centro e tamanho do objeto
 
@@ -143,8 +196,8 @@ def main():
         # Tamanho é a maior distância entre os valores mínimo e máximo de cada eixo
         # Isso ajuda a centralizar o objeto na tela e ajustar o zoom
         # para que ele fique visível na janela
-        center = [(min_x + max_x) / 2, (min_y + max_y) / 2, (min_z + max_z) / 2]
-        size = max(max_x - min_x, max_y - min_y, max_z - min_z)
+        center = ((minimo + maximo) / 2).tolist()
+        size = float((maximo - minimo).max())
 
         print(f"Centro: {center}, Tamanho: {size}")
 
@@ -160,14 +213,20 @@ def main():
     print("Scroll: Zoom")
     print("Shift+Mouse: Pan")
     print("R: Reset câmera")
+    print("F3: Painel de desempenho")
     print("ESC: Sair")
 
     clock = pygame.time.Clock() # Relógio para controlar FPS
+    medidor = MedidorQuadros(arquivo_csv=args.csv) # Tempos por quadro (painel e CSV)
 
     while True:
+        medidor.iniciar_quadro()
+
         # Eventos
         for event in pygame.event.get():
+            medidor.tratar_evento(event)
             if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                medidor.fechar()
                 pygame.quit()
                 sys.exit()
 
@@ -205,6 +264,8 @@ def main():
                 zoom += event.y * 1.0
                 zoom = max(-100, min(zoom, -1))  # Limitar zoom
 
+        medidor.marcar("eventos")
+
         # Renderizar
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         glLoadIdentity()
@@ -215,9 +276,13 @@ def main():
         glRotatef(rotation_y, 0, 1, 0)
 
         # Desenha o cubo
-        draw_object(vertices, faces, materials)
+        modelo.desenhar(medidor)
+        medidor.desenhar_painel()
+        medidor.marcar("render")
 
         pygame.display.flip() # Atualizar tela
+        medidor.marcar("swap")
+        medidor.finalizar_quadro()
         clock.tick(30) # Limitar o FPS
 
 if __name__ == "__main__":
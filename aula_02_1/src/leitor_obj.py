@@ -0,0 +1,315 @@
+import warnings
+
+import numpy as np
+
+# Leitor de arquivos OBJ em blocos, convertendo os números com NumPy.
+#
+# O arquivo é lido em blocos de bytes (BYTES_POR_BLOCO, cortados em fim de
+# linha). Em cada bloco, o tipo de cada linha (v, vt, vn, f, ...) é
+# identificado com NumPy pelos dois primeiros caracteres, e cada sequência de
+# linhas do mesmo tipo é convertida de uma vez com np.fromstring, sem um laço
+# Python por linha. O np.fromstring para no primeiro token que não é número
+# (e só avisa), então a quantidade de valores convertidos é sempre conferida:
+# um token inválido gera ValueError com a linha em que está. A memória usada fica proporcional aos arrays de saída
+# (mais um bloco de texto), e não a milhões de floats/listas Python.
+
+BYTES_POR_BLOCO = 16 * 2**20
+
+# Tipos de linha
+_OUTRA, _V, _VT, _VN, _F, _USEMTL, _MTLLIB = range(7)
+
+
+class MalhaOBJ:
+    """
+    Malha lida de um OBJ, em arrays NumPy.
+
+    Atributos:
+        posicoes: (N, 3) float32 (linhas `v`)
+        texcoords: (T, 2) float32 (linhas `vt`)
+        normais: (M, 3) float32 (linhas `vn`)
+        indices_v: índices (base 0) das posições de todas as faces em sequência, uint32
+        indices_vt, indices_vn: mesmos cantos das faces, int32 com -1 quando ausente
+        tamanhos: número de vértices de cada face, uint32
+        materiais_faces: índice em `nomes_materiais` de cada face (-1 = sem material), int32
+        nomes_materiais: nomes usados em `usemtl`, na ordem em que aparecem
+        mtllib: arquivo de materiais indicado pelo OBJ (ou None)
+    """
+
+    def __init__(self):
+        self.posicoes = np.empty((0, 3), dtype=np.float32)
+        self.texcoords = np.empty((0, 2), dtype=np.float32)
+        self.normais = np.empty((0, 3), dtype=np.float32)
+        self.indices_v = np.empty(0, dtype=np.uint32)
+        self.indices_vt = np.empty(0, dtype=np.int32)
+        self.indices_vn = np.empty(0, dtype=np.int32)
+        self.tamanhos = np.empty(0, dtype=np.uint32)
+        self.materiais_faces = np.empty(0, dtype=np.int32)
+        self.nomes_materiais = []
+        self.mtllib = None
+
+    def __str__(self):
+        return (f"MalhaOBJ({len(self.posicoes)} vértices, {len(self.tamanhos)} faces, "
+                f"{len(self.texcoords)} vt, {len(self.normais)} vn, "
+                f"{len(self.nomes_materiais)} materiais)")
+
+
+def _tipos_das_linhas(dados, inicios):
+    """Classifica as linhas que começam em `inicios` pelos dois primeiros bytes."""
+    c0 = dados[inicios]
+    c1 = dados[inicios + 1]
+    separado = (c1 == ord(" ")) | (c1 == ord("\t"))
+    tipos = np.full(len(inicios), _OUTRA, dtype=np.int8)
+    tipos[(c0 == ord("v")) & separado] = _V
+    tipos[(c0 == ord("v")) & (c1 == ord("t"))] = _VT
+    tipos[(c0 == ord("v")) & (c1 == ord("n"))] = _VN
+    tipos[(c0 == ord("f")) & separado] = _F
+    tipos[(c0 == ord("u")) & (c1 == ord("s"))] = _USEMTL
+    tipos[(c0 == ord("m")) & (c1 == ord("t"))] = _MTLLIB
+    return tipos
+
+
+def _numeros(texto, dtype):
+    """Números separados por espaço em `texto`; para no primeiro token inválido (confira o tamanho)."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)  # aviso de "dados não lidos até o fim"
+        try:
+            return np.fromstring(texto, dtype=dtype, sep=" ")
+        except ValueError:  # NumPy futuro: erro em vez do aviso
+            return np.empty(0, dtype=dtype)
+
+
+def _linha_invalida(texto, validar):
+    """ValueError com a primeira linha de `texto` em que validar(tokens) falha."""
+    for linha in texto.splitlines():
+        if not validar(linha.split()):
+            return ValueError(f"Linha inválida no OBJ: {linha.decode(errors='replace').strip()!r}")
+    return ValueError("Valores inválidos no OBJ")
+
+
+def _eh_numero(token):
+    try:
+        float(token)
+        return True
+    except ValueError:
+        return False
+
+
+def _colunas(texto, dados, prefixo, linhas, colunas):
+    """
+    Converte `linhas` linhas `v`/`vt`/`vn` em um array float32 (linhas, colunas).
+
+    Linhas com componentes extras (ex.: `v x y z w` ou cores por vértice)
+    têm os excedentes descartados. Linhas com componentes a menos ou com um
+    valor que não é número geram ValueError.
+    """
+    def valida(tokens):
+        return len(tokens) > colunas and all(_eh_numero(token) for token in tokens[1:colunas + 1])
+
+    tokens = _tokens_por_linha(dados)
+    if (tokens == colunas + 1).all():
+        # O prefixo não aparece nos números, então pode virar espaço de uma vez
+        valores = _numeros(texto.replace(prefixo, b"  "), np.float32)
+        if valores.size != linhas * colunas:
+            raise _linha_invalida(texto, valida)
+        return valores.reshape(-1, colunas)
+
+    partes = [linha.split()[1:colunas + 1] for linha in texto.splitlines()]
+    if (tokens <= colunas).any():
+        raise _linha_invalida(texto, valida)
+    try:
+        return np.array(partes, dtype=np.float32)
+    except ValueError:
+        raise _linha_invalida(texto, valida) from None
+
+
+def _tokens_por_linha(dados):
+    """Conta os tokens (separados por espaço) de cada linha de `dados`, terminado em quebra de linha."""
+    espaco = dados <= ord(" ")  # espaço, tab, \r, \n
+    inicio_token = ~espaco
+    inicio_token[1:] &= espaco[:-1]
+    # Quantos tokens começam antes do fim de cada linha
+    antes_do_fim = np.searchsorted(np.flatnonzero(inicio_token), np.flatnonzero(dados == ord("\n")))
+    return np.diff(antes_do_fim, prepend=0)
+
+
+def _cantos_das_faces(texto, total):
+    """
+    Converte o texto das faces ("v", "v/vt", "v//vn" ou "v/vt/vn") em um array (total, 3).
+
+    Índices ausentes ficam 0 (o OBJ começa em 1, então 0 nunca é um índice válido).
+    Quando todos os tokens têm o mesmo formato (o caso comum), a conversão é
+    feita de uma vez; caso contrário, token a token.
+    """
+    cantos = np.zeros((total, 3), dtype=np.int32)
+    if not total:
+        return cantos
+
+    primeiro = texto.split(None, 1)[0]
+    barras = primeiro.count(b"/")
+    duplo = b"//" in primeiro
+    uniforme = (texto.count(b"/") == barras * total
+                and texto.count(b"//") == (total if duplo else 0))
+
+    def valida(tokens):
+        return all(campo.lstrip(b"-").isdigit() or campo == b""
+                   for token in tokens for campo in token.split(b"/"))
+
+    if uniforme:
+        valores = _numeros(texto.replace(b"/", b" "), np.int64)
+        if duplo:
+            colunas = [0, 2]           # v//vn
+        else:
+            colunas = [0, 1, 2][:barras + 1]  # v, v/vt, v/vt/vn
+        if valores.size != total * len(colunas):
+            raise _linha_invalida(texto, valida)
+        cantos[:, colunas] = valores.reshape(-1, len(colunas))
+        return cantos
+
+    for i, token in enumerate(texto.split()):
+        for j, campo in enumerate(token.split(b"/")[:3]):
+            if campo:
+                try:
+                    cantos[i, j] = int(campo)
+                except ValueError:
+                    raise _linha_invalida(texto, valida) from None
+    return cantos
+
+
+class _Leitor:
+    """Converte os blocos do arquivo e acumula os arrays de cada um."""
+
+    def __init__(self, malha):
+        self.malha = malha
+        self.materiais = {}
+        self.material_atual = -1
+        self.contagens = np.zeros(3, dtype=np.int64)  # v, vt, vn lidos até agora
+        self.posicoes, self.texcoords, self.normais = [], [], []
+        self.cantos, self.tamanhos, self.materiais_faces = [], [], []
+
+    def processar(self, bloco):
+        """Processa um bloco de bytes com linhas completas."""
+        dados = np.frombuffer(bloco + b"\n", dtype=np.uint8)  # sentinela para ler inicios + 1
+        fins = np.flatnonzero(dados[:-1] == ord("\n"))
+        inicios = np.concatenate(([0], fins[:-1] + 1))
+        tipos = _tipos_das_linhas(dados, inicios)
+
+        # Sequências de linhas consecutivas do mesmo tipo
+        mudancas = np.flatnonzero(np.diff(tipos)) + 1
+        primeiras = np.concatenate(([0], mudancas))
+        ultimas = np.concatenate((mudancas, [len(tipos)])) - 1
+
+        for tipo, primeira, ultima in zip(tipos[primeiras].tolist(), primeiras.tolist(), ultimas.tolist()):
+            if tipo == _OUTRA:
+                continue
+            inicio, fim = int(inicios[primeira]), int(fins[ultima]) + 1
+            self._sequencia(tipo, bloco[inicio:fim], dados[inicio:fim], ultima - primeira + 1)
+
+    def _sequencia(self, tipo, texto, dados, linhas):
+        if tipo == _V:
+            self.posicoes.append(_colunas(texto, dados, b"v", linhas, 3))
+            self.contagens[0] += linhas
+        elif tipo == _VT:
+            self.texcoords.append(_colunas(texto, dados, b"vt", linhas, 2))
+            self.contagens[1] += linhas
+        elif tipo == _VN:
+            self.normais.append(_colunas(texto, dados, b"vn", linhas, 3))
+            self.contagens[2] += linhas
+        elif tipo == _F:
+            self._faces(texto, dados)
+        elif tipo == _USEMTL:
+            for linha in texto.splitlines():
+                self._usar_material(linha.split(None, 1)[1].strip().decode())
+        elif tipo == _MTLLIB and self.malha.mtllib is None:
+            self.malha.mtllib = texto.splitlines()[0].split(None, 1)[1].strip().decode()
+
+    def _faces(self, texto, dados):
+        tamanhos = _tokens_por_linha(dados) - 1  # sem o "f"
+        cantos = _cantos_das_faces(texto.replace(b"f", b" "), int(tamanhos.sum()))
+        if b"-" in texto:
+            # Índices relativos: -1 é o último v/vt/vn lido antes da face.
+            # Dentro de uma sequência de faces essas contagens não mudam.
+            negativos = cantos < 0
+            cantos += np.where(negativos, self.contagens + 1, 0).astype(np.int32)
+        self.cantos.append(cantos)
+        self.tamanhos.append(tamanhos.astype(np.uint32))
+        self.materiais_faces.append(np.full(len(tamanhos), self.material_atual, dtype=np.int32))
+
+    def _usar_material(self, nome):
+        if nome not in self.materiais:
+            self.materiais[nome] = len(self.malha.nomes_materiais)
+            self.malha.nomes_materiais.append(nome)
+        self.material_atual = self.materiais[nome]
+
+
+def _juntar(partes, formato, dtype):
+    if not partes:
+        return np.empty(formato, dtype=dtype)
+    return np.concatenate(partes)
+
+
+def ler_obj(caminho, bytes_por_bloco=BYTES_POR_BLOCO):
+    """
+    Lê um arquivo OBJ.
+
+    Suporta `v`, `vt`, `vn`, faces com qualquer número de vértices nos formatos
+    v, v/vt, v//vn e v/vt/vn, índices negativos (relativos), `usemtl` e `mtllib`.
+    Índices fora do intervalo são descartados aqui, uma vez; faces que ficarem
+    com menos de 3 vértices também.
+
+    Returns:
+        MalhaOBJ
+    """
+    malha = MalhaOBJ()
+    leitor = _Leitor(malha)
+
+    with open(caminho, "rb") as arquivo:
+        resto = b""
+        while True:
+            bloco = arquivo.read(bytes_por_bloco)
+            if not bloco:
+                break
+            bloco = resto + bloco
+            # Só processa linhas completas; o final incompleto vai para o próximo bloco
+            corte = bloco.rfind(b"\n") + 1
+            resto = bloco[corte:]
+            if corte:
+                leitor.processar(bloco[:corte])
+        if resto:
+            leitor.processar(resto + b"\n")
+
+    malha.posicoes = _juntar(leitor.posicoes, (0, 3), np.float32)
+    malha.texcoords = _juntar(leitor.texcoords, (0, 2), np.float32)
+    malha.normais = _juntar(leitor.normais, (0, 3), np.float32)
+    cantos = _juntar(leitor.cantos, (0, 3), np.int32)
+    cantos -= 1  # OBJ começa em 1; ausente vira -1
+    tamanhos = _juntar(leitor.tamanhos, (0,), np.uint32)
+    materiais_faces = _juntar(leitor.materiais_faces, (0,), np.int32)
+
+    _validar(malha, cantos, tamanhos, materiais_faces)
+    return malha
+
+
+def _validar(malha, cantos, tamanhos, materiais_faces):
+    """Descarta índices fora do intervalo e preenche os índices da malha."""
+    iv, ivt, ivn = cantos[:, 0], cantos[:, 1], cantos[:, 2]
+
+    # vt/vn inválidos só deixam de ser usados; posições inválidas removem o canto
+    ivt[(ivt < 0) | (ivt >= len(malha.texcoords))] = -1
+    ivn[(ivn < 0) | (ivn >= len(malha.normais))] = -1
+
+    valido = (iv >= 0) & (iv < len(malha.posicoes))
+    if not valido.all():
+        face_do_canto = np.repeat(np.arange(len(tamanhos)), tamanhos)
+        tamanhos = np.bincount(face_do_canto[valido], minlength=len(tamanhos)).astype(np.uint32)
+        manter_face = tamanhos >= 3
+        manter_canto = valido & manter_face[face_do_canto]
+        print(f"Aviso: {np.count_nonzero(~valido)} índices de vértice inválidos ignorados")
+        iv, ivt, ivn = iv[manter_canto], ivt[manter_canto], ivn[manter_canto]
+        tamanhos = tamanhos[manter_face]
+        materiais_faces = materiais_faces[manter_face]
+
+    malha.indices_v = iv.astype(np.uint32)
+    malha.indices_vt = ivt.astype(np.int32)
+    malha.indices_vn = ivn.astype(np.int32)
+    malha.tamanhos = tamanhos.astype(np.uint32)
+    malha.materiais_faces = materiais_faces.astype(np.int32)
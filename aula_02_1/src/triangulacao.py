@@ -0,0 +1,176 @@
+import numpy as np
+
+# Triangulação das faces de um OBJ, feita uma vez no carregamento.
+#
+# As faces chegam "achatadas": um array `indices` com os vértices de todas
+# as faces em sequência e um array `tamanhos` com quantos vértices cada face
+# tem. Ex.: um triângulo e um quadrado ficam
+#     indices  = [0, 1, 2,  2, 3, 4, 5]
+#     tamanhos = [3, 4]
+#
+# O resultado é um array uint32 plano de triângulos (3 índices por triângulo)
+# e um array (E, 2) de arestas para o wireframe, prontos para virar buffers.
+
+
+def faces_para_arrays(faces):
+    """Converte uma lista de faces (listas de índices) para (indices, tamanhos)."""
+    tamanhos = np.fromiter((len(face) for face in faces), dtype=np.int64, count=len(faces))
+    indices = np.fromiter((idx for face in faces for idx in face), dtype=np.uint32,
+                          count=int(tamanhos.sum()))
+    return indices, tamanhos
+
+
+def _normais_newell(pontos):
+    """Normal (não normalizada) de cada polígono (F, k, 3) pelo método de Newell."""
+    proximos = np.roll(pontos, -1, axis=1)
+    return np.cross(pontos, proximos).sum(axis=1)
+
+
+def _convexos(pontos):
+    """Indica quais polígonos (F, k, 3) são convexos (todas as curvas para o mesmo lado)."""
+    normais = _normais_newell(pontos)
+    arestas = np.roll(pontos, -1, axis=1) - pontos
+    curvas = np.cross(arestas, np.roll(arestas, -1, axis=1))
+    return np.all(np.einsum("fkc,fc->fk", curvas, normais) >= 0, axis=1)
+
+
+def _leque(faces):
+    """Triangula faces (F, k) como leque: (v0, v1, v2), (v0, v2, v3), ..."""
+    k = faces.shape[1]
+    triangulos = np.empty((faces.shape[0], k - 2, 3), dtype=np.uint32)
+    triangulos[:, :, 0] = faces[:, :1]
+    triangulos[:, :, 1] = faces[:, 1:-1]
+    triangulos[:, :, 2] = faces[:, 2:]
+    return triangulos.reshape(-1, 3)
+
+
+def _dentro_do_triangulo(p, a, b, c):
+    """Teste 2D (com borda) de p dentro do triângulo abc no sentido anti-horário."""
+    def lado(o, u, v):
+        return (u[0] - o[0]) * (v[1] - o[1]) - (u[1] - o[1]) * (v[0] - o[0])
+    return lado(a, b, p) >= 0 and lado(b, c, p) >= 0 and lado(c, a, p) >= 0
+
+
+def triangular_orelhas(face, pontos):
+    """
+    Triangula um polígono côncavo por "corte de orelhas" (ear clipping).
+
+    Args:
+        face: Índices dos vértices do polígono
+        pontos: Array (k, 3) com as posições desses vértices
+
+    Returns:
+        Lista de triângulos (tuplas de índices de `face`)
+    """
+    # Projeta no plano em que o polígono tem maior área (descarta o eixo dominante da normal)
+    normal = _normais_newell(pontos[None])[0]
+    eixo = int(np.argmax(np.abs(normal)))
+    plano = np.delete(pontos, eixo, axis=1)
+    # Garante o sentido anti-horário no plano projetado
+    if normal[eixo] * (1 if eixo != 1 else -1) < 0:
+        plano = plano[:, ::-1]
+    plano = plano.tolist()
+
+    restantes = list(range(len(face)))
+    triangulos = []
+    while len(restantes) > 3:
+        n = len(restantes)
+        for i in range(n):
+            ia, ib, ic = restantes[i - 1], restantes[i], restantes[(i + 1) % n]
+            a, b, c = plano[ia], plano[ib], plano[ic]
+            # Vértice reflexo (ângulo interno > 180°) não forma orelha
+            if (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0]) <= 0:
+                continue
+            if any(_dentro_do_triangulo(plano[j], a, b, c)
+                   for j in restantes if j not in (ia, ib, ic)):
+                continue
+            triangulos.append((face[ia], face[ib], face[ic]))
+            del restantes[i]
+            break
+        else:
+            # Polígono degenerado (ex.: auto-interseção): termina em leque
+            break
+
+    for i in range(1, len(restantes) - 1):
+        triangulos.append((face[restantes[0]], face[restantes[i]], face[restantes[i + 1]]))
+    return triangulos
+
+
+def arestas_das_faces(indices, tamanhos):
+    """
+    Arestas dos contornos das faces, sem repetição.
+
+    Args:
+        indices: Array plano com os índices de todas as faces
+        tamanhos: Array com o número de vértices de cada face
+
+    Returns:
+        Array uint32 (E, 2), cada aresta como (menor, maior)
+    """
+    indices = np.asarray(indices, dtype=np.uint64)
+    tamanhos = np.asarray(tamanhos, dtype=np.int64)
+    if indices.size == 0:
+        return np.empty((0, 2), dtype=np.uint32)
+    inicios = np.concatenate(([0], np.cumsum(tamanhos)[:-1]))
+    # Próximo canto de cada canto, voltando ao primeiro no fim da face
+    proximos = np.arange(1, len(indices) + 1)
+    proximos[inicios + tamanhos - 1] = inicios
+
+    # Cada aresta (menor, maior) vira uma chave de 64 bits; ordenar as chaves
+    # e descartar as repetidas é bem mais rápido que np.unique(axis=0)
+    a, b = indices, indices[proximos]
+    chaves = np.sort((np.minimum(a, b) << np.uint64(32)) | np.maximum(a, b))
+    chaves = chaves[np.concatenate(([True], chaves[1:] != chaves[:-1]))]
+    return np.stack([chaves >> np.uint64(32), chaves & np.uint64(0xFFFFFFFF)], axis=1).astype(np.uint32)
+
+
+def triangular_faces(vertices, indices, tamanhos):
+    """
+    Triangula todas as faces.
+
+    Faces com o mesmo número de vértices são processadas juntas: os
+    triângulos passam direto, polígonos convexos viram leques (vetorizado)
+    e só os côncavos passam pelo corte de orelhas.
+
+    Args:
+        vertices: Array (N, 3) de posições
+        indices: Array plano com os índices de todas as faces
+        tamanhos: Array com o número de vértices de cada face
+
+    Returns:
+        Array uint32 plano (3 * T,)
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    indices = np.asarray(indices, dtype=np.uint32)
+    tamanhos = np.asarray(tamanhos, dtype=np.int64)
+    inicios = np.concatenate(([0], np.cumsum(tamanhos)[:-1]))
+
+    triangulos = []
+    for k in np.unique(tamanhos):
+        if k < 3:
+            continue
+        faces = indices[inicios[tamanhos == k, None] + np.arange(k)]  # (F, k)
+
+        if k == 3:
+            triangulos.append(faces)
+            continue
+
+        pontos = vertices[faces]
+        convexos = _convexos(pontos)
+        triangulos.append(_leque(faces[convexos]))
+        for face, pts in zip(faces[~convexos], pontos[~convexos]):
+            triangulos.append(np.array(triangular_orelhas(face.tolist(), pts), dtype=np.uint32).reshape(-1, 3))
+
+    if not triangulos:
+        return np.empty(0, dtype=np.uint32)
+    return np.concatenate(triangulos).astype(np.uint32).ravel()
+
+
+def triangular(vertices, indices, tamanhos):
+    """
+    Triangula todas as faces e extrai as arestas dos contornos.
+
+    Returns:
+        (triangulos, arestas): array uint32 plano (3 * T,) e array uint32 (E, 2)
+    """
+    return triangular_faces(vertices, indices, tamanhos), arestas_das_faces(indices, tamanhos)
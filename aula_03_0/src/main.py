@@ -2,30 +2,36 @@ import glfw
 from OpenGL.GL import *
 import numpy as np
 import math
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "comum"))
+from gerenciador_shaders import GerenciadorShaders
+
+
+def escrever_trs(destino, escala, angulo, trans_x, trans_y):
+    """
+    Escreve T @ R @ S (escala uniforme em x e y, rotação em z) direto em uma matriz já alocada.
+
+    A matriz fica em ordem column-major, a que o OpenGL espera: vai para o
+    shader com glUniformMatrix4fv(..., GL_FALSE, destino) sem transposição.
+    Só as 6 posições que variam são escritas; o resto deve vir da identidade.
+
+    Args:
+        destino: Array float32 de 16 elementos (ex.: np.identity(4, np.float32).ravel())
+        escala: Fator de escala
+        angulo: Rotação em radianos
+        trans_x, trans_y: Translação
+    """
+    cos_a = math.cos(angulo) * escala
+    sin_a = math.sin(angulo) * escala
+    destino[0] = cos_a    # Coluna 0: eixo x transformado
+    destino[1] = sin_a
+    destino[4] = -sin_a   # Coluna 1: eixo y transformado
+    destino[5] = cos_a
+    destino[12] = trans_x  # Coluna 3: translação
+    destino[13] = trans_y
 
-# --- Funções para compilar Shaders ---
-def compile_shader(source, shader_type):
-    shader = glCreateShader(shader_type) # Cria um shader do tipo especificado
-    glShaderSource(shader, source)
-    glCompileShader(shader) # Compila o shader
-    if not glGetShaderiv(shader, GL_COMPILE_STATUS):
-        raise Exception(f"Erro na compilação do shader: {glGetShaderInfoLog(shader).decode()}")
-    return shader
-
-def create_shader_program(vertex_src, fragment_src):
-    vertex_shader = compile_shader(vertex_src, GL_VERTEX_SHADER) # Compila o shader de vértices
-    fragment_shader = compile_shader(fragment_src, GL_FRAGMENT_SHADER)
-
-    program = glCreateProgram() # Cria um programa de shader
-    glAttachShader(program, vertex_shader) # Anexa o shader de vértices
-    glAttachShader(program, fragment_shader) # Anexa o shader de fragmentos
-    glLinkProgram(program) # Linka os shaders no programa
-    if not glGetProgramiv(program, GL_LINK_STATUS): # Verifica se o link foi bem-sucedido
-        raise Exception(f"Erro no link do programa: {glGetProgramInfoLog(program).decode()}")
-
-    glDeleteShader(vertex_shader) # Limpa os shaders após o link
-    glDeleteShader(fragment_shader)
-    return program
 
 def main():
     # --- Inicialização do GLFW ---
@@ -41,13 +47,11 @@ def main():
     glfw.make_context_current(window) # Torna o contexto OpenGL atual para a janela
 
     # --- Carregar Shaders ---
-    with open("vertex_shader.glsl", "r") as f:
-        vertex_shader_source = f.read()
-    with open("fragment_shader.glsl", "r") as f:
-        fragment_shader_source = f.read()
-
-    shader_program = create_shader_program(vertex_shader_source, fragment_shader_source) # Cria o programa de shader
-    glUseProgram(shader_program) # Ativa o programa de shader
+    # O gerenciador guarda o binário do programa em disco (as próximas execuções
+    # não compilam) e recompila o shader quando o arquivo .glsl é salvo
+    shaders = GerenciadorShaders()
+    shader_program = shaders.carregar_arquivos("vertex_shader.glsl", "fragment_shader.glsl", vigiar=True)
+    glUseProgram(shader_program.id) # Ativa o programa de shader
 
     # --- Definir a geometria do quadrado ---
     # Vértices de um quadrado centrado na origem
@@ -83,8 +87,8 @@ def main():
     glBindBuffer(GL_ARRAY_BUFFER, 0) # Desativa o VBO
     glBindVertexArray(0) # Desativa o VAO
 
-    # Obter a localização do uniform da matriz de transformação no shader
-    transform_loc = glGetUniformLocation(shader_program, "u_transform")
+    # Matriz de transformação alocada uma vez e reescrita a cada quadro
+    transform_matrix = np.identity(4, dtype=np.float32).ravel()
 
     # --- Loop Principal de Renderização ---
     while not glfw.window_should_close(window):
@@ -92,48 +96,29 @@ def main():
         glClearColor(0.1, 0.1, 0.1, 1.0)
         glClear(GL_COLOR_BUFFER_BIT)
 
-        # Ativar o programa de shader
-        glUseProgram(shader_program)
+        # Recarregar shaders alterados e ativar o programa
+        shaders.verificar_alteracoes()
+        glUseProgram(shader_program.id)
 
         # --- Calcular Matrizes de Transformação ---
         time_value = glfw.get_time()
 
-        # 1. Matriz de Escala: Animação de "pulsação"
-        scale_factor = (math.sin(time_value * 2) + 1.5) / 2.5 # Varia entre 0.2 e 1.0
-        scale_mat = np.array([
-            [scale_factor, 0, 0, 0],
-            [0, scale_factor, 0, 0],
-            [0, 0, 1, 0],
-            [0, 0, 0, 1]
-        ], dtype=np.float32)
-
-        # 2. Matriz de Rotação: Gira continuamente
+        # Escala: animação de "pulsação" (varia entre 0.2 e 1.0)
+        scale_factor = (math.sin(time_value * 2) + 1.5) / 2.5
+        # Rotação: gira continuamente
         angle = time_value
-        cos_a, sin_a = math.cos(angle), math.sin(angle)
-        rotation_mat = np.array([
-            [cos_a, -sin_a, 0, 0],
-            [sin_a,  cos_a, 0, 0],
-            [0,     0,     1, 0],
-            [0,     0,     0, 1]
-        ], dtype=np.float32)
-
-        # 3. Matriz de Translação: Move em um círculo
+        # Translação: move em um círculo
         trans_x = math.cos(time_value) * 0.5
         trans_y = math.sin(time_value) * 0.5
-        translation_mat = np.array([
-            [1, 0, 0, trans_x],
-            [0, 1, 0, trans_y],
-            [0, 0, 1, 0],
-            [0, 0, 0, 1]
-        ], dtype=np.float32)
 
         # --- Composição das Matrizes ---
-        # Ordem: Escala -> Rotação -> Translação
-        # No código (multiplicação de matrizes), a ordem é inversa: T @ R @ S
-        transform_matrix = translation_mat @ rotation_mat @ scale_mat
+        # Ordem: Escala -> Rotação -> Translação, ou seja T @ R @ S.
+        # O produto é escrito já pronto (forma fechada), sem montar as três
+        # matrizes nem criar arrays novos a cada quadro
+        escrever_trs(transform_matrix, scale_factor, angle, trans_x, trans_y)
 
         # Enviar a matriz composta para o shader
-        glUniformMatrix4fv(transform_loc, 1, GL_TRUE, transform_matrix) # GL_TRUE porque NumPy usa 'row-major' order
+        glUniformMatrix4fv(shader_program.uniform("u_transform"), 1, GL_FALSE, transform_matrix) # GL_FALSE: a matriz já está em column-major
 
         # --- Desenhar o objeto ---
         glBindVertexArray(VAO)
@@ -147,7 +132,7 @@ def main():
     glDeleteVertexArrays(1, [VAO])
     glDeleteBuffers(1, [VBO])
     glDeleteBuffers(1, [EBO])
-    glDeleteProgram(shader_program)
+    shaders.liberar()
     glfw.terminate()
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import os
 import sys
 import numpy as np
 from OpenGL.GL import *
@@ -6,10 +7,17 @@ from OpenGL.GLUT import *
 from OpenGL.GLU import *
 import math
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "comum"))
+from pilha_matrizes import MatrixStack, perspectiva
+
 # Variáveis globais para a animação
 rotation_angle_x = 0.0
 rotation_angle_y = 0.0
 
+# Pilha de matrizes calculada na CPU: as transformações de cada quadro são
+# compostas em NumPy e enviadas ao OpenGL com uma única chamada
+pilha = MatrixStack()
+
 def draw_axes():
     """ Desenha os eixos X (vermelho), Y (verde) e Z (azul) """
     glLineWidth(2.0)
@@ -83,31 +91,34 @@ def display():
     glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
     # Reseta a matriz de transformação atual (ModelView)
-    glLoadIdentity()
+    pilha.load_identity()
 
     # Configuração da Câmera (Matriz de Visão - View Matrix)
     # Posição da câmera: (5, 5, 5)
     # Ponto para onde a câmera olha: (0, 0, 0)
     # Vetor "up" da câmera: (0, 1, 0) (eixo Y)
-    gluLookAt(5, 5, 5, 0, 0, 0, 0, 1, 0)
+    pilha.look_at(5, 5, 5, 0, 0, 0, 0, 1, 0)
 
     # --- Início das Transformações do Modelo (Matriz de Modelo - Model Matrix) ---
 
     # 1. Translação: Move o objeto para longe da origem do mundo
     # O cubo será transladado em -1.5 no eixo Z.
-    glTranslatef(0.0, 0.0, 0)
+    pilha.translate(0.0, 0.0, 0)
 
     # 2. Rotação: Gira o objeto em torno de seu próprio centro
     # A ordem importa! Rotacionar em Y e depois em X é diferente do contrário.
-    glRotatef(rotation_angle_y, 0.0, 1.0, 0.0) # Gira em torno do eixo Y
-    glRotatef(rotation_angle_x, 1.0, 0.0, 0.0) # Gira em torno do eixo X
+    pilha.rotate(rotation_angle_y, 0.0, 1.0, 0.0) # Gira em torno do eixo Y
+    pilha.rotate(rotation_angle_x, 1.0, 0.0, 0.0) # Gira em torno do eixo X
 
     # 3. Escala: Altera o tamanho do objeto
     # Aumenta o tamanho do cubo em 1.5x em todas as direções
-    glScalef(1.5, 1.5, 1.5)
+    pilha.scale(1.5, 1.5, 1.5)
 
     # --- Fim das Transformações do Modelo ---
 
+    # Envia a matriz composta (visão * modelo) com uma única chamada
+    pilha.load_gl()
+
     # Desenha os eixos do sistema de coordenadas do objeto transformado
     draw_axes()
     # Desenha o cubo
@@ -126,11 +137,10 @@ def reshape(width, height):
 
     # Define a matriz de Projeção
     glMatrixMode(GL_PROJECTION)
-    glLoadIdentity()
 
-    # Define a projeção em perspectiva
+    # Define a projeção em perspectiva (a mesma matriz de gluPerspective)
     # fov = 45 graus, aspect ratio = width/height, near plane = 0.1, far plane = 50.0
-    gluPerspective(45.0, float(width) / float(height), 0.1, 50.0)
+    glLoadTransposeMatrixf(perspectiva(45.0, float(width) / float(height), 0.1, 50.0))
 
     # Retorna para a matriz ModelView para as operações de desenho
     glMatrixMode(GL_MODELVIEW)
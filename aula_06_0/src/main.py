@@ -1,9 +1,16 @@
+import argparse
+import os
+import sys
+
 import pygame
 from pygame.locals import *
 
 from OpenGL.GL import *
 from OpenGL.GLU import *
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "comum"))
+from instrumentacao import MedidorQuadros
+
 # --- Definição da Geometria do Cubo ---
 
 # 8 vértices do cubo
@@ -47,9 +54,12 @@ cores = (
 )
 
 
-def desenha_cubo():
+def desenha_cubo(medidor):
     """
     Função para renderizar o cubo face por face.
+
+    Args:
+        medidor: MedidorQuadros que conta as chamadas de desenho
     """
     # Usamos GL_QUADS para desenhar as faces quadradas.
     glBegin(GL_QUADS)
@@ -60,6 +70,7 @@ def desenha_cubo():
             # Passa cada vértice da face para o OpenGL
             glVertex3fv(vertices[vertice_idx])
     glEnd()
+    medidor.contar_desenho(4 * len(faces))
 
     # Opcional: desenhar as arestas em preto para dar contorno
     glColor3fv((0, 0, 0)) # Cor preta
@@ -68,6 +79,7 @@ def desenha_cubo():
         for vertice_idx in aresta:
             glVertex3fv(vertices[vertice_idx])
     glEnd()
+    medidor.contar_desenho(2 * len(arestas))
 
 
 def main():
@@ -75,6 +87,10 @@ def main():
     Função principal que inicializa o PyGame e o OpenGL,
     e entra no loop de renderização.
     """
+    parser = argparse.ArgumentParser(description="Aula 6 - Modelagem de um Cubo")
+    parser.add_argument("--csv", help="Grava os tempos de cada quadro neste arquivo CSV")
+    args = parser.parse_args()
+
     pygame.init()
     display = (800, 600)
     pygame.display.set_mode(display, DOUBLEBUF | OPENGL)
@@ -92,13 +108,21 @@ def main():
     # de cada pixel e garantindo que apenas o pixel mais próximo da câmera.
     glEnable(GL_DEPTH_TEST)
 
+    # Tempos de cada quadro: painel na tela (F3 liga/desliga) e CSV opcional
+    medidor = MedidorQuadros(arquivo_csv=args.csv)
+
     # Loop principal do programa
     while True:
+        medidor.iniciar_quadro()
         for event in pygame.event.get():
+            medidor.tratar_evento(event)
             if event.type == pygame.QUIT:
+                medidor.fechar()
                 pygame.quit()
                 quit()
 
+        medidor.marcar("eventos")
+
         # Rotação do objeto ao longo do tempo para melhor visualização
         # glRotatef(angulo, x, y, z)
         glRotatef(1, 3, 1, 1) # Gira 1 grau a cada frame nos eixos x, y, z
@@ -107,10 +131,14 @@ def main():
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
         # Chama a função que desenha o cubo
-        desenha_cubo()
+        desenha_cubo(medidor)
+        medidor.desenhar_painel()
+        medidor.marcar("render")
 
         # Atualiza a tela
         pygame.display.flip() # Troca os buffers (double buffering)
+        medidor.marcar("swap")
+        medidor.finalizar_quadro()
         pygame.time.wait(10) # Pequena pausa para controlar a velocidade de rotação
 
 
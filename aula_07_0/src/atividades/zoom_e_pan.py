@@ -1,49 +1,16 @@
 # visualizador_completo.py
+import os
+import sys
+
 import pygame
 from pygame.locals import *
 from OpenGL.GL import *
 from OpenGL.GLUT import *
 import numpy as np
 
-# --- Funções de Quatérnios (traduzidas) ---
-
-def normalizar(vetor):
-    """Normaliza um vetor."""
-    norma = np.linalg.norm(vetor)
-    if norma == 0:
-        return vetor
-    return vetor / norma
-
-def quaternio_de_eixo_angulo(eixo, angulo):
-    """Cria um quatérnio a partir de um eixo e ângulo."""
-    eixo = normalizar(eixo)
-    meio_angulo = angulo / 2.0
-    w = np.cos(meio_angulo)
-    x, y, z = eixo * np.sin(meio_angulo)
-    return np.array([w, x, y, z])
-
-def multiplicar_quat(q1, q2):
-    """Multiplica dois quatérnios."""
-    w1, x1, y1, z1 = q1
-    w2, x2, y2, z2 = q2
-    w = w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2
-    x = w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2
-    y = w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2
-    z = w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
-    return np.array([w, x, y, z])
-
-def quat_para_matriz(q):
-    """Converte um quatérnio para uma matriz de rotação 4x4."""
-    w, x, y, z = q
-    xx, yy, zz = x*x, y*y, z*z
-    xy, xz, yz = x*y, x*z, y*z
-    wx, wy, wz = w*x, w*y, w*z
-    return np.array([
-        [1 - 2*(yy + zz), 2*(xy - wz),     2*(xz + wy),     0],
-        [2*(xy + wz),     1 - 2*(xx + zz), 2*(yz - wx),     0],
-        [2*(xz - wy),     2*(yz + wx),     1 - 2*(xx + yy), 0],
-        [0,               0,               0,               1]
-    ], dtype=np.float32)
+# O módulo de quatérnios fica na pasta src, um nível acima
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from quaternios import acumular_rotacao, normalizar, quat_para_matriz, quaternio_de_eixo_angulo
 
 # --- Funções do Trackball (traduzidas) ---
 
@@ -70,6 +37,8 @@ class VisualizadorAvancado:
         self.rastreando_rotacao = False
         self.ultima_pos_rotacao = None
         self.rotacao_atual = np.array([1.0, 0.0, 0.0, 0.0]) # Identidade
+        self.passos_sem_normalizar = 0 # Composições desde a última renormalização
+        self.matriz_rotacao = np.empty((4, 4), dtype=np.float32) # Buffer reaproveitado a cada quadro
 
         # Panorâmica (Pan)
         self.rastreando_pan = False
@@ -117,7 +86,7 @@ class VisualizadorAvancado:
         glTranslatef(self.vetor_pan[0], self.vetor_pan[1], self.nivel_zoom)
 
         # 2. Aplica a rotação do trackball (transformação do modelo)
-        matriz_rotacao = quat_para_matriz(self.rotacao_atual)
+        matriz_rotacao = quat_para_matriz(self.rotacao_atual, out=self.matriz_rotacao)
         glMultMatrixf(matriz_rotacao.T)
 
         # 3. Desenha o objeto
@@ -162,7 +131,8 @@ class VisualizadorAvancado:
         eixo = np.cross(self.ultima_pos_rotacao, pos_atual)
         angulo = np.arccos(np.dot(self.ultima_pos_rotacao, pos_atual))
         delta_rotacao = quaternio_de_eixo_angulo(eixo, angulo * 2.0)
-        self.rotacao_atual = multiplicar_quat(delta_rotacao, self.rotacao_atual)
+        self.passos_sem_normalizar = acumular_rotacao(
+            delta_rotacao, self.rotacao_atual, self.passos_sem_normalizar)
         self.ultima_pos_rotacao = pos_atual
 
     def processar_pan(self, evento):
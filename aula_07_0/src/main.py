@@ -1,52 +1,17 @@
+import argparse
+import os
+import sys
+
 import pygame
 from pygame.locals import *
 from OpenGL.GL import *
 from OpenGL.GLUT import *
 import numpy as np
 
-# --- Funções de Quatérnios ---
-
-def normalizar(vetor):
-    """Normaliza um vetor."""
-    norma = np.linalg.norm(vetor) # Calcula a norma (magnitude) do vetor
-    if norma == 0:
-        return vetor
-    return vetor / norma
-
-def quaternio_de_eixo_angulo(eixo, angulo):
-    """Cria um quatérnio a partir de um eixo e ângulo."""
-    eixo = normalizar(eixo)
-    meio_angulo = angulo / 2.0
-    w = np.cos(meio_angulo) # Componente escalar do quatérnio
-    x, y, z = eixo * np.sin(meio_angulo) # Componentes vetoriais do quatérnio
-    return np.array([w, x, y, z])
-
-def multiplicar_quat(q1, q2):
-    """Multiplica dois quatérnios."""
-    w1, x1, y1, z1 = q1
-    w2, x2, y2, z2 = q2
-    w = w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2
-    x = w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2
-    y = w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2
-    z = w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
-    return np.array([w, x, y, z])
-
-def quat_para_matriz(q):
-    """Converte um quatérnio para uma matriz de rotação 4x4."""
-    w, x, y, z = q
-    # Pré-calcular para eficiência
-    # Isso ajuda a evitar cálculos repetidos na matriz
-    # Os quadros dos componentes são usados várias vezes
-    xx, yy, zz = x*x, y*y, z*z
-    xy, xz, yz = x*y, x*z, y*z
-    wx, wy, wz = w*x, w*y, w*z
-
-    return np.array([
-        [1 - 2*(yy + zz), 2*(xy - wz),     2*(xz + wy),     0],
-        [2*(xy + wz),     1 - 2*(xx + zz), 2*(yz - wx),     0],
-        [2*(xz - wy),     2*(yz + wx),     1 - 2*(xx + yy), 0],
-        [0,               0,               0,               1]
-    ], dtype=np.float32)
+from quaternios import acumular_rotacao, normalizar, quat_para_matriz, quaternio_de_eixo_angulo
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "comum"))
+from instrumentacao import MedidorQuadros
 
 # --- Funções do Trackball ---
 
@@ -71,16 +36,36 @@ def projetar_na_esfera(x, y, largura, altura):
 
     return np.array([coord_x, coord_y, coord_z])
 
+def vertices_gerados(desenhar):
+    """
+    Chama desenhar() medindo quantos vértices o OpenGL recebeu.
+
+    Para geometria gerada fora do programa (glutSolidTeapot), que não dá
+    para contar pelos arrays enviados. Usa a consulta GL_PRIMITIVES_GENERATED
+    e conta 3 vértices por primitiva (o GLUT desenha o bule com triângulos).
+    """
+    consulta = int(glGenQueries(1)[0])
+    glBeginQuery(GL_PRIMITIVES_GENERATED, consulta)
+    desenhar()
+    glEndQuery(GL_PRIMITIVES_GENERATED)
+    primitivas = int(glGetQueryObjectuiv(consulta, GL_QUERY_RESULT))
+    glDeleteQueries(1, [consulta])
+    return 3 * primitivas
+
 # --- Classe Principal ---
 
 class VisualizadorTrackball:
-    def __init__(self):
+    def __init__(self, arquivo_csv=None):
         self.largura, self.altura = 800, 600
         self.rastreando = False  # Indica se o mouse está sendo rastreado
         self.ultima_posicao = None  # Última posição do mouse na esfera
 
         # Quatérnio que armazena a orientação atual do objeto
         self.rotacao_atual = np.array([1.0, 0.0, 0.0, 0.0]) # Identidade
+        self.passos_sem_normalizar = 0 # Composições desde a última renormalização
+        self.matriz_rotacao = np.empty((4, 4), dtype=np.float32) # Buffer reaproveitado a cada quadro
+        self.medidor = MedidorQuadros(arquivo_csv=arquivo_csv) # Tempos por quadro (painel F3 e CSV)
+        self.vertices_bule = None # Medidos no primeiro quadro (o bule não muda)
 
         # Inicializa Pygame, GLUT e OpenGL
         pygame.init()
@@ -126,21 +111,26 @@ class VisualizadorTrackball:
         glPushMatrix() # Salva a matriz atual de modelagem
 
         # Aplica a rotação do trackball a partir do quatérnio
-        matriz_rotacao = quat_para_matriz(self.rotacao_atual)
+        matriz_rotacao = quat_para_matriz(self.rotacao_atual, out=self.matriz_rotacao)
         glMultMatrixf(matriz_rotacao.T) # OpenGL espera a matriz transposta
 
         # Desenha o bule de chá
-        glutSolidTeapot(2.5)
-
+        if self.vertices_bule is None:
+            self.vertices_bule = vertices_gerados(lambda: glutSolidTeapot(2.5))
+        else:
+            glutSolidTeapot(2.5)
+        self.medidor.contar_desenho(self.vertices_bule)
 
         glPopMatrix() # Restaura a matriz de modelagem
-        pygame.display.flip() # Atualiza a tela
 
     def executar(self):
         """Loop principal do programa."""
+        medidor = self.medidor
         rodando = True
         while rodando:
+            medidor.iniciar_quadro()
             for evento in pygame.event.get():
+                medidor.tratar_evento(evento)
                 if evento.type == pygame.QUIT:
                     rodando = False
                 elif evento.type == pygame.MOUSEBUTTONDOWN:
@@ -169,14 +159,28 @@ class VisualizadorTrackball:
                         delta_rotacao = quaternio_de_eixo_angulo(eixo, angulo * 2.0) # Fator de sensibilidade
 
                         # Compõe a nova rotação com a orientação atual
-                        self.rotacao_atual = multiplicar_quat(delta_rotacao, self.rotacao_atual)
+                        self.passos_sem_normalizar = acumular_rotacao(
+                            delta_rotacao, self.rotacao_atual, self.passos_sem_normalizar)
 
                         self.ultima_posicao = posicao_atual
 
+            medidor.marcar("eventos")
+
             self.desenhar_cena()
+            medidor.desenhar_painel()
+            medidor.marcar("render")
+
+            pygame.display.flip() # Atualiza a tela
+            medidor.marcar("swap")
+            medidor.finalizar_quadro()
 
+        medidor.fechar()
         pygame.quit()
 
 if __name__ == '__main__':
-    visualizador = VisualizadorTrackball()
+    parser = argparse.ArgumentParser(description="Trackball com Quatérnios")
+    parser.add_argument("--csv", help="Grava os tempos de cada quadro neste arquivo CSV")
+    args = parser.parse_args()
+
+    visualizador = VisualizadorTrackball(args.csv)
     visualizador.executar()
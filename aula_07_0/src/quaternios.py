@@ -0,0 +1,167 @@
+import numpy as np
+
+# --- Funções de Quatérnios (vetorizadas) ---
+#
+# Todas as funções aceitam um único quatérnio (array (4,), na ordem w, x, y, z)
+# ou um lote de quatérnios (array (N, 4)). Com lotes, milhares de orientações
+# são processadas de uma vez, sem laço em Python.
+
+# Depois de quantas composições a orientação acumulada deve ser renormalizada.
+# Erros de arredondamento fazem a norma do quatérnio se afastar de 1 aos poucos.
+PASSOS_RENORMALIZACAO = 64
+
+
+def normalizar(vetor):
+    """Normaliza um vetor (ou cada linha de um array (N, k)). Vetores nulos ficam nulos."""
+    vetor = np.asarray(vetor, dtype=np.float64)
+    norma = np.linalg.norm(vetor, axis=-1, keepdims=True) # Calcula a norma (magnitude) do vetor
+    return np.divide(vetor, norma, out=np.zeros_like(vetor), where=norma != 0)
+
+
+def renormalizar(q, out=None):
+    """
+    Traz os quatérnios de volta para a norma 1.
+
+    Args:
+        q: Array (4,) ou (N, 4)
+        out: Array opcional para o resultado (pode ser o próprio q)
+    """
+    q = np.asarray(q)
+    norma = np.sqrt(np.sum(q * q, axis=-1, keepdims=True))
+    # A divisão pula as linhas de norma 0: elas ficam com o valor de q (nulas)
+    if out is None:
+        out = np.zeros_like(q)
+    elif out is not q:
+        out[...] = q
+    np.divide(q, norma, out=out, where=norma != 0)
+    return out
+
+
+def acumular_rotacao(delta, orientacao, passos_sem_normalizar):
+    """
+    Compõe delta * orientacao no lugar, renormalizando a cada PASSOS_RENORMALIZACAO composições.
+
+    Args:
+        delta: Quatérnio (4,) da rotação incremental
+        orientacao: Quatérnio (4,) acumulado, alterado no lugar
+        passos_sem_normalizar: Composições desde a última renormalização
+
+    Returns:
+        O novo número de composições sem renormalizar (guardar para a próxima chamada)
+    """
+    multiplicar_quat(delta, orientacao, out=orientacao)
+    passos_sem_normalizar += 1
+    if passos_sem_normalizar >= PASSOS_RENORMALIZACAO:
+        renormalizar(orientacao, out=orientacao)
+        passos_sem_normalizar = 0
+    return passos_sem_normalizar
+
+
+def quaternio_de_eixo_angulo(eixo, angulo):
+    """Cria quatérnios a partir de eixos (…, 3) e ângulos (…) em radianos."""
+    eixo = normalizar(eixo)
+    meio_angulo = np.asarray(angulo, dtype=np.float64) / 2.0
+
+    q = np.empty(eixo.shape[:-1] + (4,), dtype=np.float64)
+    q[..., 0] = np.cos(meio_angulo) # Componente escalar do quatérnio
+    q[..., 1:] = eixo * np.sin(meio_angulo)[..., None] # Componentes vetoriais do quatérnio
+    return q
+
+
+def multiplicar_quat(q1, q2, out=None):
+    """
+    Multiplica quatérnios (produto de Hamilton), elemento a elemento.
+
+    q1 e q2 podem ter formatos (4,) ou (N, 4); um quatérnio único é
+    combinado com todos os do lote (broadcast).
+    """
+    q1 = np.asarray(q1)
+    q2 = np.asarray(q2)
+    w1, x1, y1, z1 = q1[..., 0], q1[..., 1], q1[..., 2], q1[..., 3]
+    w2, x2, y2, z2 = q2[..., 0], q2[..., 1], q2[..., 2], q2[..., 3]
+
+    if out is None:
+        formato = np.broadcast_shapes(q1.shape, q2.shape)
+        out = np.empty(formato, dtype=np.result_type(q1, q2))
+
+    # Os componentes são calculados antes de escrever em out (que pode ser q1 ou q2)
+    w = w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2
+    x = w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2
+    y = w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2
+    z = w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
+    out[..., 0] = w
+    out[..., 1] = x
+    out[..., 2] = y
+    out[..., 3] = z
+    return out
+
+
+def quat_para_matriz(q, out=None):
+    """
+    Converte quatérnios para matrizes de rotação 4x4.
+
+    Args:
+        q: Array (4,) ou (N, 4) de quatérnios unitários
+        out: Buffer opcional (4, 4) ou (N, 4, 4) float32, reaproveitado a cada quadro
+
+    Returns:
+        Matriz (4, 4) ou pilha (N, 4, 4) float32
+    """
+    q = np.asarray(q)
+    if out is None:
+        out = np.empty(q.shape[:-1] + (4, 4), dtype=np.float32)
+
+    w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    # Pré-calcular os produtos, que são usados várias vezes na matriz
+    xx, yy, zz = x*x, y*y, z*z
+    xy, xz, yz = x*y, x*z, y*z
+    wx, wy, wz = w*x, w*y, w*z
+
+    out[..., 0, 0] = 1 - 2*(yy + zz)
+    out[..., 0, 1] = 2*(xy - wz)
+    out[..., 0, 2] = 2*(xz + wy)
+    out[..., 1, 0] = 2*(xy + wz)
+    out[..., 1, 1] = 1 - 2*(xx + zz)
+    out[..., 1, 2] = 2*(yz - wx)
+    out[..., 2, 0] = 2*(xz - wy)
+    out[..., 2, 1] = 2*(yz + wx)
+    out[..., 2, 2] = 1 - 2*(xx + yy)
+    out[..., :3, 3] = 0
+    out[..., 3, :3] = 0
+    out[..., 3, 3] = 1
+    return out
+
+
+def _alinhar_hemisferio(q1, q2):
+    """Inverte q2 onde o produto escalar é negativo, para interpolar pelo caminho mais curto."""
+    q1 = np.asarray(q1, dtype=np.float64)
+    q2 = np.asarray(q2, dtype=np.float64)
+    dot = np.sum(q1 * q2, axis=-1)
+    q2 = np.where((dot < 0)[..., None], -q2, q2)
+    return q1, q2, np.abs(dot)
+
+
+def nlerp(q1, q2, t):
+    """Interpolação linear normalizada: barata, mas a velocidade angular não é constante."""
+    q1, q2, _ = _alinhar_hemisferio(q1, q2)
+    t = np.asarray(t, dtype=np.float64)[..., None]
+    return renormalizar(q1 + (q2 - q1) * t)
+
+
+def slerp(q1, q2, t):
+    """
+    Interpolação esférica entre quatérnios (velocidade angular constante).
+
+    Quando os quatérnios são quase iguais, usa nlerp para evitar divisão por sin(θ) ≈ 0.
+    """
+    q1, q2, dot = _alinhar_hemisferio(q1, q2)
+    t = np.asarray(t, dtype=np.float64)
+
+    theta = np.arccos(np.clip(dot, -1.0, 1.0))
+    sin_theta = np.sin(theta)
+    quase_iguais = sin_theta < 1e-6
+    sin_theta = np.where(quase_iguais, 1.0, sin_theta)
+
+    peso1 = np.where(quase_iguais, 1.0 - t, np.sin((1.0 - t) * theta) / sin_theta)
+    peso2 = np.where(quase_iguais, t, np.sin(t * theta) / sin_theta)
+    return renormalizar(q1 * peso1[..., None] + q2 * peso2[..., None])
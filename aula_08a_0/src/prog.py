@@ -1,9 +1,19 @@
+import argparse
+import ctypes
+import os
+import sys
+
 import pygame
 from pygame.locals import *
 from OpenGL.GL import *
 from OpenGL.GLU import *
 import numpy as np
-import math
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "comum"))
+from instrumentacao import MedidorQuadros
+from malhas_parametricas import malha
+from pilha_matrizes import MatrixStack, look_at, ortografica, perspectiva
+from texto_hud import TextoHUD
 
 # ========== CONFIGURAÇÕES ==========
 LARGURA_JANELA, ALTURA_JANELA = 1000, 700
@@ -22,23 +32,72 @@ COR_MAGENTA = (1.0, 0.2, 1.0)
 
 # ========== GEOMETRIAS 3D ==========
 class GeometriaBasica:
-    """Classe base para geometrias 3D."""
+    """
+    Classe base para geometrias 3D.
+
+    Os dados ficam na GPU: um buffer de vértices intercalado (posição + cor)
+    e um buffer de índices com as arestas, enviados uma vez em
+    _criar_buffers(). Desenhar é uma única chamada glDrawElements.
+    """
     def __init__(self, nome):
         self.nome = nome
         self.vertices = np.array([], dtype=np.float32)
         self.arestas = []
         self.cores_vertices = []
-
-    def desenhar(self):
-        """Desenha a geometria usando wireframe."""
-        glBegin(GL_LINES)
-        for i, aresta in enumerate(self.arestas):
-            indice1, indice2 = aresta
-            cor = self.cores_vertices[i % len(self.cores_vertices)]
-            glColor3fv(cor)
-            glVertex3fv(self.vertices[indice1])
-            glVertex3fv(self.vertices[indice2])
-        glEnd()
+        self.vbo = None  # Vertex Buffer Object (posição + cor)
+        self.ibo = None  # Index Buffer Object (pares de índices das arestas)
+        self.total_indices = 0
+
+    def _criar_buffers(self):
+        """
+        Envia a geometria para a GPU. Chamado no fim do __init__ de cada figura.
+
+        A cor é de cada aresta, não de cada vértice: cada aresta vira dois
+        vértices (posição, cor) e os pares repetidos são unidos com np.unique.
+        """
+        arestas = np.asarray(self.arestas, dtype=np.uint32).reshape(-1, 2)
+        cores = np.asarray(self.cores_vertices, dtype=np.float32)
+        cor_da_aresta = cores[np.arange(len(arestas)) % len(cores)]
+
+        # (2 * arestas, 6): [x, y, z, r, g, b] para as duas pontas de cada aresta
+        pontas = np.empty((len(arestas), 2, 6), dtype=np.float32)
+        pontas[:, :, :3] = self.vertices[arestas]
+        pontas[:, :, 3:] = cor_da_aresta[:, None, :]
+        intercalado, indices = np.unique(pontas.reshape(-1, 6), axis=0, return_inverse=True)
+
+        intercalado = np.ascontiguousarray(intercalado, dtype=np.float32)
+        indices = indices.astype(np.uint32).ravel()
+        self.total_indices = len(indices)
+
+        self.vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, intercalado.nbytes, intercalado, GL_STATIC_DRAW)
+
+        self.ibo = glGenBuffers(1)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+    def desenhar(self, medidor):
+        """Desenha a geometria usando wireframe (uma chamada glDrawElements, contada no medidor)."""
+        passo = 6 * 4  # 6 floats de 4 bytes por vértice
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, passo, ctypes.c_void_p(0))
+        glColorPointer(3, GL_FLOAT, passo, ctypes.c_void_p(3 * 4))
+
+        glDrawElements(GL_LINES, self.total_indices, GL_UNSIGNED_INT, None)
+        medidor.contar_desenho(self.total_indices)
+
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
 
 class Cubo(GeometriaBasica):
@@ -60,6 +119,7 @@ class Cubo(GeometriaBasica):
             COR_VERMELHO, COR_VERDE, COR_AZUL, COR_AMARELO,
             COR_CIANO, COR_MAGENTA, COR_BRANCO
         ]
+        self._criar_buffers()
 
 
 class Piramide(GeometriaBasica):
@@ -82,6 +142,7 @@ class Piramide(GeometriaBasica):
         self.cores_vertices = [
             COR_AMARELO, COR_VERMELHO, COR_VERDE, COR_AZUL, COR_CIANO
         ]
+        self._criar_buffers()
 
 
 class Octaedro(GeometriaBasica):
@@ -107,6 +168,7 @@ class Octaedro(GeometriaBasica):
             COR_MAGENTA, COR_CIANO, COR_VERDE, COR_AMARELO,
             COR_AZUL, COR_VERMELHO
         ]
+        self._criar_buffers()
 
 
 class Cilindro(GeometriaBasica):
@@ -114,54 +176,32 @@ class Cilindro(GeometriaBasica):
     def __init__(self, raio=1.0, altura=2.0, segmentos=16):
         super().__init__("Cilindro")
 
-        # Criar vértices
-        vertices_lista = []
-        for i in range(segmentos):
-            angulo = 2 * math.pi * i / segmentos
-            x = raio * math.cos(angulo)
-            z = raio * math.sin(angulo)
-            vertices_lista.append([x, altura/2, z])      # Topo
-            vertices_lista.append([x, -altura/2, z])     # Base
-
-        self.vertices = np.array(vertices_lista, dtype=np.float32)
-
-        # Criar arestas
-        arestas_lista = []
-        for i in range(segmentos):
-            idx_atual = (i * 2) % (segmentos * 2)
-            idx_prox = ((i + 1) * 2) % (segmentos * 2)
-
-            # Arestas circulares no topo e base
-            arestas_lista.append((idx_atual, idx_prox))
-            arestas_lista.append((idx_atual + 1, idx_prox + 1))
-            # Arestas verticais
-            arestas_lista.append((idx_atual, idx_atual + 1))
-
-        self.arestas = tuple(arestas_lista)
+        # Anéis do topo e da base + arestas verticais, gerados sem laços (malha em cache)
+        malha_cilindro = malha("cilindro", raio=raio, altura=altura, segmentos=segmentos, tampas=False)
+        self.vertices = malha_cilindro.posicoes
+        self.arestas = malha_cilindro.arestas
 
         # Cores alternadas
         self.cores_vertices = [COR_CIANO, COR_MAGENTA]
+        self._criar_buffers()
 
 
 # ========== FUNÇÕES DE RENDERIZAÇÃO ==========
 def configurar_projecao():
-    """Configura a matriz de projeção."""
+    """Configura a matriz de projeção (calculada na CPU e enviada de uma vez)."""
     global MODO_PROJECAO
 
-    glMatrixMode(GL_PROJECTION)
-    glLoadIdentity()
-
     if MODO_PROJECAO == "PERSPECTIVA":
-        gluPerspective(45, (LARGURA_JANELA / ALTURA_JANELA), 0.1, 50.0)
-    elif MODO_PROJECAO == "ORTOGRAFICA":
-        glOrtho(-4, 4, -3, 3, 0.1, 50.0)
+        projecao = perspectiva(45, (LARGURA_JANELA / ALTURA_JANELA), 0.1, 50.0)
+    else:
+        projecao = ortografica(-4, 4, -3, 3, 0.1, 50.0)
 
+    glMatrixMode(GL_PROJECTION)
+    glLoadTransposeMatrixf(projecao)
     glMatrixMode(GL_MODELVIEW)
-    glLoadIdentity()
-    gluLookAt(0, 0, -8, 0, 0, 0, 0, 1, 0)
 
 
-def desenhar_grid(tamanho=5, linhas=10):
+def desenhar_grid(medidor, tamanho=5, linhas=10):
     """Desenha um grid de referência no chão."""
     glColor3fv((0.4, 0.4, 0.4))
     glBegin(GL_LINES)
@@ -173,9 +213,10 @@ def desenhar_grid(tamanho=5, linhas=10):
         glVertex3f(coord, -2.5, -tamanho)
         glVertex3f(coord, -2.5, tamanho)
     glEnd()
+    medidor.contar_desenho(4 * (2 * linhas + 1))
 
 
-def desenhar_eixos():
+def desenhar_eixos(medidor):
     """Desenha os eixos X, Y, Z para referência."""
     glLineWidth(2)
     glBegin(GL_LINES)
@@ -196,22 +237,22 @@ def desenhar_eixos():
     glVertex3f(0, 0, 3)
 
     glEnd()
+    medidor.contar_desenho(6)
     glLineWidth(1)
 
 
-def mostrar_informacoes(fonte, tela_pygame, modo, figura):
-    """Exibe informações na tela usando pygame."""
-    texto_modo = f"Modo: {modo} | Figura: {figura}"
-    texto_controle = "P: Alternar Projeção | SETAS: Trocar Figura"
-    texto_dica = "Observe a diferença de profundidade entre as projeções!"
-
-    surf_modo = fonte.render(texto_modo, True, (255, 255, 255))
-    surf_controle = fonte.render(texto_controle, True, (200, 200, 200))
-    surf_dica = fonte.render(texto_dica, True, (100, 200, 255))
+def mostrar_informacoes(hud, medidor, modo, figura):
+    """
+    Exibe informações na tela.
 
-    tela_pygame.blit(surf_modo, (10, 10))
-    tela_pygame.blit(surf_controle, (10, 35))
-    tela_pygame.blit(surf_dica, (10, 60))
+    O texto vira quads texturizados (TextoHUD): só é refeito quando muda e
+    é desenhado com uma única chamada por quadro.
+    """
+    hud.escrever("modo", f"Modo: {modo} | Figura: {figura}", 10, 10)
+    hud.escrever("controle", "P: Alternar Projeção | SETAS: Trocar Figura", 10, 35, (200, 200, 200))
+    hud.escrever("dica", "Observe a diferença de profundidade entre as projeções!", 10, 60, (100, 200, 255))
+    hud.desenhar(LARGURA_JANELA, ALTURA_JANELA)
+    medidor.contar_desenho(hud.total_vertices)
 
 
 # ========== FUNÇÃO PRINCIPAL ==========
@@ -219,11 +260,14 @@ def principal():
     """Função principal - Loop de renderização."""
     global MODO_PROJECAO, FIGURA_ATUAL
 
+    parser = argparse.ArgumentParser(description="Visualizador de Projeções 3D")
+    parser.add_argument("--csv", help="Grava os tempos de cada quadro neste arquivo CSV")
+    args = parser.parse_args()
+
     pygame.init()
-    tela_pygame = pygame.display.set_mode((LARGURA_JANELA, ALTURA_JANELA),
-                                          DOUBLEBUF | OPENGL)
+    pygame.display.set_mode((LARGURA_JANELA, ALTURA_JANELA), DOUBLEBUF | OPENGL)
     pygame.display.set_caption("Visualizador de Projeções 3D")
-    fonte = pygame.font.Font(None, 24)
+    hud = TextoHUD(pygame.font.Font(None, 24))
 
     glClearColor(0.1, 0.1, 0.15, 1.0)
     glEnable(GL_DEPTH_TEST)
@@ -232,6 +276,10 @@ def principal():
 
     configurar_projecao()
 
+    # Câmera (a mesma de gluLookAt) e pilha de matrizes do modelo
+    camera = look_at(0, 0, -8, 0, 0, 0, 0, 1, 0)
+    pilha = MatrixStack()
+
     # Criar as figuras
     figuras = {
         "cubo": Cubo(),
@@ -242,6 +290,7 @@ def principal():
 
     rotacao_x, rotacao_y, rotacao_z = 0, 0, 0
     relogio = pygame.time.Clock()
+    medidor = MedidorQuadros(arquivo_csv=args.csv)  # Tempos por quadro (painel e CSV)
     executando = True
 
     print("=" * 60)
@@ -252,11 +301,14 @@ def principal():
     print("Controles:")
     print("  P - Alternar entre Projeção Perspectiva e Ortográfica")
     print("  <-- --> - Trocar figura (Cubo, Pirâmide, Octaedro, Cilindro)")
+    print("  F3 - Painel de desempenho")
     print("  ESC - Sair")
     print("=" * 60)
 
     while executando:
+        medidor.iniciar_quadro()
         for evento in pygame.event.get():
+            medidor.tratar_evento(evento)
             if evento.type == pygame.QUIT:
                 executando = False
 
@@ -283,6 +335,8 @@ def principal():
                 if evento.key == pygame.K_ESCAPE:
                     executando = False
 
+        medidor.marcar("eventos")
+
         # Atualizar rotações
         rotacao_x = (rotacao_x + VELOCIDADE_ROTACAO * 0.5) % 360
         rotacao_y = (rotacao_y + VELOCIDADE_ROTACAO * 0.8) % 360
@@ -292,46 +346,41 @@ def principal():
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
         # Renderizar
-        glPushMatrix()
+        pilha.load(camera)
+        pilha.load_gl()
 
         # Grid de referência
-        desenhar_grid()
+        desenhar_grid(medidor)
 
         # Eixos de referência
-        desenhar_eixos()
+        desenhar_eixos(medidor)
 
-        # Aplicar transformações
-        glTranslatef(0, -0.5, 0)
-        glRotatef(rotacao_x, 1, 0, 0)
-        glRotatef(rotacao_y, 0, 1, 0)
-        glRotatef(rotacao_z, 0, 0, 1)
+        # Aplicar transformações (compostas na CPU, enviadas com uma chamada)
+        pilha.push()
+        pilha.translate(0, -0.5, 0)
+        pilha.rotate(rotacao_x, 1, 0, 0)
+        pilha.rotate(rotacao_y, 0, 1, 0)
+        pilha.rotate(rotacao_z, 0, 0, 1)
+        pilha.load_gl()
 
         # Desenhar figura atual
-        figuras[FIGURA_ATUAL].desenhar()
-
-        glPopMatrix()
+        figuras[FIGURA_ATUAL].desenhar(medidor)
 
-        # Renderizar informações 2D
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        glOrtho(0, LARGURA_JANELA, ALTURA_JANELA, 0, -1, 1)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
+        pilha.pop()
 
-        glDisable(GL_DEPTH_TEST)
-        mostrar_informacoes(fonte, tela_pygame, MODO_PROJECAO, FIGURA_ATUAL.upper())
-        glEnable(GL_DEPTH_TEST)
+        # Renderizar informações 2D (projeção ortográfica própria, estado preservado)
+        mostrar_informacoes(hud, medidor, MODO_PROJECAO, FIGURA_ATUAL.upper())
 
-        glPopMatrix()
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
+        medidor.desenhar_painel()
+        medidor.marcar("render")
 
         pygame.display.flip()
+        medidor.marcar("swap")
+        medidor.finalizar_quadro()
         relogio.tick(30)
 
+    medidor.fechar()
+    hud.liberar()
     pygame.quit()
 
 if __name__ == "__main__":
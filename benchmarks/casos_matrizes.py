@@ -0,0 +1,64 @@
+"""Casos de benchmark de TransformationMatrix (aula_02_0/src/transformacoes_matriciais.py)."""
+import numpy as np
+from transformacoes_matriciais import TransformationMatrix
+
+
+def _angulos(n):
+    return np.random.default_rng(0).random(n) * 2 * np.pi
+
+
+def fabrica_rotation_z(n):
+    # Ângulos distintos: mede a construção, não o acerto no memo
+    angulos = [float(a) for a in _angulos(n)]
+    return lambda: [TransformationMatrix.rotation_z(a) for a in angulos]
+
+
+def fabrica_rotation_z_repetida(n):
+    # Graus inteiros, como numa animação: quase tudo vem do memo
+    angulos = [np.radians(i % 360) for i in range(n)]
+    return lambda: [TransformationMatrix.rotation_z(a) for a in angulos]
+
+
+def fabrica_rotations_z(n):
+    angulos = _angulos(n)
+    return lambda: TransformationMatrix.rotations_z(angulos)
+
+
+def composicao(n):
+    T = TransformationMatrix.translation(1, 2, 3)
+    R = TransformationMatrix.rotation_z(0.5)
+    S = TransformationMatrix.scale(2, 2, 2)
+    return lambda: [(T * R * S).matrix for _ in range(n)]
+
+
+def composicao_pilhas(n):
+    angulos = _angulos(n)
+    offsets = np.random.default_rng(1).random((n, 3))
+    return lambda: TransformationMatrix.compose(
+        TransformationMatrix.translations(offsets),
+        TransformationMatrix.rotations_z(angulos),
+        TransformationMatrix.scales(np.ones(n)))
+
+
+def transform_point(n):
+    M = TransformationMatrix.translation(1, 0, 0) * TransformationMatrix.rotation_z(0.5)
+    pontos = np.random.default_rng(0).random((n, 3))
+    return lambda: [M.transform_point(p) for p in pontos]
+
+
+def transform_points(n):
+    M = TransformationMatrix.translation(1, 0, 0) * TransformationMatrix.rotation_z(0.5)
+    pontos = np.random.default_rng(0).random((n, 3))
+    saida = np.empty_like(pontos)
+    return lambda: M.transform_points(pontos, out=saida)
+
+
+CASOS = {
+    "matrizes.fabrica_rotation_z": fabrica_rotation_z,
+    "matrizes.fabrica_rotation_z_repetida": fabrica_rotation_z_repetida,
+    "matrizes.fabrica_rotations_z": fabrica_rotations_z,
+    "matrizes.composicao": composicao,
+    "matrizes.composicao_pilhas": composicao_pilhas,
+    "matrizes.transform_point": transform_point,
+    "matrizes.transform_points": transform_points,
+}
@@ -0,0 +1,46 @@
+"""Casos de benchmark do módulo de quatérnios (aula_07_0/src/quaternios.py)."""
+import numpy as np
+from quaternios import multiplicar_quat, quat_para_matriz, quaternio_de_eixo_angulo, slerp
+
+
+def _quaternios(n, semente=0):
+    rng = np.random.default_rng(semente)
+    return quaternio_de_eixo_angulo(rng.standard_normal((n, 3)), rng.random(n) * np.pi)
+
+
+def de_eixo_angulo(n):
+    rng = np.random.default_rng(0)
+    eixos, angulos = rng.standard_normal((n, 3)), rng.random(n)
+    return lambda: quaternio_de_eixo_angulo(eixos, angulos)
+
+
+def multiplicar_um_a_um(n):
+    q1, q2 = _quaternios(n, 0), _quaternios(n, 1)
+    return lambda: [multiplicar_quat(a, b) for a, b in zip(q1, q2)]
+
+
+def multiplicar_lote(n):
+    q1, q2 = _quaternios(n, 0), _quaternios(n, 1)
+    saida = np.empty_like(q1)
+    return lambda: multiplicar_quat(q1, q2, out=saida)
+
+
+def para_matriz_lote(n):
+    q = _quaternios(n)
+    saida = np.empty((n, 4, 4), dtype=np.float32)
+    return lambda: quat_para_matriz(q, out=saida)
+
+
+def slerp_lote(n):
+    q1, q2 = _quaternios(n, 0), _quaternios(n, 1)
+    t = np.full(n, 0.3)
+    return lambda: slerp(q1, q2, t)
+
+
+CASOS = {
+    "quaternios.de_eixo_angulo": de_eixo_angulo,
+    "quaternios.multiplicar_um_a_um": multiplicar_um_a_um,
+    "quaternios.multiplicar_lote": multiplicar_lote,
+    "quaternios.para_matriz_lote": para_matriz_lote,
+    "quaternios.slerp_lote": slerp_lote,
+}
@@ -0,0 +1,69 @@
+"""Casos de benchmark da classe Vector3D (aula_02_0/src/vetor3d.py)."""
+import numpy as np
+from vetor3d import Vector3D, Vector3DArray
+
+
+def _dados(n):
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((n, 3)), rng.standard_normal((n, 3))
+
+
+def soma_objetos(n):
+    a, b = _dados(n)
+    lista_a = [Vector3D(*v) for v in a]
+    lista_b = [Vector3D(*v) for v in b]
+    return lambda: [u + v for u, v in zip(lista_a, lista_b)]
+
+
+def soma_in_place(n):
+    a, _ = _dados(n)
+    lista = [Vector3D(*v) for v in a]
+
+    def executar():
+        total = Vector3D()
+        for v in lista:
+            total += v
+        return total
+    return executar
+
+
+def cross_objetos(n):
+    a, b = _dados(n)
+    lista_a = [Vector3D(*v) for v in a]
+    lista_b = [Vector3D(*v) for v in b]
+    return lambda: [u.cross(v) for u, v in zip(lista_a, lista_b)]
+
+
+def normalize_objetos(n):
+    a, _ = _dados(n)
+    lista = [Vector3D(*v) for v in a]
+    return lambda: [v.normalize() for v in lista]
+
+
+def soma_array(n):
+    a, b = _dados(n)
+    array_a, array_b = Vector3DArray(a), Vector3DArray(b)
+    return lambda: array_a + array_b
+
+
+def cross_array(n):
+    a, b = _dados(n)
+    array_a, array_b = Vector3DArray(a), Vector3DArray(b)
+    return lambda: array_a.cross(array_b)
+
+
+def normalize_array(n):
+    a, _ = _dados(n)
+    array_a = Vector3DArray(a)
+    return lambda: array_a.normalize()
+
+
+CASOS = {
+    "vetores.soma_objetos": soma_objetos,
+    "vetores.soma_in_place": soma_in_place,
+    "vetores.cross_objetos": cross_objetos,
+    "vetores.normalize_objetos": normalize_objetos,
+    "vetores.soma_array": soma_array,
+    "vetores.cross_array": cross_array,
+    "vetores.normalize_array": normalize_array,
+}
@@ -0,0 +1,150 @@
+"""
+Executa os benchmarks do núcleo matemático (vetores, matrizes e quatérnios).
+
+Uso (a partir da raiz do repositório):
+
+    python benchmarks/executar.py --salvar-baseline     # grava o baseline.json desta máquina
+    python benchmarks/executar.py                       # roda (N = 1 e 1.000) e compara com ele
+    python benchmarks/executar.py --completo            # inclui N = 1.000.000
+    python benchmarks/executar.py --saida resultado.json
+    python benchmarks/executar.py --filtro quaternios --tamanhos 1 1000
+
+O resultado de cada caso é o melhor tempo (em segundos) de uma execução
+completa com N elementos. O baseline.json depende da máquina e não vai para
+o repositório (.gitignore): cada um grava o seu. O programa termina com código 1 se algum caso
+ficar mais lento que o baseline além do limite (--limite, padrão 25%).
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import timeit
+
+import numpy as np
+
+PASTA = os.path.dirname(os.path.abspath(__file__))
+RAIZ = os.path.dirname(PASTA)
+
+# Os módulos testados ficam nas pastas das aulas
+sys.path.insert(0, os.path.join(RAIZ, "aula_02_0", "src"))
+sys.path.insert(0, os.path.join(RAIZ, "aula_07_0", "src"))
+
+import casos_matrizes  # noqa: E402
+import casos_quaternios  # noqa: E402
+import casos_vetores  # noqa: E402
+
+TAMANHOS_PADRAO = (1, 1_000)
+TAMANHOS_COMPLETO = (1, 1_000, 1_000_000)
+BASELINE_PADRAO = os.path.join(PASTA, "baseline.json")
+
+
+def todos_os_casos():
+    casos = {}
+    for modulo in (casos_vetores, casos_matrizes, casos_quaternios):
+        casos.update(modulo.CASOS)
+    return casos
+
+
+def cronometrar(funcao, repeticoes=3):
+    """
+    Melhor tempo de uma chamada de `funcao`.
+
+    Chamadas rápidas são agrupadas (autorange, >= 0,2 s por medida) para
+    que a resolução do relógio não domine o resultado.
+    """
+    cronometro = timeit.Timer(funcao)
+    numero, tempo = cronometro.autorange()
+    if tempo > 1.0:
+        return tempo / numero
+    return min(cronometro.repeat(repeat=repeticoes, number=numero)) / numero
+
+
+def executar(tamanhos, filtro=None):
+    resultados = {}
+    for nome, preparar in todos_os_casos().items():
+        if filtro and filtro not in nome:
+            continue
+        for n in tamanhos:
+            chave = f"{nome}[n={n}]"
+            segundos = cronometrar(preparar(n))
+            resultados[chave] = segundos
+            print(f"{chave:<50}{segundos * 1e3:>14.4f} ms")
+    return resultados
+
+
+def metadados():
+    return {
+        "data": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "processador": platform.processor() or platform.machine(),
+    }
+
+
+def comparar(resultados, baseline, limite):
+    """Imprime a comparação com o baseline e retorna a lista de regressões."""
+    regressoes = []
+    print(f"\n{'caso':<50}{'baseline (ms)':>15}{'atual (ms)':>13}{'razão':>9}")
+    for chave, atual in resultados.items():
+        base = baseline.get(chave)
+        if base is None:
+            print(f"{chave:<50}{'-':>15}{atual * 1e3:>13.4f}{'novo':>9}")
+            continue
+        razao = atual / base
+        marca = ""
+        if razao > 1.0 + limite:
+            regressoes.append(chave)
+            marca = "  <-- REGRESSÃO"
+        print(f"{chave:<50}{base * 1e3:>15.4f}{atual * 1e3:>13.4f}{razao:>8.2f}x{marca}")
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks do núcleo matemático")
+    parser.add_argument("--tamanhos", type=int, nargs="+",
+                        help="Valores de N (padrão: 1 e 1000; com --completo, também 1000000)")
+    parser.add_argument("--completo", action="store_true", help="Inclui N = 1.000.000 (bem mais lento)")
+    parser.add_argument("--filtro", help="Roda só os casos cujo nome contém este texto")
+    parser.add_argument("--saida", help="Arquivo JSON para gravar os resultados")
+    parser.add_argument("--baseline", default=BASELINE_PADRAO)
+    parser.add_argument("--limite", type=float, default=0.25,
+                        help="Fração de aumento de tempo tolerada (0.25 = 25%%)")
+    parser.add_argument("--salvar-baseline", action="store_true",
+                        help="Grava os resultados como novo baseline em vez de comparar")
+    args = parser.parse_args()
+
+    tamanhos = args.tamanhos or (TAMANHOS_COMPLETO if args.completo else TAMANHOS_PADRAO)
+    resultados = executar(tamanhos, args.filtro)
+    documento = {"metadados": metadados(), "resultados": resultados}
+
+    if args.saida:
+        with open(args.saida, "w") as f:
+            json.dump(documento, f, indent=2)
+            f.write("\n")
+
+    if args.salvar_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(documento, f, indent=2)
+            f.write("\n")
+        print(f"\nBaseline gravado em {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nBaseline {args.baseline} não encontrado; use --salvar-baseline para criar.")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)["resultados"]
+    regressoes = comparar(resultados, baseline, args.limite)
+    if regressoes:
+        print(f"\n{len(regressoes)} caso(s) mais lentos que o baseline além de {args.limite:.0%}.")
+        return 1
+    print("\nNenhuma regressão em relação ao baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""
+Estatísticas de tempos de quadro (média, percentis, FPS).
+
+Sem dependência do OpenGL: usado tanto pelo modo offscreen quanto pela
+instrumentação das janelas.
+"""
+import numpy as np
+
+PERCENTIS = (50, 95, 99)
+
+
+def estatisticas(tempos_ms):
+    """
+    Resumo de uma série de tempos de quadro.
+
+    Args:
+        tempos_ms: Tempos em milissegundos
+
+    Returns:
+        dict com quadros, media, min, max, desvio, fps e p50/p95/p99 (ms)
+    """
+    tempos_ms = np.asarray(tempos_ms, dtype=np.float64)
+    if tempos_ms.size == 0:
+        return {"quadros": 0}
+    resumo = {
+        "quadros": int(tempos_ms.size),
+        "media": float(tempos_ms.mean()),
+        "min": float(tempos_ms.min()),
+        "max": float(tempos_ms.max()),
+        "desvio": float(tempos_ms.std()),
+    }
+    for percentil, valor in zip(PERCENTIS, np.percentile(tempos_ms, PERCENTIS)):
+        resumo[f"p{percentil}"] = float(valor)
+    resumo["fps"] = 1000.0 / resumo["media"] if resumo["media"] > 0 else float("inf")
+    return resumo
+
+
+def formatar_estatisticas(resumo):
+    """Uma linha de texto com o resumo de estatisticas()."""
+    if not resumo.get("quadros"):
+        return "nenhum quadro medido"
+    percentis = "  ".join(f"p{p} {resumo[f'p{p}']:.2f}" for p in PERCENTIS)
+    return (f"{resumo['quadros']} quadros: média {resumo['media']:.2f} ms ({resumo['fps']:.1f} FPS)  "
+            f"{percentis}  min {resumo['min']:.2f}  max {resumo['max']:.2f} ms")
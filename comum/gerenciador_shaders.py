@@ -0,0 +1,317 @@
+"""
+Gerenciador de programas de shader com cache.
+
+- Em memória: programas já linkados são reaproveitados pelo hash das fontes,
+  e cada estágio compilado (vertex, fragment) também, pelo hash da sua fonte.
+- Em disco: quando o driver suporta (GL_ARB_get_program_binary / OpenGL 4.1),
+  o binário do programa linkado é gravado e carregado com glProgramBinary nas
+  próximas execuções, sem compilar nem linkar. Se o binário não servir mais
+  (driver atualizado, GPU diferente), o programa é compilado das fontes.
+- Recarga automática (opcional): programas criados a partir de arquivos podem
+  ser vigiados; quando um arquivo muda, o programa é linkado de novo com o
+  estágio alterado recompilado e os outros vindos do cache. Um erro de
+  compilação mantém o programa antigo; o programa e o estágio substituídos
+  são apagados.
+
+Exemplo:
+    shaders = GerenciadorShaders()
+    programa = shaders.carregar_arquivos("vertex_shader.glsl", "fragment_shader.glsl", vigiar=True)
+    while ...:
+        shaders.verificar_alteracoes()   # barato: só compara mtimes
+        glUseProgram(programa.id)
+        glUniformMatrix4fv(programa.uniform("u_transform"), ...)
+"""
+import hashlib
+import os
+import struct
+import time
+
+from OpenGL.GL import *
+
+PASTA_CACHE_PADRAO = os.path.join(os.path.expanduser("~"), ".cache", "aulas_cg", "shaders")
+INTERVALO_VERIFICACAO = 0.5  # segundos entre verificações de arquivos alterados
+
+_NOMES_ESTAGIOS = {GL_VERTEX_SHADER: "vertex", GL_FRAGMENT_SHADER: "fragment"}
+
+
+class ErroShader(RuntimeError):
+    """Erro de compilação ou link de shader (a mensagem traz o log do driver)."""
+
+
+def _hash(*partes):
+    h = hashlib.sha256()
+    for parte in partes:
+        h.update(parte.encode() if isinstance(parte, str) else parte)
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def compile_shader(source, shader_type):
+    """Compila um estágio de shader e retorna o id; lança ErroShader em caso de erro."""
+    shader = glCreateShader(shader_type)
+    glShaderSource(shader, source)
+    glCompileShader(shader)
+    if not glGetShaderiv(shader, GL_COMPILE_STATUS):
+        log = glGetShaderInfoLog(shader).decode()
+        glDeleteShader(shader)
+        raise ErroShader(f"Erro na compilação do {_NOMES_ESTAGIOS.get(shader_type, 'shader')} shader: {log}")
+    return shader
+
+
+class ProgramaShader:
+    """
+    Programa linkado entregue pelo GerenciadorShaders.
+
+    Atributos:
+        id: Id do programa no OpenGL (muda quando o programa é recarregado)
+        fontes: dict tipo do estágio -> código-fonte atual
+    """
+
+    def __init__(self, id_programa, fontes, chave):
+        self.id = id_programa
+        self.fontes = dict(fontes)
+        self.arquivos = {}  # tipo do estágio -> (caminho, mtime_ns), só se vigiado
+        self._chave = chave  # Hash das fontes no GerenciadorShaders
+        self._uniforms = {}
+
+    def uniform(self, nome):
+        """Localização de um uniform (consultada uma vez por link)."""
+        local = self._uniforms.get(nome)
+        if local is None:
+            local = self._uniforms[nome] = glGetUniformLocation(self.id, nome)
+        return local
+
+    def _trocar(self, id_programa, fontes, chave):
+        self.id = id_programa
+        self.fontes = dict(fontes)
+        self._chave = chave
+        self._uniforms.clear()
+
+
+class GerenciadorShaders:
+    """
+    Cria e guarda programas de shader (veja a descrição do módulo).
+
+    Args:
+        pasta_cache: Onde gravar os binários dos programas (None desativa o cache em disco)
+    """
+
+    def __init__(self, pasta_cache=PASTA_CACHE_PADRAO):
+        self.pasta_cache = pasta_cache
+        self._programas = {}  # hash das fontes -> id do programa
+        self._usos = {}       # hash das fontes -> quantos ProgramaShader usam o programa
+        self._estagios = {}   # hash (tipo, fonte) -> id do shader compilado
+        self._vigiados = []
+        self._ultima_verificacao = 0.0
+        self._binarios = None  # Decidido no primeiro uso (precisa do contexto OpenGL)
+
+    # --- Criação ---
+
+    def programa(self, vertex_src, fragment_src):
+        """Programa a partir das fontes (memória -> binário em disco -> compilação)."""
+        fontes = {GL_VERTEX_SHADER: vertex_src, GL_FRAGMENT_SHADER: fragment_src}
+        chave, id_programa = self._obter(fontes)
+        return ProgramaShader(id_programa, fontes, chave)
+
+    def carregar_arquivos(self, caminho_vertex, caminho_fragment, vigiar=False):
+        """
+        Programa a partir de arquivos .glsl.
+
+        Args:
+            vigiar: Recompila o estágio alterado quando o arquivo mudar
+                (em verificar_alteracoes)
+        """
+        caminhos = {GL_VERTEX_SHADER: caminho_vertex, GL_FRAGMENT_SHADER: caminho_fragment}
+        fontes = {tipo: _ler(caminho) for tipo, caminho in caminhos.items()}
+        chave, id_programa = self._obter(fontes)
+        programa = ProgramaShader(id_programa, fontes, chave)
+        if vigiar:
+            programa.arquivos = {tipo: (caminho, os.stat(caminho).st_mtime_ns)
+                                 for tipo, caminho in caminhos.items()}
+            self._vigiados.append(programa)
+        return programa
+
+    def _obter(self, fontes):
+        """Retorna (chave, id do programa) e conta mais um uso do programa."""
+        chave = _hash(*(f"{tipo}:{fontes[tipo]}" for tipo in sorted(fontes)))
+        programa = self._programas.get(chave)
+        if programa is None:
+            programa = self._carregar_binario(chave)
+        if programa is None:
+            programa = self._linkar(fontes)
+            self._gravar_binario(chave, programa)
+        self._programas[chave] = programa
+        self._usos[chave] = self._usos.get(chave, 0) + 1
+        return chave, programa
+
+    def _soltar(self, chave):
+        """Desconta um uso do programa e o apaga quando ninguém mais o usa."""
+        self._usos[chave] -= 1
+        if self._usos[chave] == 0:
+            del self._usos[chave]
+            glDeleteProgram(self._programas.pop(chave))
+
+    def _estagio(self, tipo, fonte):
+        chave = _hash(str(tipo), fonte)
+        shader = self._estagios.get(chave)
+        if shader is None:
+            shader = self._estagios[chave] = compile_shader(fonte, tipo)
+        return shader
+
+    def _descartar_estagio(self, tipo, fonte):
+        # Os estágios são desanexados depois do link: apagar um não afeta programas prontos
+        shader = self._estagios.pop(_hash(str(tipo), fonte), None)
+        if shader is not None:
+            glDeleteShader(shader)
+
+    def _linkar(self, fontes):
+        # Compila primeiro: um erro de compilação não deixa programa órfão
+        shaders = [self._estagio(tipo, fonte) for tipo, fonte in fontes.items()]
+        programa = glCreateProgram()
+        for shader in shaders:
+            glAttachShader(programa, shader)
+        if self._suporta_binarios():
+            glProgramParameteri(programa, GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE)
+        glLinkProgram(programa)
+        for shader in shaders:
+            glDetachShader(programa, shader)
+        if not glGetProgramiv(programa, GL_LINK_STATUS):
+            log = glGetProgramInfoLog(programa).decode()
+            glDeleteProgram(programa)
+            raise ErroShader(f"Erro no link do programa: {log}")
+        return programa
+
+    # --- Cache em disco ---
+
+    def _suporta_binarios(self):
+        if self._binarios is None:
+            self._binarios = (self.pasta_cache is not None and bool(glProgramBinary)
+                              and glGetIntegerv(GL_NUM_PROGRAM_BINARY_FORMATS) > 0)
+        return self._binarios
+
+    def _arquivo_binario(self, chave):
+        # O binário só vale para o mesmo driver/GPU: eles entram no nome do arquivo
+        driver = _hash(glGetString(GL_VENDOR), glGetString(GL_RENDERER), glGetString(GL_VERSION))
+        return os.path.join(self.pasta_cache, f"{chave[:32]}-{driver[:16]}.bin")
+
+    def _carregar_binario(self, chave):
+        if not self._suporta_binarios():
+            return None
+        caminho = self._arquivo_binario(chave)
+        try:
+            with open(caminho, "rb") as arquivo:
+                dados = arquivo.read()
+        except OSError:
+            return None
+
+        if len(dados) <= 4:
+            # Arquivo vazio ou cortado (ex.: disco cheio): descarta e compila das fontes
+            _remover(caminho)
+            return None
+        formato, = struct.unpack_from("<I", dados)
+        binario = dados[4:]
+        programa = glCreateProgram()
+        glProgramBinary(programa, formato, binario, len(binario))
+        if glGetProgramiv(programa, GL_LINK_STATUS):
+            return programa
+        # Binário recusado pelo driver: descarta e compila das fontes
+        glDeleteProgram(programa)
+        _remover(caminho)
+        return None
+
+    def _gravar_binario(self, chave, programa):
+        if not self._suporta_binarios():
+            return
+        tamanho = glGetProgramiv(programa, GL_PROGRAM_BINARY_LENGTH)
+        if not tamanho:
+            return
+        binario, formato, comprimento = glGetProgramBinary(programa, tamanho)
+        binario = bytes(binario)[:int(comprimento)]
+        caminho = self._arquivo_binario(chave)
+        try:
+            os.makedirs(self.pasta_cache, exist_ok=True)
+            temporario = caminho + ".tmp"
+            with open(temporario, "wb") as arquivo:
+                arquivo.write(struct.pack("<I", int(formato)))
+                arquivo.write(binario)
+            os.replace(temporario, caminho)
+        except OSError as erro:
+            print(f"Aviso: não foi possível gravar o cache de shaders: {erro}")
+
+    # --- Recarga ---
+
+    def verificar_alteracoes(self, forcar=False):
+        """
+        Recompila os estágios cujos arquivos mudaram (chamar no loop de renderização).
+
+        As verificações são espaçadas em INTERVALO_VERIFICACAO segundos.
+
+        Returns:
+            Lista dos programas recarregados
+        """
+        agora = time.monotonic()
+        if not forcar and agora - self._ultima_verificacao < INTERVALO_VERIFICACAO:
+            return []
+        self._ultima_verificacao = agora
+
+        recarregados = []
+        for programa in self._vigiados:
+            alterados = {}
+            for tipo, (caminho, mtime) in programa.arquivos.items():
+                try:
+                    atual = os.stat(caminho).st_mtime_ns
+                except OSError:
+                    continue  # Arquivo sendo salvo pelo editor: tenta de novo depois
+                if atual != mtime:
+                    alterados[tipo] = (caminho, atual)
+            if not alterados:
+                continue
+
+            programa.arquivos.update(alterados)
+            fontes = dict(programa.fontes)
+            for tipo, (caminho, _) in alterados.items():
+                fontes[tipo] = _ler(caminho)
+            nomes = ", ".join(_NOMES_ESTAGIOS[tipo] for tipo in alterados)
+            try:
+                # O link compila o estágio alterado e pega os outros do cache de
+                # estágios. Se o programa veio do binário em disco, o cache ainda
+                # não tem os estágios sem alteração: eles são compilados (das
+                # fontes guardadas no programa) nesta primeira recarga e
+                # reaproveitados nas seguintes.
+                chave, id_programa = self._obter(fontes)
+            except ErroShader as erro:
+                print(f"Shader não recarregado ({nomes}), mantendo o anterior:\n{erro}")
+                continue
+            antigas, chave_antiga = programa.fontes, programa._chave
+            programa._trocar(id_programa, fontes, chave)
+            # O programa anterior e os estágios substituídos não servem mais
+            self._soltar(chave_antiga)
+            for tipo in alterados:
+                if antigas[tipo] != fontes[tipo]:
+                    self._descartar_estagio(tipo, antigas[tipo])
+            print(f"Shader recarregado: {nomes}")
+            recarregados.append(programa)
+        return recarregados
+
+    def liberar(self):
+        """Apaga todos os programas e estágios criados (com o contexto ainda ativo)."""
+        for programa in self._programas.values():
+            glDeleteProgram(programa)
+        for shader in self._estagios.values():
+            glDeleteShader(shader)
+        self._programas.clear()
+        self._usos.clear()
+        self._estagios.clear()
+        self._vigiados.clear()
+
+
+def _ler(caminho):
+    with open(caminho, "r") as arquivo:
+        return arquivo.read()
+
+
+def _remover(caminho):
+    try:
+        os.remove(caminho)
+    except OSError:
+        pass
@@ -0,0 +1,196 @@
+"""
+Instrumentação por quadro dos loops de renderização com pygame.
+
+Para cada quadro registra o tempo real (relógio de parede, perf_counter), o
+tempo de CPU do processo (process_time) e o tempo real de cada etapa (eventos,
+renderização, swap), além de quantas chamadas de desenho e quantos vértices
+foram enviados. A diferença entre o tempo real e o de CPU é o tempo esperando
+(swap com vsync, driver, outros processos). Mostra p50/p95/p99 dos últimos quadros em um painel sobre a
+cena (F3 liga/desliga) e, opcionalmente, grava uma linha por quadro em CSV.
+
+Exemplo:
+    medidor = MedidorQuadros(arquivo_csv="quadros.csv")
+    while rodando:
+        medidor.iniciar_quadro()
+        tratar_eventos()                  # chamar medidor.tratar_evento(evento) para o F3
+        medidor.marcar("eventos")
+        desenhar_cena(medidor)            # o código de desenho chama medidor.contar_desenho(vertices)
+        medidor.desenhar_painel()
+        medidor.marcar("render")
+        pygame.display.flip()
+        medidor.marcar("swap")
+        medidor.finalizar_quadro()
+    medidor.fechar()
+"""
+import csv
+import time
+
+import numpy as np
+import pygame
+from OpenGL.GL import *
+
+from estatisticas import PERCENTIS, estatisticas, formatar_estatisticas
+
+ETAPAS = ("eventos", "render", "swap")
+COLUNAS = ("quadro_ms", "cpu_ms", *(f"{etapa}_ms" for etapa in ETAPAS), "chamadas", "vertices")
+TEMPOS = 2 + len(ETAPAS)  # colunas de tempo (as primeiras de COLUNAS)
+INTERVALO_PAINEL = 0.5  # segundos entre atualizações do texto do painel
+QUADROS_POR_GRAVACAO = 60  # o CSV vai para o disco a cada tantos quadros (sobrevive a um kill)
+
+
+
+class MedidorQuadros:
+    """
+    Coleta os tempos de cada quadro (veja a descrição do módulo).
+
+    Args:
+        janela: Quantos quadros recentes entram nos percentis do painel
+        arquivo_csv: Caminho do CSV com uma linha por quadro (None desativa)
+        mostrar_painel: Se o painel começa visível
+    """
+
+    def __init__(self, janela=240, arquivo_csv=None, mostrar_painel=True):
+        # Últimos quadros em um buffer circular (uma coluna por item de COLUNAS)
+        self._amostras = np.zeros((janela, len(COLUNAS)), dtype=np.float64)
+        self.total_quadros = 0
+        self.chamadas = 0
+        self.vertices = 0
+        self._inicio = self._marca = time.perf_counter()
+        self._inicio_cpu = time.process_time()
+        self._etapas = dict.fromkeys(ETAPAS, 0.0)
+
+        self._arquivo_csv = None
+        self._csv = None
+        if arquivo_csv:
+            self._arquivo_csv = open(arquivo_csv, "w", newline="")
+            self._csv = csv.writer(self._arquivo_csv)
+            self._csv.writerow(("quadro", *COLUNAS))
+
+        self.mostrar_painel = mostrar_painel
+        self._fonte = None
+        self._pixels_painel = None  # (largura, altura, bytes RGBA), refeito a cada INTERVALO_PAINEL
+        self._ultima_atualizacao = 0.0
+
+    # --- Medidas ---
+
+    def iniciar_quadro(self):
+        """Marca o começo de um quadro (antes de tratar os eventos)."""
+        self._inicio = self._marca = time.perf_counter()
+        self._inicio_cpu = time.process_time()
+        self.chamadas = 0
+        self.vertices = 0
+        for etapa in ETAPAS:
+            self._etapas[etapa] = 0.0
+
+    def contar_desenho(self, vertices, chamadas=1):
+        """
+        Soma uma chamada de desenho ao quadro em andamento.
+
+        Args:
+            vertices: Vértices enviados pela chamada (índices, em glDrawElements)
+            chamadas: Quantas chamadas de desenho
+        """
+        self.chamadas += chamadas
+        self.vertices += vertices
+
+    def marcar(self, etapa):
+        """Atribui a `etapa` o tempo desde a marca anterior."""
+        agora = time.perf_counter()
+        self._etapas[etapa] += agora - self._marca
+        self._marca = agora
+
+    def finalizar_quadro(self):
+        """Fecha o quadro: guarda a amostra e escreve a linha do CSV."""
+        total = time.perf_counter() - self._inicio
+        cpu = time.process_time() - self._inicio_cpu
+        linha = self._amostras[self.total_quadros % len(self._amostras)]
+        linha[0] = total * 1000.0
+        linha[1] = cpu * 1000.0
+        for coluna, etapa in enumerate(ETAPAS, start=2):
+            linha[coluna] = self._etapas[etapa] * 1000.0
+        linha[-2] = self.chamadas
+        linha[-1] = self.vertices
+        if self._csv is not None:
+            self._csv.writerow((self.total_quadros, *(f"{valor:.4f}" for valor in linha[:-2]),
+                                self.chamadas, self.vertices))
+            if self.total_quadros % QUADROS_POR_GRAVACAO == 0:
+                self._arquivo_csv.flush()
+        self.total_quadros += 1
+
+    def recentes(self):
+        """Array (n, len(COLUNAS)) com os últimos quadros (ordem do buffer circular)."""
+        return self._amostras[:min(self.total_quadros, len(self._amostras))]
+
+    def resumo(self):
+        """estatisticas() do tempo real de quadro nos quadros recentes."""
+        return estatisticas(self.recentes()[:, 0])
+
+    def fechar(self):
+        """Fecha o CSV e mostra o resumo dos quadros recentes."""
+        if self._arquivo_csv is not None:
+            self._arquivo_csv.close()
+            self._arquivo_csv = self._csv = None
+        print(f"Últimos {formatar_estatisticas(self.resumo())}")
+
+    # --- Painel ---
+
+    def tratar_evento(self, evento):
+        """F3 liga/desliga o painel."""
+        if evento.type == pygame.KEYDOWN and evento.key == pygame.K_F3:
+            self.mostrar_painel = not self.mostrar_painel
+
+    def _linhas_painel(self):
+        recentes = self.recentes()
+        percentis = np.percentile(recentes[:, :TEMPOS], PERCENTIS, axis=0)
+        media = recentes[:, 0].mean()
+        nomes = ("quadro", "cpu", *ETAPAS)
+        linhas = [f"{len(recentes)} quadros  {1000.0 / media if media > 0 else 0:.0f} FPS  (p50 / p95 / p99 ms)"]
+        for coluna, nome in enumerate(nomes):
+            valores = " / ".join(f"{valor:6.2f}" for valor in percentis[:, coluna])
+            linhas.append(f"{nome:<8}{valores}")
+        # Do último quadro completo, como os percentis (os contadores do quadro atual ainda estão subindo)
+        chamadas, vertices = self._amostras[(self.total_quadros - 1) % len(self._amostras), -2:]
+        linhas.append(f"chamadas {chamadas:.0f}  vértices {vertices:.0f}")
+        return linhas
+
+    def _atualizar_painel(self):
+        if self._fonte is None:
+            self._fonte = pygame.font.SysFont("monospace", 14)
+        superficies = [self._fonte.render(linha, True, (255, 255, 255)) for linha in self._linhas_painel()]
+        altura_linha = self._fonte.get_linesize()
+        painel = pygame.Surface((max(s.get_width() for s in superficies) + 12,
+                                 altura_linha * len(superficies) + 8), pygame.SRCALPHA)
+        painel.fill((0, 0, 0, 160))
+        for i, superficie in enumerate(superficies):
+            painel.blit(superficie, (6, 4 + i * altura_linha))
+        # glDrawPixels lê as linhas de baixo para cima
+        self._pixels_painel = (painel.get_width(), painel.get_height(),
+                               pygame.image.tostring(painel, "RGBA", True))
+
+    def desenhar_painel(self, x=10, y=10):
+        """
+        Desenha o painel no canto inferior esquerdo da janela.
+
+        O texto só é refeito a cada INTERVALO_PAINEL segundos; nos outros
+        quadros a mesma imagem é copiada com um glDrawPixels.
+
+        Args:
+            x, y: Posição em pixels a partir do canto inferior esquerdo
+        """
+        if not self.mostrar_painel or self.total_quadros == 0:
+            return
+        agora = time.perf_counter()
+        if self._pixels_painel is None or agora - self._ultima_atualizacao >= INTERVALO_PAINEL:
+            self._atualizar_painel()
+            self._ultima_atualizacao = agora
+
+        largura, altura, pixels = self._pixels_painel
+        glPushAttrib(GL_ENABLE_BIT | GL_COLOR_BUFFER_BIT)
+        glDisable(GL_DEPTH_TEST)
+        glDisable(GL_LIGHTING)
+        glDisable(GL_TEXTURE_2D)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        glWindowPos2i(x, y)  # Posição em pixels, sem depender das matrizes da cena
+        glDrawPixels(largura, altura, GL_RGBA, GL_UNSIGNED_BYTE, pixels)
+        glPopAttrib()
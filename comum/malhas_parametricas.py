@@ -0,0 +1,374 @@
+"""
+Malhas paramétricas (cilindro, cone, esfera UV, toro, grade, icosfera) geradas com NumPy.
+
+Cada superfície é uma grade de parâmetros (u, v) avaliada de uma vez com
+arrays, sem laços em Python. O resultado é uma Malha com posições, normais,
+triângulos e arestas. As arestas são as linhas da grade (anéis e
+meridianos), o wireframe "natural" da superfície, sem as diagonais dos
+triângulos.
+
+As malhas são guardadas em cache pelos parâmetros (malha("esfera", raio=2)
+devolve sempre o mesmo objeto, com arrays somente leitura) e MalhaLOD
+prepara variações com mais e menos segmentos (níveis de detalhe).
+
+Exemplo:
+    cilindro = malha("cilindro", raio=1.0, altura=2.0, segmentos=32)
+    cilindro.posicoes, cilindro.arestas
+
+    esferas = MalhaLOD("esfera", niveis=(8, 16, 32, 64), raio=1.0)
+    esferas.selecionar(distancia=12.0)   # menos segmentos de longe
+"""
+import functools
+
+import numpy as np
+
+
+class Malha:
+    """
+    Geometria pronta para buffers.
+
+    Atributos:
+        posicoes: (N, 3) float32
+        normais: (N, 3) float32, unitárias
+        triangulos: uint32 plano (3 * T,), sentido anti-horário visto de fora
+        arestas: (E, 2) uint32, para o wireframe (linhas da grade paramétrica;
+            na icosfera, os lados dos triângulos)
+    """
+
+    def __init__(self, posicoes, normais, triangulos, arestas):
+        self.posicoes = np.ascontiguousarray(posicoes, dtype=np.float32)
+        self.normais = np.ascontiguousarray(normais, dtype=np.float32)
+        self.triangulos = np.ascontiguousarray(triangulos, dtype=np.uint32).ravel()
+        self.arestas = np.ascontiguousarray(arestas, dtype=np.uint32).reshape(-1, 2)
+
+    def somente_leitura(self):
+        """Trava os arrays (malhas do cache são compartilhadas)."""
+        for array in (self.posicoes, self.normais, self.triangulos, self.arestas):
+            array.flags.writeable = False
+        return self
+
+    def __str__(self):
+        return (f"Malha: {len(self.posicoes)} vértices, {len(self.triangulos) // 3} triângulos, "
+                f"{len(self.arestas)} arestas")
+
+
+# --- Montagem a partir de grades (u, v) ---
+
+def _indices_grade(pontos_u, pontos_v, fechada_u, fechada_v=False):
+    """
+    Triângulos e arestas de uma grade de pontos_u x pontos_v vértices (índice = j * pontos_u + i).
+
+    Com fechada_u (ou fechada_v), a última coluna (ou linha) liga de volta à
+    primeira: a costura não repete vértices.
+
+    Returns:
+        (quads, arestas): array (Q, 4) com os cantos de cada quad
+        (i, i+1, i+1 em j+1, i em j+1) e array (E, 2)
+    """
+    total = pontos_u * pontos_v
+    segmentos_u = pontos_u if fechada_u else pontos_u - 1
+    segmentos_v = pontos_v if fechada_v else pontos_v - 1
+    i = np.arange(segmentos_u)
+    i_prox = (i + 1) % pontos_u
+    j = np.arange(segmentos_v)[:, None]
+
+    a = j * pontos_u + i
+    b = j * pontos_u + i_prox
+    quads = np.stack([a, b, b + pontos_u, a + pontos_u], axis=-1).reshape(-1, 4) % total
+
+    linhas = np.arange(pontos_v)[:, None] * pontos_u
+    aneis = np.stack(np.broadcast_arrays(linhas + i, linhas + i_prox), axis=-1).reshape(-1, 2)
+    colunas = np.arange(pontos_u)
+    meridianos = np.stack([j * pontos_u + colunas, (j + 1) * pontos_u + colunas], axis=-1).reshape(-1, 2)
+    return quads, np.concatenate([aneis, meridianos % total])
+
+
+def _triangulos_dos_quads(quads):
+    """Cada quad (a, b, c, d) vira (a, b, c) e (a, c, d)."""
+    return np.concatenate([quads[:, [0, 1, 2]], quads[:, [0, 2, 3]]], axis=1).reshape(-1, 3)
+
+
+def _sem_degenerados(triangulos, arestas, posicoes):
+    """Remove triângulos e arestas com vértices na mesma posição (polos, ápices)."""
+    def distintos(a, b):
+        return np.any(posicoes[a] != posicoes[b], axis=-1)
+    t = triangulos
+    validos = distintos(t[:, 0], t[:, 1]) & distintos(t[:, 1], t[:, 2]) & distintos(t[:, 2], t[:, 0])
+    return t[validos], arestas[distintos(arestas[:, 0], arestas[:, 1])]
+
+
+def _juntar(partes):
+    """Junta várias (posicoes, normais, triangulos, arestas) em uma Malha."""
+    deslocamento = 0
+    posicoes, normais, triangulos, arestas = [], [], [], []
+    for p, n, t, a in partes:
+        posicoes.append(p)
+        normais.append(n)
+        triangulos.append(t.reshape(-1, 3) + deslocamento)
+        arestas.append(a.reshape(-1, 2) + deslocamento)
+        deslocamento += len(p)
+    return Malha(np.concatenate(posicoes), np.concatenate(normais),
+                 np.concatenate(triangulos), np.concatenate(arestas))
+
+
+def _normalizar(vetores):
+    comprimentos = np.linalg.norm(vetores, axis=-1, keepdims=True)
+    return vetores / np.where(comprimentos > 0, comprimentos, 1)
+
+
+def _tampa(raio, y, segmentos, para_cima):
+    """Disco horizontal em leque (centro + anel), sem arestas (o anel já vem da lateral)."""
+    angulos = 2 * np.pi * np.arange(segmentos) / segmentos
+    posicoes = np.zeros((segmentos + 1, 3))
+    posicoes[1:, 0] = raio * np.cos(angulos)
+    posicoes[1:, 2] = raio * np.sin(angulos)
+    posicoes[:, 1] = y
+    normais = np.zeros_like(posicoes)
+    normais[:, 1] = 1.0 if para_cima else -1.0
+
+    anel = np.arange(segmentos) + 1
+    proximo = anel % segmentos + 1
+    centro = np.zeros(segmentos, dtype=np.int64)
+    # Anti-horário visto de fora: de cima o anel gira em -z -> x
+    triangulos = np.stack([centro, proximo, anel] if para_cima else [centro, anel, proximo], axis=1)
+    return posicoes, normais, triangulos, np.empty((0, 2), dtype=np.int64)
+
+
+# --- Formas ---
+
+def cilindro(raio=1.0, altura=2.0, segmentos=16, tampas=True):
+    """Cilindro em pé (eixo y), centrado na origem."""
+    angulos = 2 * np.pi * np.arange(segmentos) / segmentos
+    cos, sen = np.cos(angulos), np.sin(angulos)
+    y = np.array([-altura / 2, altura / 2])
+
+    posicoes = np.empty((2, segmentos, 3))
+    posicoes[..., 0] = raio * cos
+    posicoes[..., 1] = y[:, None]
+    posicoes[..., 2] = raio * sen
+    normais = np.stack(np.broadcast_arrays(cos, 0.0, sen), axis=-1)
+    normais = np.broadcast_to(normais, (2, segmentos, 3))
+
+    quads, arestas = _indices_grade(segmentos, 2, fechada_u=True)
+    partes = [(posicoes.reshape(-1, 3), normais.reshape(-1, 3), _triangulos_dos_quads(quads)[:, ::-1], arestas)]
+    if tampas:
+        partes.append(_tampa(raio, altura / 2, segmentos, para_cima=True))
+        partes.append(_tampa(raio, -altura / 2, segmentos, para_cima=False))
+    return _juntar(partes)
+
+
+def cone(raio=1.0, altura=2.0, segmentos=16, base=True):
+    """Cone em pé (eixo y, ápice para cima), centrado na origem."""
+    angulos = 2 * np.pi * np.arange(segmentos) / segmentos
+    cos, sen = np.cos(angulos), np.sin(angulos)
+
+    posicoes = np.empty((2, segmentos, 3))
+    posicoes[0, :, 0], posicoes[0, :, 2] = raio * cos, raio * sen
+    posicoes[0, :, 1] = -altura / 2
+    posicoes[1] = (0.0, altura / 2, 0.0)  # Ápice repetido por segmento, cada um com a sua normal
+    # Normal da lateral: perpendicular à geratriz
+    normais = _normalizar(np.stack([altura * cos, np.full(segmentos, raio), altura * sen], axis=-1))
+    normais = np.broadcast_to(normais, (2, segmentos, 3)).reshape(-1, 3)
+
+    quads, arestas = _indices_grade(segmentos, 2, fechada_u=True)
+    posicoes = posicoes.reshape(-1, 3)
+    triangulos, arestas = _sem_degenerados(_triangulos_dos_quads(quads)[:, ::-1], arestas, posicoes)
+    partes = [(posicoes, normais, triangulos, arestas)]
+    if base:
+        partes.append(_tampa(raio, -altura / 2, segmentos, para_cima=False))
+    return _juntar(partes)
+
+
+def esfera(raio=1.0, meridianos=32, paralelos=None):
+    """
+    Esfera UV centrada na origem.
+
+    Args:
+        meridianos: Divisões em volta do eixo y
+        paralelos: Divisões de polo a polo (padrão: meridianos // 2)
+    """
+    paralelos = paralelos or max(2, meridianos // 2)
+    phi = 2 * np.pi * np.arange(meridianos) / meridianos   # Em volta do eixo y
+    theta = np.pi * np.arange(paralelos + 1) / paralelos     # Do polo sul ao polo norte
+
+    anel = np.sin(theta)[:, None]
+    normais = np.empty((paralelos + 1, meridianos, 3))
+    normais[..., 0] = anel * np.cos(phi)
+    normais[..., 1] = -np.cos(theta)[:, None]
+    normais[..., 2] = anel * np.sin(phi)
+    normais = normais.reshape(-1, 3)
+    # Nos polos todos os meridianos caem no mesmo ponto: zera o resíduo do seno
+    normais[np.abs(normais[:, 1]) == 1.0, 0::2] = 0.0
+    posicoes = raio * normais
+
+    quads, arestas = _indices_grade(meridianos, paralelos + 1, fechada_u=True)
+    triangulos, arestas = _sem_degenerados(_triangulos_dos_quads(quads)[:, ::-1], arestas, posicoes)
+    return _juntar([(posicoes, normais, triangulos, arestas)])
+
+
+def toro(raio_maior=1.0, raio_menor=0.35, segmentos=32, segmentos_tubo=None):
+    """
+    Toro deitado (em volta do eixo y), centrado na origem.
+
+    Args:
+        segmentos: Divisões em volta do eixo y
+        segmentos_tubo: Divisões em volta do tubo (padrão: segmentos // 2)
+    """
+    segmentos_tubo = segmentos_tubo or max(3, segmentos // 2)
+    phi = 2 * np.pi * np.arange(segmentos) / segmentos
+    theta = 2 * np.pi * np.arange(segmentos_tubo) / segmentos_tubo
+
+    # Grade (tubo, volta): v = theta, u = phi
+    cos_t, sen_t = np.cos(theta)[:, None], np.sin(theta)[:, None]
+    normais = np.empty((segmentos_tubo, segmentos, 3))
+    normais[..., 0] = cos_t * np.cos(phi)
+    normais[..., 1] = sen_t
+    normais[..., 2] = cos_t * np.sin(phi)
+    centros = np.zeros_like(normais)
+    centros[..., 0] = raio_maior * np.cos(phi)
+    centros[..., 2] = raio_maior * np.sin(phi)
+    posicoes = centros + raio_menor * normais
+
+    quads, arestas = _indices_grade(segmentos, segmentos_tubo, fechada_u=True, fechada_v=True)
+    return _juntar([(posicoes.reshape(-1, 3), normais.reshape(-1, 3),
+                     _triangulos_dos_quads(quads)[:, ::-1], arestas)])
+
+
+def grade(largura=2.0, profundidade=2.0, divisoes=10, divisoes_z=None):
+    """Plano horizontal (y = 0) subdividido, centrado na origem, normal +y."""
+    divisoes_z = divisoes_z or divisoes
+    x = np.linspace(-largura / 2, largura / 2, divisoes + 1)
+    z = np.linspace(-profundidade / 2, profundidade / 2, divisoes_z + 1)
+    posicoes = np.zeros((divisoes_z + 1, divisoes + 1, 3))
+    posicoes[..., 0] = x
+    posicoes[..., 2] = z[:, None]
+    normais = np.zeros_like(posicoes)
+    normais[..., 1] = 1.0
+
+    quads, arestas = _indices_grade(divisoes + 1, divisoes_z + 1, fechada_u=False)
+    return _juntar([(posicoes.reshape(-1, 3), normais.reshape(-1, 3),
+                     _triangulos_dos_quads(quads)[:, ::-1], arestas)])
+
+
+# Icosaedro regular (arestas de comprimento 2), faces anti-horárias vistas de fora
+_PHI = (1.0 + np.sqrt(5.0)) / 2.0
+ICOSAEDRO_VERTICES = np.array([
+    [-1, _PHI, 0], [1, _PHI, 0], [-1, -_PHI, 0], [1, -_PHI, 0],
+    [0, -1, _PHI], [0, 1, _PHI], [0, -1, -_PHI], [0, 1, -_PHI],
+    [_PHI, 0, -1], [_PHI, 0, 1], [-_PHI, 0, -1], [-_PHI, 0, 1],
+])
+ICOSAEDRO_FACES = np.array([
+    (0, 11, 5), (0, 5, 1), (0, 1, 7), (0, 7, 10), (0, 10, 11),
+    (1, 5, 9), (5, 11, 4), (11, 10, 2), (10, 7, 6), (7, 1, 8),
+    (3, 9, 4), (3, 4, 2), (3, 2, 6), (3, 6, 8), (3, 8, 9),
+    (4, 9, 5), (2, 4, 11), (6, 2, 10), (8, 6, 7), (9, 8, 1),
+])
+
+
+def _arestas_unicas(faces, total_vertices):
+    """
+    Arestas (a < b) sem repetição das faces, e a aresta de cada lado de cada face.
+
+    Cada aresta vira uma chave inteira a * total + b; np.unique faz o papel
+    do dicionário "aresta -> índice" (arestas compartilhadas caem na mesma chave).
+
+    Returns:
+        (arestas (E, 2), lados (F, 3)): lados[f] = índices em `arestas` de ab, bc, ca
+    """
+    pares = np.sort(faces[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    chaves, lados = np.unique(pares[:, 0] * total_vertices + pares[:, 1], return_inverse=True)
+    return np.stack(np.divmod(chaves, total_vertices), axis=1), lados.reshape(-1, 3)
+
+
+def icosfera(raio=1.0, niveis=0):
+    """
+    Esfera a partir do icosaedro, com cada triângulo dividido em 4 `niveis` vezes.
+
+    O ponto médio de cada aresta é criado uma vez só e compartilhado pelas
+    duas faces vizinhas. No nível k: 10 * 4^k + 2 vértices, 20 * 4^k faces
+    e 30 * 4^k arestas. As filhas de cada face ficam juntas, então a face i
+    vem da face i // 4^k do icosaedro (útil para colorir por face original).
+    """
+    posicoes = _normalizar(ICOSAEDRO_VERTICES)
+    faces = ICOSAEDRO_FACES.astype(np.int64)
+    for _ in range(niveis):
+        total = len(posicoes)
+        arestas, lados = _arestas_unicas(faces, total)
+        novos = _normalizar(posicoes[arestas[:, 0]] + posicoes[arestas[:, 1]])
+        a, b, c = faces.T
+        m_ab, m_bc, m_ca = (lados + total).T
+        faces = np.stack([
+            np.stack([a, m_ab, m_ca], axis=1),
+            np.stack([b, m_bc, m_ab], axis=1),
+            np.stack([c, m_ca, m_bc], axis=1),
+            np.stack([m_ab, m_bc, m_ca], axis=1),
+        ], axis=1).reshape(-1, 3)
+        posicoes = np.concatenate([posicoes, novos])
+
+    arestas, _ = _arestas_unicas(faces, len(posicoes))
+    return _juntar([(raio * posicoes, posicoes, faces, arestas)])
+
+
+# Forma -> (função, parâmetro que controla o nível de detalhe)
+FORMAS = {
+    "cilindro": (cilindro, "segmentos"),
+    "cone": (cone, "segmentos"),
+    "esfera": (esfera, "meridianos"),
+    "toro": (toro, "segmentos"),
+    "grade": (grade, "divisoes"),
+    "icosfera": (icosfera, "niveis"),
+}
+
+
+# --- Cache e níveis de detalhe ---
+
+@functools.lru_cache(maxsize=128)
+def _gerar(forma, parametros):
+    funcao, _ = FORMAS[forma]
+    return funcao(**dict(parametros)).somente_leitura()
+
+
+def malha(forma, **parametros):
+    """
+    Malha de uma forma de FORMAS, gerada uma vez por combinação de parâmetros.
+
+    Returns:
+        Malha compartilhada (arrays somente leitura; copie para alterar)
+    """
+    if forma not in FORMAS:
+        raise ValueError(f"Forma desconhecida: {forma} (opções: {', '.join(FORMAS)})")
+    return _gerar(forma, tuple(sorted(parametros.items())))
+
+
+def limpar_cache():
+    _gerar.cache_clear()
+
+
+class MalhaLOD:
+    """
+    A mesma forma em vários níveis de detalhe, todos gerados na criação.
+
+    Args:
+        forma: Chave de FORMAS
+        niveis: Valores do parâmetro de detalhe (ex.: segmentos), do mais
+            detalhado para o menos, ou em qualquer ordem
+        distancia_base: Até esta distância usa o nível mais detalhado; cada
+            vez que a distância dobra, desce um nível
+        **parametros: Demais parâmetros da forma (raio, altura, ...)
+    """
+
+    def __init__(self, forma, niveis=(64, 32, 16, 8), distancia_base=5.0, **parametros):
+        _, detalhe = FORMAS[forma]
+        self.niveis = tuple(sorted(niveis, reverse=True))
+        self.distancia_base = distancia_base
+        self.variantes = [malha(forma, **parametros, **{detalhe: nivel}) for nivel in self.niveis]
+
+    def indice(self, distancia):
+        """Índice do nível para um objeto a `distancia` da câmera."""
+        if distancia <= self.distancia_base:
+            return 0
+        return min(int(np.log2(distancia / self.distancia_base)) + 1, len(self.variantes) - 1)
+
+    def selecionar(self, distancia):
+        """Malha adequada para um objeto a `distancia` da câmera."""
+        return self.variantes[self.indice(distancia)]
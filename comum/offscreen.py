@@ -0,0 +1,232 @@
+"""
+Renderização sem janela (offscreen), para medir e testar as aulas sem GPU nem monitor.
+
+Cria um contexto OpenGL de software (Mesa llvmpipe) por EGL "surfaceless" ou
+por OSMesa e desenha em um framebuffer (FBO) do tamanho pedido. Os quadros
+podem ser lidos como arrays NumPy, comparados com imagens de referência e
+cronometrados.
+
+O PyOpenGL escolhe a plataforma (GLX, EGL, OSMesa) no primeiro import de
+OpenGL.GL, então este módulo precisa ser importado ANTES do OpenGL, ou o
+programa deve rodar com PYOPENGL_PLATFORM=egl (ou osmesa) no ambiente.
+
+Exemplo:
+    import offscreen                      # antes de "from OpenGL.GL import *"
+    from OpenGL.GL import *
+
+    with offscreen.RenderizadorOffscreen(800, 600) as tela:
+        configurar_cena()
+        estatisticas = tela.executar(desenhar, quadros=300)
+        print(offscreen.formatar_estatisticas(estatisticas))
+        imagem = tela.ler_quadro()        # (600, 800, 3) uint8, linha 0 no topo
+"""
+import ctypes
+import os
+import time
+
+os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+
+import numpy as np
+import OpenGL.platform
+from OpenGL.GL import *
+
+from estatisticas import estatisticas, formatar_estatisticas  # noqa: F401 (reexportadas)
+
+# Extensão EGL_MESA_platform_surfaceless: contexto sem display nem janela
+_EGL_PLATFORM_SURFACELESS_MESA = 0x31DD
+
+
+def plataforma():
+    """Nome da plataforma em uso pelo PyOpenGL ("egl", "osmesa", "glx", ...)."""
+    return type(OpenGL.platform.PLATFORM).__name__.replace("Platform", "").lower()
+
+
+class RenderizadorOffscreen:
+    """
+    Contexto OpenGL sem janela com um framebuffer RGBA8 + profundidade/stencil.
+
+    Args:
+        largura, altura: Tamanho do framebuffer em pixels
+
+    Atributos:
+        fbo: Framebuffer em que tudo é desenhado (fica ligado após a criação)
+    """
+
+    def __init__(self, largura, altura):
+        self.largura = largura
+        self.altura = altura
+        self._egl = None
+        self._osmesa = None
+
+        nome = plataforma()
+        if nome == "egl":
+            self._criar_egl()
+        elif nome == "osmesa":
+            self._criar_osmesa()
+        else:
+            raise RuntimeError(
+                f"Plataforma '{nome}' do PyOpenGL não permite renderizar sem janela: importe "
+                "offscreen antes do OpenGL ou rode com PYOPENGL_PLATFORM=egl (ou osmesa)")
+
+        self._criar_framebuffer()
+        # Destino de ler_quadro, alocado uma vez (glReadPixels escreve direto nele)
+        self._pixels = np.empty((altura, largura, 3), dtype=np.uint8)
+
+    # --- Contexto ---
+
+    def _criar_egl(self):
+        from OpenGL import EGL
+
+        display = EGL.EGL_NO_DISPLAY
+        if bool(EGL.eglGetPlatformDisplayEXT):
+            display = EGL.eglGetPlatformDisplayEXT(_EGL_PLATFORM_SURFACELESS_MESA,
+                                                   EGL.EGL_DEFAULT_DISPLAY, None)
+        if display == EGL.EGL_NO_DISPLAY:
+            display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+        if not EGL.eglInitialize(display, None, None):
+            raise RuntimeError("Não foi possível inicializar o EGL")
+        EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+
+        atributos = (EGL.EGLint * 5)(EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+                                     EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT, EGL.EGL_NONE)
+        config = EGL.EGLConfig()
+        total = EGL.EGLint()
+        if not EGL.eglChooseConfig(display, atributos, ctypes.pointer(config), 1, ctypes.pointer(total)) \
+                or total.value == 0:
+            raise RuntimeError("Nenhuma configuração EGL com suporte a OpenGL")
+
+        # Sem atributos: perfil de compatibilidade, que roda tanto as aulas com
+        # pipeline fixo quanto as com "#version 330 core"
+        contexto = EGL.eglCreateContext(display, config, EGL.EGL_NO_CONTEXT, None)
+        if contexto == EGL.EGL_NO_CONTEXT:
+            raise RuntimeError("Não foi possível criar o contexto EGL")
+        # Sem superfície: o desenho vai todo para o FBO
+        if not EGL.eglMakeCurrent(display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, contexto):
+            raise RuntimeError("Não foi possível ativar o contexto EGL")
+        self._egl = (EGL, display, contexto)
+
+    def _criar_osmesa(self):
+        from OpenGL import arrays, osmesa
+
+        contexto = osmesa.OSMesaCreateContextExt(osmesa.OSMESA_RGBA, 24, 8, 0, None)
+        if not contexto:
+            raise RuntimeError("Não foi possível criar o contexto OSMesa")
+        # O OSMesa exige um buffer próprio, mas o desenho vai para o FBO
+        buffer = arrays.GLubyteArray.zeros((self.altura, self.largura, 4))
+        if not osmesa.OSMesaMakeCurrent(contexto, buffer, GL_UNSIGNED_BYTE, self.largura, self.altura):
+            raise RuntimeError("Não foi possível ativar o contexto OSMesa")
+        self._osmesa = (osmesa, contexto, buffer)
+
+    def _criar_framebuffer(self):
+        self.fbo = glGenFramebuffers(1)
+        glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
+        self._renderbuffers = glGenRenderbuffers(2)
+        for renderbuffer, formato, anexo in zip(
+                self._renderbuffers,
+                (GL_RGBA8, GL_DEPTH24_STENCIL8),
+                (GL_COLOR_ATTACHMENT0, GL_DEPTH_STENCIL_ATTACHMENT)):
+            glBindRenderbuffer(GL_RENDERBUFFER, renderbuffer)
+            glRenderbufferStorage(GL_RENDERBUFFER, formato, self.largura, self.altura)
+            glFramebufferRenderbuffer(GL_FRAMEBUFFER, anexo, GL_RENDERBUFFER, renderbuffer)
+        glBindRenderbuffer(GL_RENDERBUFFER, 0)
+        if glCheckFramebufferStatus(GL_FRAMEBUFFER) != GL_FRAMEBUFFER_COMPLETE:
+            raise RuntimeError("Framebuffer offscreen incompleto")
+        glViewport(0, 0, self.largura, self.altura)
+
+    # --- Quadros ---
+
+    def ler_quadro(self):
+        """
+        Lê o quadro atual.
+
+        Returns:
+            Array (altura, largura, 3) uint8 RGB com a linha 0 no topo da
+            imagem. É reescrito na próxima leitura: use .copy() para guardar.
+        """
+        glBindFramebuffer(GL_READ_FRAMEBUFFER, self.fbo)
+        glPixelStorei(GL_PACK_ALIGNMENT, 1)
+        glReadPixels(0, 0, self.largura, self.altura, GL_RGB, GL_UNSIGNED_BYTE, self._pixels)
+        # O OpenGL guarda as linhas de baixo para cima
+        return self._pixels[::-1]
+
+    def executar(self, desenhar, quadros=100, aquecimento=5, ao_ler=None):
+        """
+        Desenha `quadros` quadros cronometrando cada um.
+
+        Cada medida inclui glFinish (o tempo real da GPU, não só o de
+        enviar os comandos), que faz o papel do swap de uma janela.
+
+        Args:
+            desenhar: Função chamada a cada quadro, recebe o número do quadro
+            quadros: Quantidade de quadros medidos
+            aquecimento: Quadros desenhados antes das medidas (shaders, caches)
+            ao_ler: Se informada, recebe (número, imagem) de cada quadro medido,
+                lido com ler_quadro (a leitura fica fora do tempo medido)
+
+        Returns:
+            dict de estatisticas() com os tempos em milissegundos
+        """
+        for quadro in range(aquecimento):
+            desenhar(quadro)
+        glFinish()
+
+        tempos = np.empty(quadros, dtype=np.float64)
+        for quadro in range(quadros):
+            inicio = time.perf_counter()
+            desenhar(aquecimento + quadro)
+            glFinish()
+            tempos[quadro] = time.perf_counter() - inicio
+            if ao_ler is not None:
+                ao_ler(quadro, self.ler_quadro())
+        return estatisticas(tempos * 1000.0)
+
+    def fechar(self):
+        """Apaga o framebuffer e destrói o contexto."""
+        if self.fbo is None:
+            return
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        glDeleteFramebuffers(1, [self.fbo])
+        glDeleteRenderbuffers(2, self._renderbuffers)
+        self.fbo = None
+        if self._egl is not None:
+            EGL, display, contexto = self._egl
+            EGL.eglMakeCurrent(display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, EGL.EGL_NO_CONTEXT)
+            EGL.eglDestroyContext(display, contexto)
+            EGL.eglTerminate(display)
+        if self._osmesa is not None:
+            osmesa, contexto, _ = self._osmesa
+            osmesa.OSMesaDestroyContext(contexto)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *erro):
+        self.fechar()
+
+
+def comparar_com_referencia(imagem, caminho, tolerancia=2, fracao_maxima=0.001):
+    """
+    Compara um quadro com uma imagem de referência (.npy) para testes de regressão visual.
+
+    Se a referência não existe, ela é gravada com o quadro atual.
+
+    Args:
+        imagem: Array (altura, largura, 3) uint8, como o de ler_quadro
+        caminho: Arquivo .npy da referência
+        tolerancia: Diferença por canal (0-255) ignorada (arredondamentos do rasterizador)
+        fracao_maxima: Fração de pixels que pode passar da tolerância
+
+    Returns:
+        (igual, fracao): se o quadro confere e a fração de pixels diferentes
+    """
+    if not os.path.exists(caminho):
+        os.makedirs(os.path.dirname(os.path.abspath(caminho)), exist_ok=True)
+        np.save(caminho, np.ascontiguousarray(imagem))
+        return True, 0.0
+
+    referencia = np.load(caminho)
+    if referencia.shape != imagem.shape:
+        return False, 1.0
+    diferenca = np.abs(referencia.astype(np.int16) - imagem.astype(np.int16)).max(axis=2)
+    fracao = float(np.count_nonzero(diferenca > tolerancia)) / diferenca.size
+    return fracao <= fracao_maxima, fracao
@@ -0,0 +1,206 @@
+"""
+Contagem e tempo das chamadas ao OpenGL feitas pelo PyOpenGL (modo de perfil, opcional).
+
+Substitui as funções gl*/glu*/glut* dos módulos OpenGL.GL, OpenGL.GLU e
+OpenGL.GLUT por versões que contam as chamadas e somam o tempo de cada uma.
+Os quadros são contados pelas trocas de buffer (pygame.display.flip,
+glutSwapBuffers, glfw.swap_buffers) ou, sem elas, pelos glFinish (um por
+quadro no modo offscreen). Ao sair, mostra as funções que mais
+custaram, com chamadas e tempo por quadro: é onde está o custo Python -> GL.
+
+Como as aulas fazem "from OpenGL.GL import *", o perfil precisa ser ativado
+antes desse import. O jeito mais simples é rodar a aula por este módulo,
+de dentro da pasta da aula:
+
+    cd aula_06_0/src
+    python ../../comum/perfil_gl.py main.py
+    python ../../comum/perfil_gl.py --top 10 main.py --csv quadros.csv
+
+Os tempos incluem o custo do próprio perfil (duas leituras de relógio por
+chamada): compare execuções com o perfil ligado, não com ele desligado.
+"""
+import argparse
+import atexit
+import os
+import runpy
+import sys
+import time
+
+MODULOS_GL = ("OpenGL.GL", "OpenGL.GLU", "OpenGL.GLUT")
+PREFIXOS = ("gl", "glu", "glut")
+TOP_PADRAO = 20
+
+_contadores = {}  # nome da função -> _FuncaoContada
+_quadros = 0
+_inicio = None
+_ativo = False
+
+
+class _FuncaoContada:
+    """Função do OpenGL que conta as chamadas e soma o tempo delas."""
+
+    __slots__ = ("funcao", "nome", "chamadas", "segundos", "__wrapped__")
+
+    def __init__(self, funcao, nome):
+        self.funcao = funcao
+        self.nome = nome
+        self.chamadas = 0
+        self.segundos = 0.0
+        self.__wrapped__ = funcao
+
+    def __call__(self, *args, **kwargs):
+        inicio = time.perf_counter()
+        try:
+            return self.funcao(*args, **kwargs)
+        finally:
+            self.segundos += time.perf_counter() - inicio
+            self.chamadas += 1
+
+    def __bool__(self):
+        # Mantém testes de disponibilidade como bool(glDrawElementsInstanced)
+        return bool(self.funcao)
+
+    def __getattr__(self, nome):
+        return getattr(self.funcao, nome)
+
+
+def _envolver(modulo, nome):
+    funcao = getattr(modulo, nome)
+    if isinstance(funcao, _FuncaoContada):
+        return funcao
+    contada = _contadores.get(nome)
+    if contada is None or contada.funcao is not funcao:
+        contada = _contadores[nome] = _FuncaoContada(funcao, nome)
+    setattr(modulo, nome, contada)
+    return contada
+
+
+def _marcando_quadro(funcao):
+    def trocar_buffers(*args, **kwargs):
+        global _quadros
+        _quadros += 1
+        return funcao(*args, **kwargs)
+    trocar_buffers.__wrapped__ = funcao
+    return trocar_buffers
+
+
+def ativar(top=TOP_PADRAO):
+    """
+    Liga o perfil e agenda o relatório para o fim do programa.
+
+    Deve ser chamada antes de "from OpenGL.GL import *" nos módulos medidos.
+
+    Args:
+        top: Quantas funções mostrar no relatório
+    """
+    global _ativo, _inicio
+    if _ativo:
+        return
+    _ativo = True
+    _inicio = time.perf_counter()
+
+    import importlib
+    for nome_modulo in MODULOS_GL:
+        try:
+            modulo = importlib.import_module(nome_modulo)
+        except Exception:  # GLUT sem freeglut instalado, por exemplo
+            continue
+        for nome in dir(modulo):
+            if nome.startswith(PREFIXOS) and callable(getattr(modulo, nome)):
+                _envolver(modulo, nome)
+
+    # Trocas de buffer marcam o fim de cada quadro
+    try:
+        import pygame.display
+        pygame.display.flip = _marcando_quadro(pygame.display.flip)
+    except ImportError:
+        pass
+    try:
+        import glfw
+        glfw.swap_buffers = _marcando_quadro(glfw.swap_buffers)
+    except ImportError:
+        pass
+    glut = sys.modules.get("OpenGL.GLUT")
+    if glut is not None:
+        glut.glutSwapBuffers = _marcando_quadro(glut.glutSwapBuffers)
+
+    atexit.register(lambda: print(relatorio(top)))
+
+
+def marcar_quadro():
+    """Conta um quadro (para loops sem troca de buffer, como o modo offscreen)."""
+    global _quadros
+    _quadros += 1
+
+
+def zerar():
+    """Zera as contagens (ex.: depois do carregamento, para medir só o loop)."""
+    global _quadros, _inicio
+    for contada in _contadores.values():
+        contada.chamadas = 0
+        contada.segundos = 0.0
+    _quadros = 0
+    _inicio = time.perf_counter()
+
+
+def resultados():
+    """
+    Contagens atuais, da função mais cara para a mais barata.
+
+    Returns:
+        (quadros, lista de (nome, chamadas, segundos))
+    """
+    usados = [(c.nome, c.chamadas, c.segundos) for c in _contadores.values() if c.chamadas]
+    usados.sort(key=lambda item: item[2], reverse=True)
+    quadros = _quadros
+    if quadros == 0 and "glFinish" in _contadores:
+        quadros = _contadores["glFinish"].chamadas
+    return quadros, usados
+
+
+def relatorio(top=TOP_PADRAO):
+    """Texto com as `top` funções que mais tempo gastaram."""
+    quadros, usados = resultados()
+    if not usados:
+        return "Perfil GL: nenhuma chamada ao OpenGL registrada"
+    total_chamadas = sum(chamadas for _, chamadas, _ in usados)
+    total_segundos = sum(segundos for _, _, segundos in usados)
+    duracao = time.perf_counter() - _inicio
+    por_quadro = max(quadros, 1)
+
+    linhas = [
+        f"Perfil GL: {total_chamadas} chamadas a {len(usados)} funções, {total_segundos * 1000:.1f} ms "
+        f"({total_segundos / duracao:.0%} de {duracao:.1f} s), {quadros} quadros",
+        f"{'função':<28}{'chamadas':>10}{'por quadro':>12}{'total ms':>11}{'µs/quadro':>12}{'%':>7}",
+    ]
+    for nome, chamadas, segundos in usados[:top]:
+        linhas.append(f"{nome:<28}{chamadas:>10}{chamadas / por_quadro:>12.1f}{segundos * 1000:>11.1f}"
+                      f"{segundos * 1e6 / por_quadro:>12.1f}{segundos / total_segundos:>7.1%}")
+    if len(usados) > top:
+        resto = usados[top:]
+        linhas.append(f"{f'(mais {len(resto)} funções)':<28}{sum(c for _, c, _ in resto):>10}"
+                      f"{'':>12}{sum(s for _, _, s in resto) * 1000:>11.1f}")
+    return "\n".join(linhas)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Roda um script com as chamadas ao OpenGL contadas e cronometradas",
+        usage="%(prog)s [--top N] script.py [argumentos do script]")
+    parser.add_argument("--top", type=int, default=TOP_PADRAO, help="Funções no relatório")
+    parser.add_argument("script", help="Script da aula")
+    parser.add_argument("argumentos", nargs=argparse.REMAINDER, help="Repassados ao script")
+    args = parser.parse_args()
+
+    # ativar() importa o OpenGL: a plataforma do modo offscreen tem que vir antes
+    if "--offscreen" in args.argumentos:
+        os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+    ativar(args.top)
+    # O script roda como se tivesse sido chamado direto
+    sys.argv = [args.script, *args.argumentos]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(args.script)))
+    runpy.run_path(args.script, run_name="__main__")
+
+
+if __name__ == "__main__":
+    main()
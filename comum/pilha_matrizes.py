@@ -0,0 +1,181 @@
+"""
+Pilha de matrizes calculada na CPU, no lugar de glPushMatrix/glTranslatef/glRotatef.
+
+As funções de criação (translacao, rotacao, perspectiva, ...) devolvem
+matrizes 4x4 float32 na convenção matemática (row-major, ponto como coluna),
+como as de TransformationMatrix da aula_02_0.
+"""
+import numpy as np
+from OpenGL.GL import GL_FALSE, glLoadMatrixf, glUniformMatrix4fv
+
+
+# --- Matrizes 4x4 (row-major) ---
+
+def translacao(x, y, z):
+    """Como glTranslatef."""
+    matriz = np.eye(4, dtype=np.float32)
+    matriz[:3, 3] = (x, y, z)
+    return matriz
+
+
+def escala(sx, sy, sz):
+    """Como glScalef."""
+    return np.diag(np.array([sx, sy, sz, 1.0], dtype=np.float32))
+
+
+def rotacao(angulo_rad, x, y, z):
+    """Rotação em torno do eixo (x, y, z), que não precisa ser unitário (fórmula de Rodrigues)."""
+    eixo = np.array([x, y, z], dtype=np.float64)
+    eixo /= np.linalg.norm(eixo)
+    cos_a = np.cos(angulo_rad)
+    sin_a = np.sin(angulo_rad)
+    antissimetrica = np.array([
+        [0, -eixo[2], eixo[1]],
+        [eixo[2], 0, -eixo[0]],
+        [-eixo[1], eixo[0], 0]
+    ])
+    matriz = np.eye(4, dtype=np.float32)
+    matriz[:3, :3] = cos_a * np.eye(3) + sin_a * antissimetrica + (1 - cos_a) * np.outer(eixo, eixo)
+    return matriz
+
+
+def look_at(eye_x, eye_y, eye_z, center_x, center_y, center_z, up_x, up_y, up_z):
+    """Matriz de visualização da câmera (mesmos parâmetros de gluLookAt)."""
+    olho = np.array([eye_x, eye_y, eye_z], dtype=np.float64)
+    frente = np.array([center_x, center_y, center_z], dtype=np.float64) - olho
+    frente /= np.linalg.norm(frente)
+    lado = np.cross(frente, [up_x, up_y, up_z])
+    lado /= np.linalg.norm(lado)
+    cima = np.cross(lado, frente)
+
+    matriz = np.eye(4, dtype=np.float32)
+    matriz[0, :3] = lado
+    matriz[1, :3] = cima
+    matriz[2, :3] = -frente
+    matriz[:3, 3] = -matriz[:3, :3] @ olho
+    return matriz
+
+
+def perspectiva(fovy_deg, aspect, near, far):
+    """Projeção perspectiva (mesmos parâmetros de gluPerspective)."""
+    f = 1.0 / np.tan(np.radians(fovy_deg) / 2.0)
+    matriz = np.zeros((4, 4), dtype=np.float32)
+    matriz[0, 0] = f / aspect
+    matriz[1, 1] = f
+    matriz[2, 2] = (far + near) / (near - far)
+    matriz[2, 3] = 2.0 * far * near / (near - far)
+    matriz[3, 2] = -1.0
+    return matriz
+
+
+def ortografica(left, right, bottom, top, near, far):
+    """Projeção ortográfica (mesmos parâmetros de glOrtho)."""
+    matriz = np.eye(4, dtype=np.float32)
+    matriz[0, 0] = 2.0 / (right - left)
+    matriz[1, 1] = 2.0 / (top - bottom)
+    matriz[2, 2] = -2.0 / (far - near)
+    matriz[0, 3] = -(right + left) / (right - left)
+    matriz[1, 3] = -(top + bottom) / (top - bottom)
+    matriz[2, 3] = -(far + near) / (far - near)
+    return matriz
+
+
+class MatrixStack:
+    """
+    Pilha de matrizes calculada na CPU.
+
+    Cada glTranslatef/glRotatef é uma chamada separada ao driver. Aqui as
+    transformações são compostas em NumPy e a matriz final de cada objeto é
+    enviada com uma única chamada. Cada nível guarda a matriz já transposta
+    (a ordem column-major do OpenGL), atualizada a cada operação:
+    (A * B)^T = B^T * A^T. Assim o envio não transpõe nada.
+
+    Exemplo:
+        pilha = MatrixStack()
+        pilha.look_at(5, 5, 5, 0, 0, 0, 0, 1, 0)
+        pilha.push()
+        pilha.translate(1, 0, 0)
+        pilha.rotate(45, 0, 1, 0)
+        pilha.load_gl()   # Uma chamada em vez de três
+        desenhar_objeto()
+        pilha.pop()
+    """
+
+    def __init__(self):
+        self._pilha = [np.eye(4, dtype=np.float32)]  # Matrizes transpostas (column-major)
+
+    @property
+    def matrix(self):
+        """Matriz 4x4 (row-major) do topo da pilha."""
+        return self._pilha[-1].T
+
+    def push(self):
+        """Duplica o topo (como glPushMatrix)."""
+        # As matrizes não são alteradas no lugar (cada produto cria uma nova),
+        # então basta repetir a referência
+        self._pilha.append(self._pilha[-1])
+
+    def pop(self):
+        """Descarta o topo (como glPopMatrix)."""
+        if len(self._pilha) == 1:
+            raise IndexError("pop em uma MatrixStack com um único nível")
+        self._pilha.pop()
+
+    def load_identity(self):
+        """Substitui o topo pela identidade (como glLoadIdentity)."""
+        self._pilha[-1] = np.eye(4, dtype=np.float32)
+
+    def load(self, transformacao):
+        """Substitui o topo por uma matriz 4x4 row-major (ou objeto com `.matrix`, como TransformationMatrix)."""
+        matriz = np.asarray(getattr(transformacao, "matrix", transformacao), dtype=np.float32)
+        self._pilha[-1] = np.ascontiguousarray(matriz.T)
+
+    def mult(self, transformacao):
+        """Multiplica o topo à direita (como glMultMatrix)."""
+        matriz = np.asarray(getattr(transformacao, "matrix", transformacao), dtype=np.float32)
+        self._pilha[-1] = np.dot(matriz.T, self._pilha[-1])
+
+    def translate(self, x, y, z):
+        """Como glTranslatef."""
+        self.mult(translacao(x, y, z))
+
+    def rotate(self, angle_deg, x, y, z):
+        """Como glRotatef: ângulo em graus em torno do eixo (x, y, z)."""
+        self.mult(rotacao(np.radians(angle_deg), x, y, z))
+
+    def scale(self, sx, sy, sz):
+        """Como glScalef."""
+        self.mult(escala(sx, sy, sz))
+
+    def look_at(self, eye_x, eye_y, eye_z, center_x, center_y, center_z, up_x, up_y, up_z):
+        """Como gluLookAt."""
+        self.mult(look_at(eye_x, eye_y, eye_z, center_x, center_y, center_z, up_x, up_y, up_z))
+
+    def perspective(self, fovy_deg, aspect, near, far):
+        """Como gluPerspective."""
+        self.mult(perspectiva(fovy_deg, aspect, near, far))
+
+    def ortho(self, left, right, bottom, top, near, far):
+        """Como glOrtho."""
+        self.mult(ortografica(left, right, bottom, top, near, far))
+
+    def load_gl(self):
+        """Carrega o topo na matriz corrente do OpenGL (GL_MODELVIEW ou GL_PROJECTION)."""
+        glLoadMatrixf(self._pilha[-1])
+
+    def upload_uniform(self, location, projection=None):
+        """
+        Envia o topo (ou projection * topo, a MVP) para um uniform mat4 do shader.
+
+        A matriz já está em column-major: vai com GL_FALSE, sem transposição no driver.
+
+        Args:
+            location: Localização do uniform (glGetUniformLocation)
+            projection: Matriz 4x4 row-major (ou objeto com `.matrix`) multiplicada à esquerda
+        """
+        matriz = self._pilha[-1]
+        if projection is not None:
+            # (P * M)^T = M^T * P^T
+            projecao = np.asarray(getattr(projection, "matrix", projection), dtype=np.float32)
+            matriz = np.dot(matriz, projecao.T)
+        glUniformMatrix4fv(location, 1, GL_FALSE, matriz)
@@ -0,0 +1,219 @@
+"""
+Texto de HUD (informações 2D sobre a cena) desenhado com OpenGL em uma chamada.
+
+Com pygame no modo OPENGL, blit na superfície da tela não aparece: o texto
+precisa virar textura. Aqui cada caractere é rasterizado com pygame.font uma
+única vez, em um atlas (uma textura só com os glifos, em alfa). As linhas
+de texto viram quads com coordenadas nesse atlas, montados de novo só quando
+algum texto muda, e todas são desenhadas juntas com um glDrawArrays.
+
+Exemplo:
+    hud = TextoHUD(pygame.font.Font(None, 24))
+    while ...:
+        hud.escrever("modo", f"Modo: {modo}", 10, 10)       # barato se não mudou
+        hud.escrever("dica", "P: Alternar projeção", 10, 35, cor=(200, 200, 200))
+        hud.desenhar(largura, altura)
+"""
+import ctypes
+
+import numpy as np
+import pygame
+from OpenGL.GL import *
+
+_FLOATS_POR_VERTICE = 8  # x, y, u, v, r, g, b, a
+
+
+class AtlasGlifos:
+    """
+    Textura de alfa com os glifos já usados de uma fonte.
+
+    Os glifos são guardados em prateleiras (linhas de altura fixa); quando a
+    textura enche, a altura dobra e ela é enviada de novo.
+
+    Args:
+        fonte: pygame.font.Font
+        largura: Largura da textura em pixels
+    """
+
+    def __init__(self, fonte, largura=512):
+        self.fonte = fonte
+        self.altura_linha = max(fonte.get_linesize(), fonte.get_height())
+        self.pixels = np.zeros((max(64, self.altura_linha * 4), largura), dtype=np.uint8)
+        self.glifos = {}  # caractere -> (x, y, largura, altura) em pixels no atlas
+        self._proximo_x = 0
+        self._proximo_y = 0
+        self.versao = 0  # Muda quando a textura cresce (coordenadas u, v mudam)
+
+        self.textura = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, self.textura)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        self._enviar_tudo()
+
+    def _enviar_tudo(self):
+        glBindTexture(GL_TEXTURE_2D, self.textura)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        altura, largura = self.pixels.shape
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_ALPHA8, largura, altura, 0, GL_ALPHA, GL_UNSIGNED_BYTE, self.pixels)
+
+    def glifo(self, caractere):
+        """Retângulo (x, y, largura, altura) do caractere no atlas, rasterizado no primeiro uso."""
+        retangulo = self.glifos.get(caractere)
+        if retangulo is None:
+            retangulo = self.glifos[caractere] = self._adicionar(caractere)
+        return retangulo
+
+    def _adicionar(self, caractere):
+        superficie = self.fonte.render(caractere, True, (255, 255, 255))
+        alfa = pygame.surfarray.array_alpha(superficie).T  # (altura, largura)
+        altura, largura = alfa.shape
+
+        # Próxima posição livre na prateleira atual (1 pixel de folga entre glifos)
+        if self._proximo_x + largura > self.pixels.shape[1]:
+            self._proximo_x = 0
+            self._proximo_y += self.altura_linha + 1
+        if self._proximo_y + altura > self.pixels.shape[0]:
+            crescida = np.zeros((self.pixels.shape[0] * 2, self.pixels.shape[1]), dtype=np.uint8)
+            crescida[:self.pixels.shape[0]] = self.pixels
+            self.pixels = crescida
+            self._enviar_tudo()
+            self.versao += 1
+
+        x, y = self._proximo_x, self._proximo_y
+        self.pixels[y:y + altura, x:x + largura] = alfa
+        if largura and altura:
+            glBindTexture(GL_TEXTURE_2D, self.textura)
+            glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+            glTexSubImage2D(GL_TEXTURE_2D, 0, x, y, largura, altura, GL_ALPHA, GL_UNSIGNED_BYTE,
+                            np.ascontiguousarray(alfa))
+        self._proximo_x += largura + 1
+        return x, y, largura, altura
+
+
+class TextoHUD:
+    """
+    Linhas de texto em posições fixas da tela, desenhadas como um lote de quads.
+
+    Coordenadas em pixels com a origem no canto superior esquerdo (como no pygame).
+
+    Args:
+        fonte: pygame.font.Font usada por todas as linhas
+    """
+
+    def __init__(self, fonte):
+        self.atlas = AtlasGlifos(fonte)
+        self.linhas = {}  # chave -> (texto, x, y, cor)
+        self.total_vertices = 0
+        self._vbo = glGenBuffers(1)
+        self._alterado = False
+        self._versao_atlas = self.atlas.versao
+
+    def escrever(self, chave, texto, x, y, cor=(255, 255, 255)):
+        """
+        Define (ou atualiza) a linha `chave`; nada é refeito se ela não mudou.
+
+        Args:
+            cor: RGB (0-255), ou RGBA
+        """
+        linha = (texto, x, y, tuple(cor))
+        if self.linhas.get(chave) != linha:
+            self.linhas[chave] = linha
+            self._alterado = True
+
+    def remover(self, chave):
+        if self.linhas.pop(chave, None) is not None:
+            self._alterado = True
+
+    def _montar(self):
+        """Monta os quads de todas as linhas e envia para o VBO."""
+        atlas = self.atlas
+        vertices = []
+        for texto, x, y, cor in self.linhas.values():
+            r, g, b, a = (np.array((*cor, 255)[:4], dtype=np.float32) / 255.0).tolist()
+            cursor = float(x)
+            for caractere in texto:
+                gx, gy, largura, altura = atlas.glifo(caractere)
+                if largura and altura:
+                    vertices.append((cursor, y, gx, gy, largura, altura, r, g, b, a))
+                cursor += largura
+
+        # O atlas pode ter crescido enquanto os glifos eram adicionados: u, v no fim
+        altura_atlas, largura_atlas = atlas.pixels.shape
+        dados = np.empty((len(vertices), 4, _FLOATS_POR_VERTICE), dtype=np.float32)
+        if vertices:
+            q = np.array(vertices, dtype=np.float32)
+            x0, y0 = q[:, 0], q[:, 1]
+            x1, y1 = x0 + q[:, 4], y0 + q[:, 5]
+            u0, v0 = q[:, 2] / largura_atlas, q[:, 3] / altura_atlas
+            u1, v1 = (q[:, 2] + q[:, 4]) / largura_atlas, (q[:, 3] + q[:, 5]) / altura_atlas
+            for canto, (px, py, pu, pv) in enumerate(((x0, y0, u0, v0), (x1, y0, u1, v0),
+                                                      (x1, y1, u1, v1), (x0, y1, u0, v1))):
+                dados[:, canto, 0], dados[:, canto, 1] = px, py
+                dados[:, canto, 2], dados[:, canto, 3] = pu, pv
+                dados[:, canto, 4:] = q[:, 6:]
+
+        self.total_vertices = len(vertices) * 4
+        glBindBuffer(GL_ARRAY_BUFFER, self._vbo)
+        glBufferData(GL_ARRAY_BUFFER, dados.nbytes, dados, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self._alterado = False
+        self._versao_atlas = atlas.versao
+
+    def desenhar(self, largura, altura):
+        """
+        Desenha todas as linhas por cima da cena (uma chamada glDrawArrays).
+
+        As matrizes e o estado do OpenGL usados pela cena são preservados.
+
+        Args:
+            largura, altura: Tamanho da janela em pixels
+        """
+        if self._alterado or self._versao_atlas != self.atlas.versao:
+            self._montar()
+        if not self.total_vertices:
+            return
+
+        glPushAttrib(GL_ENABLE_BIT | GL_COLOR_BUFFER_BIT | GL_TEXTURE_BIT)
+        glMatrixMode(GL_PROJECTION)
+        glPushMatrix()
+        glLoadIdentity()
+        glOrtho(0, largura, altura, 0, -1, 1)
+        glMatrixMode(GL_MODELVIEW)
+        glPushMatrix()
+        glLoadIdentity()
+
+        glDisable(GL_DEPTH_TEST)
+        glDisable(GL_LIGHTING)
+        glEnable(GL_TEXTURE_2D)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        glBindTexture(GL_TEXTURE_2D, self.atlas.textura)
+        # GL_MODULATE: cor do vértice, alfa do vértice vezes o alfa do glifo
+        glTexEnvi(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_MODULATE)
+
+        passo = _FLOATS_POR_VERTICE * 4
+        glBindBuffer(GL_ARRAY_BUFFER, self._vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, passo, ctypes.c_void_p(0))
+        glTexCoordPointer(2, GL_FLOAT, passo, ctypes.c_void_p(2 * 4))
+        glColorPointer(4, GL_FLOAT, passo, ctypes.c_void_p(4 * 4))
+
+        glDrawArrays(GL_QUADS, 0, self.total_vertices)
+
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glBindTexture(GL_TEXTURE_2D, 0)
+
+        glPopMatrix()
+        glMatrixMode(GL_PROJECTION)
+        glPopMatrix()
+        glMatrixMode(GL_MODELVIEW)
+        glPopAttrib()
+
+    def liberar(self):
+        glDeleteBuffers(1, [self._vbo])
+        glDeleteTextures([self.atlas.textura])
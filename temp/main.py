@@ -1,26 +1,24 @@
 from OpenGL.GL import *
 from OpenGL.GLUT import *
 from OpenGL.GLU import *
+import ctypes
 import math
+import os
 import sys
 
-# Vértices/faces
-phi = (1.0 + math.sqrt(5.0)) / 2.0
+import numpy as np
 
-ICOSAHEDRON_VERTICES = [
-    [-1,  phi, 0], [ 1,  phi, 0], [-1, -phi, 0], [ 1, -phi, 0],
-    [0, -1,  phi], [0,  1,  phi], [0, -1, -phi], [0,  1, -phi],
-    [ phi, 0, -1], [ phi, 0,  1], [-phi, 0, -1], [-phi, 0,  1]
-]
+# Icosaedro e icosfera (icosaedro subdividido) e a pilha de matrizes ficam em comum/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "comum"))
+from malhas_parametricas import malha
+from pilha_matrizes import MatrixStack, perspectiva
 
-ICOSAHEDRON_FACES = [
-    (0, 11, 5), (0, 5, 1), (0, 1, 7), (0, 7, 10), (0, 10, 11),
-    (1, 5, 9), (5, 11, 4), (11, 10, 2), (10, 7, 6), (7, 1, 8),
-    (3, 9, 4), (3, 4, 2), (3, 2, 6), (3, 6, 8), (3, 8, 9),
-    (4, 9, 5), (2, 4, 11), (6, 2, 10), (8, 6, 7), (9, 8, 1)
-]
+# Mesmo tamanho do icosaedro de vértices (±1, ±phi, 0)
+phi = (1.0 + math.sqrt(5.0)) / 2.0
+ICOSPHERE_RADIUS = math.sqrt(1.0 + phi * phi)
+MAX_SUBDIVISION_LEVEL = 7  # nível 7: 327680 faces
 
-# Cores para diferenciar faces
+# Cores para diferenciar faces (das 20 faces do icosaedro original)
 FACE_COLORS = [
     (1,0,0),(0,1,0),(0,0,1),
     (1,1,0),(1,0,1),(0,1,1),
@@ -39,6 +37,16 @@ rotation_angle_y = 0.0
 rotation_angle_z = 0.0
 rotation_axis = 'y'
 
+# Subdivisão (0 = icosaedro) e wireframe
+subdivision_level = 0
+show_edges = True
+
+# Buffers de cada nível, montados uma vez: nível -> dict com VBOs e contagens
+icosphere_buffers = {}
+
+# Pilha de matrizes calculada na CPU (uma chamada ao OpenGL por objeto)
+pilha = MatrixStack()
+
 def draw_axes():
     """ Desenha os eixos X (vermelho), Y (verde) e Z (azul) """
     glLineWidth(2.0)
@@ -51,52 +59,94 @@ def draw_axes():
     glColor3f(0.0, 0.0, 1.0); glVertex3f(0.0, 0.0, 0.0); glVertex3f(0.0, 0.0, 2.0)
     glEnd()
 
+def build_icosphere_buffers(level):
+    """
+    Envia a icosfera do nível pedido para a GPU (uma vez por nível).
+
+    Faces: vértices repetidos por face (posição + cor), para cada face ter a
+    cor lisa da face do icosaedro de onde veio. Arestas: posições
+    compartilhadas + índices das arestas únicas.
+    """
+    icosphere = malha("icosfera", raio=ICOSPHERE_RADIUS, niveis=level)
+    triangles = icosphere.triangulos.reshape(-1, 3)
+
+    # A face i vem da face i // 4^nível do icosaedro
+    colors = np.asarray(FACE_COLORS, dtype=np.float32)
+    face_colors = colors[(np.arange(len(triangles)) // 4 ** level) % len(colors)]
+    faces = np.empty((len(triangles), 3, 6), dtype=np.float32)
+    faces[:, :, :3] = icosphere.posicoes[triangles]
+    faces[:, :, 3:] = face_colors[:, None, :]
+
+    face_vbo, position_vbo, edge_ibo = glGenBuffers(3)
+    glBindBuffer(GL_ARRAY_BUFFER, face_vbo)
+    glBufferData(GL_ARRAY_BUFFER, faces.nbytes, faces, GL_STATIC_DRAW)
+    glBindBuffer(GL_ARRAY_BUFFER, position_vbo)
+    glBufferData(GL_ARRAY_BUFFER, icosphere.posicoes.nbytes, icosphere.posicoes, GL_STATIC_DRAW)
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, edge_ibo)
+    glBufferData(GL_ELEMENT_ARRAY_BUFFER, icosphere.arestas.nbytes, icosphere.arestas, GL_STATIC_DRAW)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+    return {
+        "face_vbo": face_vbo, "face_vertices": 3 * len(triangles),
+        "position_vbo": position_vbo, "edge_ibo": edge_ibo, "edge_indices": icosphere.arestas.size,
+    }
+
 def draw_icosahedron():
-    v = ICOSAHEDRON_VERTICES
-    faces = ICOSAHEDRON_FACES
+    """Desenha a icosfera do nível atual: faces e arestas com uma chamada cada."""
+    buffers = icosphere_buffers.get(subdivision_level)
+    if buffers is None:
+        buffers = icosphere_buffers[subdivision_level] = build_icosphere_buffers(subdivision_level)
+
+    glEnableClientState(GL_VERTEX_ARRAY)
 
     # --- Faces preenchidas ---
-    glBegin(GL_TRIANGLES)
-    for i, (a, b, c) in enumerate(faces):
-        glColor3fv(FACE_COLORS[i % len(FACE_COLORS)])
-        glVertex3fv(v[a]); glVertex3fv(v[b]); glVertex3fv(v[c])
-    glEnd()
+    stride = 6 * 4  # x, y, z, r, g, b
+    glBindBuffer(GL_ARRAY_BUFFER, buffers["face_vbo"])
+    glEnableClientState(GL_COLOR_ARRAY)
+    glVertexPointer(3, GL_FLOAT, stride, ctypes.c_void_p(0))
+    glColorPointer(3, GL_FLOAT, stride, ctypes.c_void_p(3 * 4))
+    glDrawArrays(GL_TRIANGLES, 0, buffers["face_vertices"])
+    glDisableClientState(GL_COLOR_ARRAY)
 
     # --- Arestas (wireframe) ---
-    edge_set = set()
-    for a, b, c in faces:
-        edge_set.update({tuple(sorted((a,b))), tuple(sorted((b,c))), tuple(sorted((c,a)))})
-    glColor3f(0.0, 0.0, 0.0)
-    glLineWidth(1.5)
-    glBegin(GL_LINES)
-    for a, b in edge_set:
-        glVertex3fv(v[a]); glVertex3fv(v[b])
-    glEnd()
+    if show_edges:
+        glColor3f(0.0, 0.0, 0.0)
+        glLineWidth(1.5)
+        glBindBuffer(GL_ARRAY_BUFFER, buffers["position_vbo"])
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, buffers["edge_ibo"])
+        glVertexPointer(3, GL_FLOAT, 0, ctypes.c_void_p(0))
+        glDrawElements(GL_LINES, buffers["edge_indices"], GL_UNSIGNED_INT, None)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+    glDisableClientState(GL_VERTEX_ARRAY)
 
 def display():
     global rotation_angle_x, rotation_angle_y, rotation_angle_z
     glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-    glLoadIdentity()
-
     # Câmera
-    gluLookAt(5, 5, 5, 0, 0, 0, 0, 1, 0)
+    pilha.load_identity()
+    pilha.look_at(5, 5, 5, 0, 0, 0, 0, 1, 0)
+    pilha.load_gl()
 
     glDisable(GL_DEPTH_TEST)
     draw_axes()
     glEnable(GL_DEPTH_TEST)
 
-    glPushMatrix()
+    pilha.push()
 
     # Aplica rotações acumuladas
-    glRotatef(rotation_angle_x, 1.0, 0.0, 0.0)
-    glRotatef(rotation_angle_y, 0.0, 1.0, 0.0)
-    glRotatef(rotation_angle_z, 0.0, 0.0, 1.0)
+    pilha.rotate(rotation_angle_x, 1.0, 0.0, 0.0)
+    pilha.rotate(rotation_angle_y, 0.0, 1.0, 0.0)
+    pilha.rotate(rotation_angle_z, 0.0, 0.0, 1.0)
 
     # Um scale
-    glScalef(0.9, 0.9, 0.9)
+    pilha.scale(0.9, 0.9, 0.9)
+    pilha.load_gl()
 
     draw_icosahedron()
-    glPopMatrix()
+    pilha.pop()
 
     glutSwapBuffers()
 
@@ -104,8 +154,8 @@ def reshape(width, height):
     if height == 0:
         height = 1
     glViewport(0, 0, width, height)
-    glMatrixMode(GL_PROJECTION); glLoadIdentity()
-    gluPerspective(45.0, float(width) / float(height), 0.1, 50.0)
+    glMatrixMode(GL_PROJECTION)
+    glLoadTransposeMatrixf(perspectiva(45.0, float(width) / float(height), 0.1, 50.0))
     glMatrixMode(GL_MODELVIEW)
 
 def animate(value):
@@ -125,9 +175,11 @@ def keyboard(key, x, y):
     """Controles:
        x/y/z -> alterna eixo de rotação
        espaço -> cicla eixo
+       +/- -> mais/menos subdivisões da icosfera
+       w -> liga/desliga as arestas
        ESC -> sair
     """
-    global rotation_axis
+    global rotation_axis, subdivision_level, show_edges
     if key in (b'x', b'X'):
         rotation_axis = 'x'
     elif key in (b'y', b'Y'):
@@ -136,6 +188,12 @@ def keyboard(key, x, y):
         rotation_axis = 'z'
     elif key == b' ':
         rotation_axis = {'x':'y', 'y':'z', 'z':'x'}[rotation_axis]
+    elif key in (b'+', b'=', b'-', b'_'):
+        step = 1 if key in (b'+', b'=') else -1
+        subdivision_level = min(max(subdivision_level + step, 0), MAX_SUBDIVISION_LEVEL)
+        print(f"Subdivisão {subdivision_level}: {20 * 4 ** subdivision_level} faces")
+    elif key in (b'w', b'W'):
+        show_edges = not show_edges
     elif key == b'\x1b':  # ESC
         glutLeaveMainLoop()
 
@@ -0,0 +1,14 @@
+"""
+Os módulos testados ficam nas pastas das aulas e em comum/, como nos
+benchmarks. Rodar a partir da raiz do repositório:
+
+    python -m pytest -q tests
+"""
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+for pasta in ("comum", os.path.join("aula_02_0", "src"), os.path.join("aula_02_1", "src"),
+              os.path.join("aula_07_0", "src")):
+    sys.path.insert(0, os.path.join(RAIZ, pasta))
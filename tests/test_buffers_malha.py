@@ -0,0 +1,81 @@
+import os
+
+import numpy as np
+
+from buffers_malha import normais_das_faces, preparar_buffers
+from cache_malha import carregar_malha, pasta_cache
+from leitor_obj import ler_obj
+
+CUBO = """\
+v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0
+v 0 0 1
+v 1 0 1
+v 1 1 1
+v 0 1 1
+usemtl vermelho
+f 1 4 3 2
+f 5 6 7 8
+usemtl azul
+f 1 2 6 5
+f 2 3 7 6
+f 3 4 8 7
+f 4 1 5 8
+"""
+
+
+def _escrever(pasta, nome, texto):
+    caminho = os.path.join(pasta, nome)
+    with open(caminho, "w") as arquivo:
+        arquivo.write(texto)
+    return caminho
+
+
+def test_normais_das_faces():
+    posicoes = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=np.float32)
+    normais = normais_das_faces(posicoes, np.array([0, 1, 2, 3, 0, 3, 2]), np.array([4, 3]))
+    np.testing.assert_allclose(normais, [[0, 0, 1], [0, 0, -1]], atol=1e-6)
+
+
+def test_preparar_buffers_cubo(tmp_path):
+    buffers = preparar_buffers(ler_obj(_escrever(tmp_path, "cubo.obj", CUBO)))
+    # Sem vn, cada face tem a sua normal: 6 faces x 4 cantos vértices de desenho
+    assert buffers["vertices"].shape == (24, 6)
+    assert buffers["triangulos"].size == 6 * 2 * 3
+    assert buffers["arestas"].shape == (12, 2)
+    # Um grupo por material, cobrindo todo o buffer de triângulos em sequência
+    np.testing.assert_array_equal(buffers["grupos"], [[0, 0, 12], [1, 12, 24]])
+
+    # Todos os triângulos de uma face usam a normal dela, e ela aponta para fora
+    vertices = buffers["vertices"]
+    triangulos = buffers["triangulos"].reshape(-1, 3)
+    a, b, c = (vertices[triangulos[:, k], :3] for k in range(3))
+    normal_geometrica = np.cross(b - a, c - a)
+    normal_geometrica /= np.linalg.norm(normal_geometrica, axis=1, keepdims=True)
+    for k in range(3):
+        np.testing.assert_allclose(vertices[triangulos[:, k], 3:], normal_geometrica, atol=1e-6)
+    assert np.all(np.einsum("ij,ij->i", normal_geometrica, (a + b + c) / 3 - 0.5) > 0)
+
+
+def test_cache_ida_e_volta(tmp_path):
+    caminho = _escrever(tmp_path, "cubo.obj", CUBO)
+    malha, buffers = carregar_malha(caminho)
+    assert os.path.isdir(pasta_cache(caminho))
+
+    # Segunda leitura: memory-maps somente leitura com o mesmo conteúdo
+    malha_cache, buffers_cache = carregar_malha(caminho)
+    assert isinstance(malha_cache.posicoes, np.memmap)
+    assert not buffers_cache["vertices"].flags.writeable
+    for nome in ("posicoes", "indices_v", "tamanhos", "materiais_faces"):
+        np.testing.assert_array_equal(getattr(malha_cache, nome), getattr(malha, nome))
+    for nome, array in buffers.items():
+        np.testing.assert_array_equal(buffers_cache[nome], array)
+    assert malha_cache.nomes_materiais == ["vermelho", "azul"]
+
+    # Mudar o OBJ invalida o cache
+    _escrever(tmp_path, "cubo.obj", CUBO.replace("v 1 1 1", "v 1 1 2.5"))
+    malha_nova, _ = carregar_malha(caminho)
+    assert not isinstance(malha_nova.posicoes, np.memmap)
+    assert malha_nova.posicoes[6, 2] == 2.5
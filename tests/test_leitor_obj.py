@@ -0,0 +1,81 @@
+import os
+
+import numpy as np
+import pytest
+
+from benchmark_obj import gerar_obj, ler_obj_listas
+from leitor_obj import ler_obj
+
+
+def _obj(tmp_path, texto):
+    caminho = os.path.join(tmp_path, "modelo.obj")
+    with open(caminho, "w") as arquivo:
+        arquivo.write(texto)
+    return caminho
+
+
+@pytest.mark.parametrize("bytes_por_bloco", [64, 1000, 2**20])
+def test_igual_a_leitura_linha_a_linha(tmp_path, bytes_por_bloco):
+    caminho = os.path.join(tmp_path, "grade.obj")
+    gerar_obj(caminho, 12)
+    vertices, faces = ler_obj_listas(caminho)
+    malha = ler_obj(caminho, bytes_por_bloco=bytes_por_bloco)
+
+    np.testing.assert_allclose(malha.posicoes, vertices, rtol=1e-6)
+    # A última face usa índices negativos, que a leitura linha a linha não resolve
+    faces[-1] = [len(vertices) - 1, len(vertices) - 2, len(vertices) - 3]
+    assert malha.tamanhos.tolist() == [len(face) for face in faces]
+    assert malha.indices_v.tolist() == [i for face in faces for i in face]
+    assert malha.nomes_materiais == ["verde", "laranja"]
+    assert malha.mtllib == "sintetico.mtl"
+    assert len(malha.texcoords) == 12 * 12 and malha.indices_vn.max() == 0
+
+
+def test_formatos_de_face(tmp_path):
+    malha = ler_obj(_obj(tmp_path, """\
+v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0 1.0
+vt 0 0
+vt 1 0
+vt 1 1
+vn 0 0 1
+f 1 2 3
+f 1/1 2/2 3/3
+f 1//1 2//1 3//1
+f 1/1/1 2/2/1 3/3/1 4/3/1
+f 1/1 2//1 3
+"""))
+    assert malha.tamanhos.tolist() == [3, 3, 3, 4, 3]
+    assert malha.posicoes.shape == (4, 3)
+    assert malha.indices_vt.tolist() == [-1, -1, -1, 0, 1, 2, -1, -1, -1, 0, 1, 2, 2, 0, -1, -1]
+    assert malha.indices_vn.tolist() == [-1, -1, -1, -1, -1, -1, 0, 0, 0, 0, 0, 0, 0, -1, 0, -1]
+
+
+def test_indices_negativos_e_invalidos(tmp_path):
+    malha = ler_obj(_obj(tmp_path, """\
+v 0 0 0
+v 1 0 0
+v 1 1 0
+f -3 -2 -1
+v 0 1 0
+f -4 -2 -1
+f 1 2 9
+"""))
+    # A última face perde o índice 9 e fica com 2 vértices: é descartada
+    assert malha.tamanhos.tolist() == [3, 3]
+    assert malha.indices_v.tolist() == [0, 1, 2, 0, 2, 3]
+
+
+@pytest.mark.parametrize("texto", [
+    "v 0 0 0\nv 1 x 0\nv 0 1 0\n",      # valor que não é número
+    "v 0 0 0\nv 1 0\nv 0 1 0 0\n",      # componente a menos (e a mais, que compensaria na contagem)
+    "v 0 0 0\nv 1 0\n",
+    "vt 0.5 abc\n",
+    "v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 x\n",
+    "v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1/1/1 2/a/1 3/1/1\n",
+])
+def test_valores_invalidos_geram_erro(tmp_path, texto):
+    with pytest.raises(ValueError, match="Linha inválida"):
+        ler_obj(_obj(tmp_path, texto))
@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+
+import malhas_parametricas
+from malhas_parametricas import MalhaLOD, cilindro, cone, esfera, grade, icosfera, malha, toro
+
+
+def _triangulos(m):
+    return m.triangulos.reshape(-1, 3)
+
+
+def _normais_das_faces(m):
+    a, b, c = (m.posicoes[_triangulos(m)[:, k]].astype(np.float64) for k in range(3))
+    return np.cross(b - a, c - a)
+
+
+def _verificar(m, fechada=True):
+    tri = _triangulos(m)
+    assert tri.max() < len(m.posicoes) and m.arestas.max() < len(m.posicoes)
+    # Sem triângulos degenerados (índices repetidos ou área nula)
+    assert np.all((tri[:, 0] != tri[:, 1]) & (tri[:, 1] != tri[:, 2]) & (tri[:, 0] != tri[:, 2]))
+    assert np.all(np.linalg.norm(_normais_das_faces(m), axis=1) > 1e-9)
+    np.testing.assert_allclose(np.linalg.norm(m.normais, axis=1), 1.0, atol=1e-5)
+    if fechada:
+        # Sentido anti-horário visto de fora: a normal da face concorda com as dos vértices
+        media = m.normais[tri].astype(np.float64).sum(axis=1)
+        assert np.all(np.einsum("ij,ij->i", _normais_das_faces(m), media) > 0)
+
+
+@pytest.mark.parametrize("gerar, contagem", [
+    (lambda: cilindro(segmentos=16), (66, 64, 48)),
+    (lambda: cilindro(segmentos=16, tampas=False), (32, 32, 48)),
+    (lambda: cone(segmentos=16), (49, 32, 32)),
+    (lambda: esfera(meridianos=32), (544, 960, 992)),
+    (lambda: toro(segmentos=32), (512, 1024, 1024)),
+])
+def test_formas_fechadas(gerar, contagem):
+    m = gerar()
+    assert (len(m.posicoes), len(m.triangulos) // 3, len(m.arestas)) == contagem
+    _verificar(m)
+
+
+def test_grade():
+    m = grade(divisoes=10)
+    assert (len(m.posicoes), len(m.triangulos) // 3, len(m.arestas)) == (121, 200, 220)
+    _verificar(m, fechada=False)
+    assert np.all(m.posicoes[:, 1] == 0.0)
+    assert np.all(_normais_das_faces(m)[:, 1] > 0)
+
+
+def test_esfera_no_raio():
+    m = esfera(raio=2.5, meridianos=12)
+    np.testing.assert_allclose(np.linalg.norm(m.posicoes, axis=1), 2.5, rtol=1e-5)
+    np.testing.assert_allclose(m.normais, m.posicoes / 2.5, atol=1e-5)
+
+
+def test_cache_compartilhado_e_somente_leitura():
+    malhas_parametricas.limpar_cache()
+    a = malha("esfera", raio=1.0, meridianos=8)
+    assert malha("esfera", meridianos=8, raio=1.0) is a
+    with pytest.raises(ValueError):
+        a.posicoes[0, 0] = 5.0
+    with pytest.raises(ValueError):
+        malha("dodecaedro")
+
+
+def test_lod_por_distancia():
+    lod = MalhaLOD("esfera", niveis=(8, 32, 16), distancia_base=5.0)
+    assert [len(v.posicoes) for v in lod.variantes] == sorted((len(v.posicoes) for v in lod.variantes), reverse=True)
+    assert lod.indice(1.0) == 0
+    assert lod.indice(7.0) == 1
+    assert lod.indice(1000.0) == 2
+
+
+def _icosfera_com_dicionario(niveis):
+    """Subdivisão face a face, com um dicionário aresta -> ponto médio."""
+    posicoes = [p / np.linalg.norm(p) for p in malhas_parametricas.ICOSAEDRO_VERTICES]
+    faces = malhas_parametricas.ICOSAEDRO_FACES.tolist()
+    for _ in range(niveis):
+        meios = {}
+
+        def meio(i, j):
+            chave = (min(i, j), max(i, j))
+            if chave not in meios:
+                p = posicoes[i] + posicoes[j]
+                posicoes.append(p / np.linalg.norm(p))
+                meios[chave] = len(posicoes) - 1
+            return meios[chave]
+
+        novas = []
+        for a, b, c in faces:
+            ab, bc, ca = meio(a, b), meio(b, c), meio(c, a)
+            novas += [[a, ab, ca], [b, bc, ab], [c, ca, bc], [ab, bc, ca]]
+        faces = novas
+    return np.array(posicoes), np.array(faces)
+
+
+@pytest.mark.parametrize("niveis", [0, 1, 2, 3])
+def test_icosfera(niveis):
+    m = icosfera(raio=2.0, niveis=niveis)
+    assert (len(m.posicoes), len(m.triangulos) // 3, len(m.arestas)) == (
+        10 * 4**niveis + 2, 20 * 4**niveis, 30 * 4**niveis)
+    _verificar(m)
+    np.testing.assert_allclose(np.linalg.norm(m.posicoes, axis=1), 2.0, rtol=1e-6)
+    assert len(np.unique(np.round(m.posicoes, 5), axis=0)) == len(m.posicoes)
+
+    # Mesmos vértices e triângulos da subdivisão com dicionário (a numeração
+    # dos pontos médios pode ser outra: os vértices são casados pela posição)
+    posicoes, faces = _icosfera_com_dicionario(niveis)
+    correspondente = np.argmax(m.posicoes @ posicoes.T, axis=1)
+    np.testing.assert_allclose(m.posicoes, 2.0 * posicoes[correspondente], atol=1e-5)
+    triangulos = {tuple(np.roll(t, -np.argmin(t))) for t in correspondente[_triangulos(m)]}
+    assert triangulos == {tuple(np.roll(f, -np.argmin(f))) for f in faces}
+
+
+def test_icosfera_filhas_juntas():
+    niveis = 2
+    m = icosfera(niveis=niveis)
+    centros_filhas = m.posicoes[_triangulos(m)].mean(axis=1)
+    icosaedro = malhas_parametricas.ICOSAEDRO_VERTICES
+    centros_originais = icosaedro[malhas_parametricas.ICOSAEDRO_FACES].mean(axis=1)
+    mais_proxima = np.argmax(centros_filhas @ centros_originais.T, axis=1)
+    np.testing.assert_array_equal(mais_proxima, np.arange(len(centros_filhas)) // 4**niveis)
+
+
+def test_icosfera_nivel_zero_e_o_icosaedro():
+    icosaedro = malhas_parametricas.ICOSAEDRO_VERTICES
+    m = malha("icosfera", raio=float(np.linalg.norm(icosaedro[0])), niveis=0)
+    np.testing.assert_allclose(m.posicoes, icosaedro, atol=1e-5)
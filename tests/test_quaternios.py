@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+import quaternios
+from quaternios import (acumular_rotacao, multiplicar_quat, nlerp, quat_para_matriz,
+                        quaternio_de_eixo_angulo, renormalizar, slerp)
+from transformacoes_matriciais import TransformationMatrix
+
+
+def _hamilton(a, b):
+    """Produto de Hamilton de um par, componente a componente."""
+    w1, x1, y1, z1 = a
+    w2, x2, y2, z2 = b
+    return np.array([w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+                     w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+                     w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+                     w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2])
+
+
+def _aleatorios(n, semente=0):
+    rng = np.random.default_rng(semente)
+    return quaternio_de_eixo_angulo(rng.normal(size=(n, 3)), rng.uniform(-np.pi, np.pi, n))
+
+
+def test_multiplicar_lote_igual_ao_escalar():
+    a, b = _aleatorios(20, 1), _aleatorios(20, 2)
+    esperado = np.array([_hamilton(p, q) for p, q in zip(a, b)])
+    np.testing.assert_allclose(multiplicar_quat(a, b), esperado, atol=1e-12)
+    # Um quatérnio contra o lote, e resultado escrito no próprio operando
+    np.testing.assert_allclose(multiplicar_quat(a[0], b), [_hamilton(a[0], q) for q in b], atol=1e-12)
+    multiplicar_quat(a, b, out=b)
+    np.testing.assert_allclose(b, esperado, atol=1e-12)
+
+
+def test_quat_para_matriz_igual_a_rotacao():
+    eixos = np.array([[1.0, 0.0, 0.0], [0.3, -1.0, 2.0], [1.0, 1.0, 1.0]])
+    angulos = np.array([0.4, -1.2, 2.5])
+    matrizes = quat_para_matriz(quaternio_de_eixo_angulo(eixos, angulos))
+    for matriz, eixo, angulo in zip(matrizes, eixos, angulos):
+        np.testing.assert_allclose(matriz, TransformationMatrix.rotation(angulo, *eixo).matrix, atol=1e-6)
+
+
+def test_renormalizar():
+    q = np.array([[2.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0], [1.0, 1.0, 1.0, 1.0]])
+    esperado = [[1.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0], [0.5, 0.5, 0.5, 0.5]]
+    np.testing.assert_allclose(renormalizar(q), esperado)
+    # Linhas nulas ficam nulas também num `out` com lixo
+    out = np.full_like(q, np.nan)
+    np.testing.assert_allclose(renormalizar(q, out=out), esperado)
+    assert renormalizar(q, out=q) is q
+    np.testing.assert_allclose(q, esperado)
+
+
+def test_acumular_rotacao_renormaliza():
+    delta = quaternio_de_eixo_angulo([0.0, 0.0, 1.0], 0.01) * (1 + 1e-6)  # com erro na norma
+    orientacao = np.array([1.0, 0.0, 0.0, 0.0])
+    passos = 0
+    for i in range(1, quaternios.PASSOS_RENORMALIZACAO + 1):
+        passos = acumular_rotacao(delta, orientacao, passos)
+        assert passos == i % quaternios.PASSOS_RENORMALIZACAO
+    assert np.linalg.norm(orientacao) == pytest.approx(1.0, abs=1e-12)
+
+
+def test_slerp_velocidade_constante():
+    q1 = quaternio_de_eixo_angulo([0.0, 1.0, 0.0], 0.0)
+    q2 = quaternio_de_eixo_angulo([0.0, 1.0, 0.0], 2.0)
+    t = np.linspace(0.0, 1.0, 11)
+    esperado = quaternio_de_eixo_angulo(np.tile([0.0, 1.0, 0.0], (11, 1)), 2.0 * t)
+    np.testing.assert_allclose(slerp(q1, q2, t), esperado, atol=1e-12)
+
+
+def test_slerp_e_nlerp_em_lote():
+    a, b = _aleatorios(30, 3), _aleatorios(30, 4)
+    t = np.random.default_rng(5).random(30)
+    for interpolar in (slerp, nlerp):
+        lote = interpolar(a, b, t)
+        np.testing.assert_allclose(np.linalg.norm(lote, axis=1), 1.0, atol=1e-12)
+        np.testing.assert_allclose(lote, [interpolar(p, q, s) for p, q, s in zip(a, b, t)], atol=1e-12)
+        # Extremos (a menos do sinal: q e -q são a mesma rotação)
+        np.testing.assert_allclose(interpolar(a, b, np.zeros(30)), a, atol=1e-12)
+        fim = interpolar(a, b, np.ones(30))
+        np.testing.assert_allclose(np.abs(np.sum(fim * b, axis=1)), 1.0, atol=1e-12)
+
+
+def test_slerp_caminho_mais_curto_e_quase_iguais():
+    q = _aleatorios(1)[0]
+    # -q é a mesma rotação: o resultado não deve passar pelo outro lado
+    np.testing.assert_allclose(slerp(q, -q, 0.5), q, atol=1e-12)
+    quase = renormalizar(q + 1e-9)
+    assert np.all(np.isfinite(slerp(q, quase, 0.3)))
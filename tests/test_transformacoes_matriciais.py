@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+import transformacoes_matriciais
+from transformacoes_matriciais import TransformationMatrix
+
+
+def test_fabrica_memorizada_aceita_arrays():
+    angulo = 0.5
+    esperada = TransformationMatrix.rotation_z(angulo).matrix
+    # Arrays (inclusive de dimensão 0) não são hasheáveis: vão direto para a fábrica
+    for valor in (np.array(angulo), np.float32(angulo), np.array([angulo])[0]):
+        np.testing.assert_allclose(TransformationMatrix.rotation_z(valor).matrix, esperada, atol=1e-6)
+    np.testing.assert_allclose(TransformationMatrix.translation(np.array(1.0), 2, 3).matrix[:3, 3], [1, 2, 3])
+
+
+def test_fabrica_memorizada_nao_guarda_arrays():
+    TransformationMatrix.rotation_x.cache_clear()
+    TransformationMatrix.rotation_x(np.array(0.25))
+    assert TransformationMatrix.rotation_x.cache_info().currsize == 0
+    TransformationMatrix.rotation_x(0.25)
+    TransformationMatrix.rotation_x(0.25)
+    info = TransformationMatrix.rotation_x.cache_info()
+    assert (info.currsize, info.hits) == (1, 1)
+
+
+def test_matriz_memorizada_nao_e_compartilhada():
+    a = TransformationMatrix.translation(1.0, 2.0, 3.0)
+    a.matrix[0, 3] = 10.0
+    assert TransformationMatrix.translation(1.0, 2.0, 3.0).matrix[0, 3] == 1.0
+
+
+def test_cadeia_limitada():
+    passo = TransformationMatrix.rotation_y(0.1)
+    acumulada = TransformationMatrix()
+    for _ in range(100):
+        acumulada = acumulada * passo
+        assert acumulada._cadeia is None or len(acumulada._cadeia) <= transformacoes_matriciais.MAX_CADEIA
+    np.testing.assert_allclose(acumulada.matrix, TransformationMatrix.rotation_y(10.0).matrix, atol=1e-4)
+
+
+def test_cadeia_igual_ao_produto():
+    t = TransformationMatrix.translation(1.0, -2.0, 0.5)
+    r = TransformationMatrix.rotation(0.3, 1.0, 1.0, 0.0)
+    s = TransformationMatrix.scale(2.0, 1.0, 0.5)
+    esperada = t.matrix @ r.matrix @ s.matrix
+    np.testing.assert_allclose((t * r * s).matrix, esperada, rtol=1e-6, atol=1e-6)
+
+
+@pytest.mark.parametrize("transformacao", [
+    TransformationMatrix.translation(1.0, 2.0, 3.0) * TransformationMatrix.rotation(0.7, 1.0, 2.0, 0.5),
+    TransformationMatrix.perspective(60.0, 1.5, 0.1, 100.0) * TransformationMatrix.translation(0.0, 0.0, -5.0),
+])
+def test_transform_points_igual_ao_escalar(transformacao):
+    pontos = np.random.default_rng(0).random((50, 3)) * 4 - 2
+    esperados = np.array([transformacao.transform_point(p) for p in pontos])
+    np.testing.assert_allclose(transformacao.transform_points(pontos), esperados, rtol=1e-5, atol=1e-5)
+
+    # `out` pode ser o próprio array de entrada
+    no_lugar = pontos.copy()
+    assert transformacao.transform_points(no_lugar, out=no_lugar) is no_lugar
+    np.testing.assert_allclose(no_lugar, esperados, rtol=1e-5, atol=1e-5)
+
+
+def test_transform_points_formato_invalido():
+    with pytest.raises(ValueError):
+        TransformationMatrix().transform_points(np.zeros((4, 4)))
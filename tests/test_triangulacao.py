@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from triangulacao import arestas_das_faces, faces_para_arrays, triangular_faces, triangular_orelhas
+
+# Polígonos côncavos no plano XY, no sentido anti-horário
+POLIGONOS = {
+    "L": [(0, 0), (2, 0), (2, 1), (1, 1), (1, 3), (0, 3)],
+    "seta": [(0, 0), (4, 2), (0, 4), (1, 2)],
+    "estrela": [(np.cos(a) * r, np.sin(a) * r)
+                for a, r in zip(np.linspace(0, 2 * np.pi, 10, endpoint=False), [2, 0.8] * 5)],
+    "pente": [(0, 0), (5, 0), (5, 3), (4, 3), (4, 1), (3, 1), (3, 3), (2, 3), (2, 1), (1, 1), (1, 3), (0, 3)],
+}
+
+
+def _no_espaco(pontos_2d, rotacao, sentido):
+    """Põe o polígono em 3D num plano qualquer (e, se sentido < 0, com a ordem invertida)."""
+    pontos = np.column_stack([np.asarray(pontos_2d, dtype=np.float64), np.zeros(len(pontos_2d))])
+    pontos = pontos @ rotacao.T
+    return pontos[::sentido]
+
+
+def _area_vetorial(pontos):
+    return 0.5 * np.cross(pontos, np.roll(pontos, -1, axis=0)).sum(axis=0)
+
+
+ROTACOES = [np.eye(3), np.array([[1, 0, 0], [0, 0, -1], [0, 1, 0]]), np.array([[0, 0, 1], [1, 0, 0], [0, 1, 0]]),
+            np.linalg.qr(np.random.default_rng(0).normal(size=(3, 3)))[0]]
+
+
+@pytest.mark.parametrize("nome", POLIGONOS)
+@pytest.mark.parametrize("rotacao", ROTACOES)
+@pytest.mark.parametrize("sentido", [1, -1])
+def test_corte_de_orelhas(nome, rotacao, sentido):
+    pontos = _no_espaco(POLIGONOS[nome], rotacao, sentido)
+    face = list(range(100, 100 + len(pontos)))
+    triangulos = triangular_orelhas(face, pontos)
+
+    assert len(triangulos) == len(pontos) - 2
+    normal = _area_vetorial(pontos)
+    soma = 0.0
+    for triangulo in triangulos:
+        a, b, c = (pontos[i - 100] for i in triangulo)
+        area = 0.5 * np.cross(b - a, c - a)
+        # Mesmo sentido do polígono e sem triângulos degenerados
+        assert np.dot(area, normal) > 1e-9
+        soma += np.linalg.norm(area)
+    # Sem sobreposição nem buracos: as áreas somam a do polígono
+    assert soma == pytest.approx(np.linalg.norm(normal))
+
+
+def test_triangular_faces_misturadas():
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0], [2, 1, 0],
+                         *[(x, y, 1.0) for x, y in POLIGONOS["L"]]], dtype=np.float64)
+    faces = [[0, 1, 2], [0, 1, 2, 3], [1, 4, 5, 2], list(range(6, 12)), [0, 1]]
+    indices, tamanhos = faces_para_arrays(faces)
+    triangulos = triangular_faces(vertices, indices, tamanhos).reshape(-1, 3)
+    # Faces com menos de 3 vértices são ignoradas
+    assert len(triangulos) == 1 + 2 + 2 + 4
+    areas = 0.5 * np.linalg.norm(np.cross(vertices[triangulos[:, 1]] - vertices[triangulos[:, 0]],
+                                          vertices[triangulos[:, 2]] - vertices[triangulos[:, 0]]), axis=1)
+    assert areas.sum() == pytest.approx(0.5 + 1 + 1 + 4)
+
+
+def test_arestas_igual_ao_conjunto():
+    rng = np.random.default_rng(1)
+    faces = [rng.choice(50, size=k, replace=False).tolist() for k in rng.integers(3, 7, size=200)]
+    esperadas = sorted({(min(a, b), max(a, b)) for face in faces for a, b in zip(face, face[1:] + face[:1])})
+    indices, tamanhos = faces_para_arrays(faces)
+    assert arestas_das_faces(indices, tamanhos).tolist() == [list(aresta) for aresta in esperadas]
+    assert arestas_das_faces(np.empty(0), np.empty(0)).shape == (0, 2)